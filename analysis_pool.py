@@ -0,0 +1,102 @@
+"""
+분석 작업 프로세스 풀
+
+다이버전스 감지(RSI 계산 포함)를 워커 프로세스에서 실행합니다. 워커에는 DataFrame이 아닌
+캔들 컬럼 배열만 보내고, 메시지 대신 구조화된 결과(dict)를 돌려받아 메인 루프에서 알림을 만듭니다.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, List, Optional
+
+from indicators import (
+    closed_count, immediate_divergence, lookback_divergence, recent_pivot_divergences, rsi_series
+)
+
+logger = logging.getLogger(__name__)
+
+
+def analyze_divergences(task: Dict) -> Dict:
+    """한 (종목, timeframe)의 다이버전스를 캔들 배열로 감지합니다.
+
+    task['windows']에 있는 감지기만 실행하며, 각 감지기는 배열의 마지막 window개 캔들을 사용합니다.
+    RSI는 task['rsi']가 있으면 그대로 쓰고, 없으면 받은 배열 전체로 한 번만 계산해 모든 감지기가 공유합니다.
+    """
+    windows = task['windows']
+    close = task['close']
+    rsi = task.get('rsi')
+    if rsi is None:
+        rsi = rsi_series(close, task['rsi_period'])
+
+    results = {}
+    if 'immediate' in windows:
+        n = windows['immediate']
+        results['immediate'] = immediate_divergence(close[-n:], task['rsi_period'], rsi[-n:])
+    if 'lookback' in windows:
+        n = windows['lookback']
+        # 마감된 캔들만 비교 (진행 중인 캔들은 제외)
+        closed = closed_count(task['timestamp'][-n:], task['timeframe'], task.get('now'))
+        results['lookback'] = lookback_divergence(close[-n:][:closed], task['rsi_period'], task['lookback_periods'],
+                                                  rsi[-n:][:closed])
+    if 'pivot' in windows:
+        n = windows['pivot']
+        results['pivot'] = recent_pivot_divergences(
+            task['timestamp'][-n:], close[-n:], task['low'][-n:], task['high'][-n:],
+            task['timeframe'], task['rsi_period'], task['left_bars'], task['right_bars'],
+            task['lookback_range'], task['recent_bars'], task['include_hidden'], task.get('now'), rsi[-n:]
+        )
+    return results
+
+
+def analyze_divergences_many(tasks: List[Dict]) -> List[Dict]:
+    """여러 작업을 한 번에 처리합니다 (프로세스 간 왕복을 종목당 한 번으로 줄임)."""
+    return [analyze_divergences(task) for task in tasks]
+
+
+class AnalysisPool:
+    """CPU 작업을 ProcessPoolExecutor에서 실행하는 분석 백엔드
+
+    워커 프로세스는 처음 사용할 때 만들며, 기본 크기는 CPU 수입니다.
+    이벤트 루프를 가진 부모 프로세스를 fork하지 않도록 spawn 방식으로 시작합니다.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+            logger.info(f"분석 프로세스 풀 시작: 워커 {self.max_workers}개")
+        return self._executor
+
+    async def run(self, fn: Callable, *args):
+        """fn(*args)를 워커 프로세스에서 실행하고 결과를 기다립니다."""
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self.executor, fn, *args)
+        except BrokenProcessPool:
+            # 워커가 비정상 종료되면 다음 호출에서 풀을 새로 만듦
+            logger.error("분석 프로세스 풀이 중단되어 다시 시작합니다.")
+            # 이벤트 루프를 막지 않도록 종료를 기다리지 않음
+            self.close(wait=False)
+            raise
+
+    def close(self, wait: bool = True):
+        """워커 프로세스를 종료합니다 (대기 중인 작업은 취소)."""
+        if self._executor is not None:
+            if sys.version_info >= (3, 9):
+                self._executor.shutdown(wait=wait, cancel_futures=True)
+            else:
+                # Python 3.8에는 cancel_futures가 없어 대기 중인 작업까지 실행한 뒤 종료됨
+                self._executor.shutdown(wait=wait)
+            self._executor = None
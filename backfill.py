@@ -0,0 +1,114 @@
+import asyncio
+import logging
+import os
+import time
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from candle_archive import CandleArchive
+from candles import CandleArrays, decode_klines
+from market_data import AsyncMarketDataClient, INTERVAL_MS, MAX_KLINES_PER_REQUEST
+
+logger = logging.getLogger(__name__)
+
+# (symbol, interval, 저장한 캔들 수, 남은 구간 수)
+ProgressCallback = Callable[[str, str, int, int], None]
+
+
+class CandleBackfiller:
+    """과거 캔들을 startTime/endTime 구간으로 나눠 병렬 조회하고 CandleArchive에 기록합니다.
+
+    구간은 오래된 순서로 concurrency개씩 동시에 요청하고, 묶음이 끝날 때마다 순서대로
+    아카이브에 이어 씁니다. 중단되어도 아카이브의 마지막 캔들부터 다시 시작합니다.
+    backfill_many는 (symbol, interval) 시리즈를 series_concurrency개까지 동시에 채웁니다.
+
+    아카이브에 이미 최근 캔들(모니터가 기록한 데이터)이 있어 그보다 과거 구간을 채워야 하면,
+    별도 staging 시리즈에 이어 쓴 뒤 다 받으면 한 번에 병합합니다.
+    요청 가중치는 클라이언트의 limiter가 관리하므로 한도에 가까워지면 자동으로 속도를 늦춥니다.
+    """
+
+    STAGING_DIR = ".backfill"
+
+    def __init__(self, market_data: AsyncMarketDataClient, archive: CandleArchive,
+                 concurrency: int = 4, page_size: int = MAX_KLINES_PER_REQUEST,
+                 on_progress: Optional[ProgressCallback] = None, series_concurrency: int = 4):
+        self.market_data = market_data
+        self.archive = archive
+        self.concurrency = max(1, concurrency)
+        self.series_concurrency = max(1, series_concurrency)
+        self.page_size = min(page_size, MAX_KLINES_PER_REQUEST)
+        self.on_progress = on_progress
+        self.staging = CandleArchive(os.path.join(archive.base_root, self.STAGING_DIR),
+                                     archive.market_type, max_rows=None)
+
+    def _windows(self, interval: str, start_ms: int, end_ms: int) -> List[Tuple[int, int]]:
+        """[start_ms, end_ms) 구간을 요청 한 번에 받을 수 있는 크기로 나눕니다."""
+        step = INTERVAL_MS[interval]
+        span = step * self.page_size
+        first = -(-start_ms // step) * step
+        return [(s, min(s + span, end_ms) - 1) for s in range(first, end_ms, span)]
+
+    async def _fetch_window(self, symbol: str, interval: str, window: Tuple[int, int]) -> CandleArrays:
+        rows = await self.market_data.get_klines(
+            symbol=symbol, interval=interval, limit=self.page_size,
+            start_time=window[0], end_time=window[1]
+        )
+        return decode_klines(rows) if rows else CandleArrays.empty()
+
+    async def _fill(self, target: CandleArchive, symbol: str, interval: str,
+                    start_ms: int, end_ms: int) -> int:
+        """target 시리즈 끝에서부터 end_ms 전까지 이어 씁니다."""
+        last = target.last_timestamp(symbol, interval)
+        if last is not None:
+            start_ms = max(start_ms, (last * 1000) + INTERVAL_MS[interval])
+        windows = self._windows(interval, start_ms, end_ms)
+
+        written = 0
+        for i in range(0, len(windows), self.concurrency):
+            batch = windows[i:i + self.concurrency]
+            pages = await asyncio.gather(*[self._fetch_window(symbol, interval, w) for w in batch])
+            for page in pages:
+                written += target.append(symbol, interval, page)
+            if self.on_progress:
+                self.on_progress(symbol, interval, written, len(windows) - i - len(batch))
+        return written
+
+    async def backfill(self, symbol: str, interval: str, start_ms: int,
+                       end_ms: Optional[int] = None) -> int:
+        """[start_ms, end_ms) 구간의 마감 캔들을 채우고 새로 저장한 캔들 수를 반환합니다."""
+        step = INTERVAL_MS[interval]
+        now_ms = int(time.time() * 1000)
+        # 마감된 캔들만 기록 (진행 중인 캔들 제외)
+        closed_end = (now_ms // step) * step
+        end_ms = closed_end if end_ms is None else min(end_ms, closed_end)
+        if start_ms >= end_ms:
+            return 0
+
+        written = 0
+        first = self.archive.first_timestamp(symbol, interval)
+        if first is not None and start_ms < first * 1000:
+            # 저장된 데이터보다 과거 구간: staging에 모은 뒤 병합
+            await self._fill(self.staging, symbol, interval, start_ms, min(end_ms, first * 1000))
+            history = self.staging.load(symbol, interval)
+            if history is not None:
+                written += self.archive.merge(symbol, interval, history)
+            self.staging.remove(symbol, interval)
+
+        written += await self._fill(self.archive, symbol, interval, start_ms, end_ms)
+        return written
+
+    async def backfill_many(self, symbols: Iterable[str], intervals: Iterable[str],
+                            start_ms: int, end_ms: Optional[int] = None) -> int:
+        """여러 (symbol, interval) 시리즈를 series_concurrency개씩 동시에 채웁니다. 실패한 시리즈는 건너뜁니다."""
+        semaphore = asyncio.Semaphore(self.series_concurrency)
+        intervals = list(intervals)
+
+        async def fill(symbol: str, interval: str) -> int:
+            async with semaphore:
+                try:
+                    return await self.backfill(symbol, interval, start_ms, end_ms)
+                except Exception as e:
+                    logger.error(f"{symbol} {interval} 과거 캔들 채우기 오류: {e}")
+                    return 0
+
+        written = await asyncio.gather(*[fill(symbol, interval) for symbol in symbols for interval in intervals])
+        return sum(written)
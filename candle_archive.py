@@ -0,0 +1,206 @@
+import logging
+import os
+import shutil
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from candles import CandleArrays, PRICE_COLUMNS
+
+logger = logging.getLogger(__name__)
+
+
+class CandleArchive:
+    """마감된 캔들을 (market_type, symbol, interval)별로 디스크에 보관하는 컬럼 저장소
+
+    시리즈마다 디렉터리 하나를 두고 컬럼별 리틀 엔디언 바이너리 파일
+    (timestamp는 int64, 가격/거래량은 float64)에 이어 쓰기만 합니다.
+    읽을 때는 np.memmap으로 매핑해 필요한 최근 구간만 메모리로 가져옵니다.
+
+    timestamp 파일을 가장 마지막에 쓰므로, 쓰는 도중 종료되어도
+    다음 접근 때 모든 컬럼을 가장 짧은 길이로 잘라 일관성을 복구합니다.
+    """
+
+    COLUMNS = ('timestamp',) + PRICE_COLUMNS
+    ITEM_SIZE = 8
+
+    def __init__(self, root: str, market_type: str = 'spot', max_rows: Optional[int] = 200_000):
+        self.base_root = root
+        self.market_type = market_type
+        self.root = os.path.join(root, market_type)
+        self.max_rows = max_rows
+        self._last_timestamp: Dict[Tuple[str, str], Optional[int]] = {}
+
+    def _series_dir(self, symbol: str, interval: str) -> str:
+        return os.path.join(self.root, f"{symbol}_{interval}")
+
+    def _column_path(self, series_dir: str, column: str) -> str:
+        return os.path.join(series_dir, f"{column}.bin")
+
+    @staticmethod
+    def _dtype(column: str) -> str:
+        return '<i8' if column == 'timestamp' else '<f8'
+
+    def _length(self, series_dir: str) -> int:
+        sizes = []
+        for column in self.COLUMNS:
+            path = self._column_path(series_dir, column)
+            sizes.append(os.path.getsize(path) if os.path.exists(path) else 0)
+        return min(sizes) // self.ITEM_SIZE
+
+    def _repair(self, series_dir: str) -> int:
+        """컬럼 길이가 다르면 가장 짧은 길이로 잘라냅니다."""
+        length = self._length(series_dir)
+        for column in self.COLUMNS:
+            path = self._column_path(series_dir, column)
+            if os.path.exists(path) and os.path.getsize(path) != length * self.ITEM_SIZE:
+                logger.warning(f"캔들 아카이브 불완전 기록 복구: {path}")
+                with open(path, 'r+b') as f:
+                    f.truncate(length * self.ITEM_SIZE)
+        return length
+
+    def length(self, symbol: str, interval: str) -> int:
+        return self._length(self._series_dir(symbol, interval))
+
+    def load(self, symbol: str, interval: str, limit: Optional[int] = None) -> Optional[CandleArrays]:
+        """저장된 캔들 중 최근 limit개를 반환합니다 (없으면 None)."""
+        series_dir = self._series_dir(symbol, interval)
+        length = self._length(series_dir)
+        if length == 0:
+            return None
+        start = 0 if limit is None else max(0, length - limit)
+
+        def column(name: str) -> np.ndarray:
+            mapped = np.memmap(self._column_path(series_dir, name), dtype=self._dtype(name),
+                               mode='r', shape=(length,))
+            return mapped[start:]
+
+        timestamp = np.array(column('timestamp'), dtype=np.int64)
+        values = np.empty((len(PRICE_COLUMNS), length - start), dtype=np.float64)
+        for i, name in enumerate(PRICE_COLUMNS):
+            values[i] = column(name)
+        self._last_timestamp[(symbol, interval)] = int(timestamp[-1])
+        return CandleArrays(timestamp, values)
+
+    def load_range(self, symbol: str, interval: str, start: Optional[int] = None,
+                   end: Optional[int] = None) -> Optional[CandleArrays]:
+        """시작 시간이 [start, end) 구간(초)인 캔들을 반환합니다 (없으면 None).
+
+        timestamp 컬럼만 매핑해 구간 경계를 찾고, 가격 컬럼은 해당 구간만 읽습니다.
+        """
+        series_dir = self._series_dir(symbol, interval)
+        length = self._length(series_dir)
+        if length == 0:
+            return None
+
+        mapped = np.memmap(self._column_path(series_dir, 'timestamp'), dtype='<i8',
+                           mode='r', shape=(length,))
+        lo = 0 if start is None else int(np.searchsorted(mapped, start, side='left'))
+        hi = length if end is None else int(np.searchsorted(mapped, end, side='left'))
+        if hi <= lo:
+            return None
+
+        timestamp = np.array(mapped[lo:hi], dtype=np.int64)
+        values = np.empty((len(PRICE_COLUMNS), hi - lo), dtype=np.float64)
+        for i, name in enumerate(PRICE_COLUMNS):
+            values[i] = np.memmap(self._column_path(series_dir, name), dtype='<f8',
+                                  mode='r', shape=(length,))[lo:hi]
+        return CandleArrays(timestamp, values)
+
+    def first_timestamp(self, symbol: str, interval: str) -> Optional[int]:
+        """가장 오래된 저장 캔들의 시작 시간 (초)"""
+        series_dir = self._series_dir(symbol, interval)
+        if self._length(series_dir) == 0:
+            return None
+        with open(self._column_path(series_dir, 'timestamp'), 'rb') as f:
+            return int(np.frombuffer(f.read(self.ITEM_SIZE), dtype='<i8')[0])
+
+    def last_timestamp(self, symbol: str, interval: str) -> Optional[int]:
+        """마지막으로 저장된 캔들의 시작 시간 (초)"""
+        key = (symbol, interval)
+        if key not in self._last_timestamp:
+            series_dir = self._series_dir(symbol, interval)
+            length = self._repair(series_dir) if os.path.isdir(series_dir) else 0
+            if length == 0:
+                self._last_timestamp[key] = None
+            else:
+                path = self._column_path(series_dir, 'timestamp')
+                mapped = np.memmap(path, dtype='<i8', mode='r', shape=(length,))
+                self._last_timestamp[key] = int(mapped[-1])
+        return self._last_timestamp[key]
+
+    def append(self, symbol: str, interval: str, candles: CandleArrays) -> int:
+        """마지막 저장 캔들 이후의 캔들만 이어 쓰고, 쓴 개수를 반환합니다."""
+        last = self.last_timestamp(symbol, interval)
+        if last is not None:
+            candles = candles[int(np.searchsorted(candles.timestamp, last, side='right')):]
+        if len(candles) == 0:
+            return 0
+
+        series_dir = self._series_dir(symbol, interval)
+        os.makedirs(series_dir, exist_ok=True)
+        # 가격 컬럼을 먼저 쓰고 timestamp를 마지막에 써서 커밋
+        for i, name in enumerate(PRICE_COLUMNS):
+            with open(self._column_path(series_dir, name), 'ab') as f:
+                f.write(candles.values[i].astype('<f8').tobytes())
+        with open(self._column_path(series_dir, 'timestamp'), 'ab') as f:
+            f.write(candles.timestamp.astype('<i8').tobytes())
+
+        self._last_timestamp[(symbol, interval)] = int(candles.timestamp[-1])
+        if self.max_rows and self._length(series_dir) > self.max_rows * 1.1:
+            self._compact(symbol, interval)
+        return len(candles)
+
+    def merge(self, symbol: str, interval: str, candles: CandleArrays) -> int:
+        """저장된 구간 밖(주로 더 과거)의 캔들을 합쳐 시리즈를 다시 쓰고, 추가된 개수를 반환합니다.
+
+        같은 시작 시간의 캔들이 이미 있으면 저장된 값을 유지합니다.
+        """
+        if len(candles) == 0:
+            return 0
+        existing = self.load(symbol, interval)
+        if existing is None:
+            return self.append(symbol, interval, candles)
+
+        new = ~np.isin(candles.timestamp, existing.timestamp)
+        if not new.any():
+            return 0
+        timestamp = np.concatenate([existing.timestamp, candles.timestamp[new]])
+        values = np.concatenate([existing.values, candles.values[:, new]], axis=1)
+        order = np.argsort(timestamp, kind='stable')
+        merged = CandleArrays(timestamp[order], np.ascontiguousarray(values[:, order]))
+        if self.max_rows and len(merged) > self.max_rows:
+            logger.warning(f"{symbol} {interval} 캔들 아카이브 병합: 최대 {self.max_rows}개를 넘어 "
+                           f"오래된 캔들 {len(merged) - self.max_rows}개는 저장하지 않음")
+            merged = merged.tail(self.max_rows)
+        self._rewrite(symbol, interval, merged)
+        return int(new.sum())
+
+    def remove(self, symbol: str, interval: str):
+        """시리즈를 삭제합니다."""
+        shutil.rmtree(self._series_dir(symbol, interval), ignore_errors=True)
+        self._last_timestamp.pop((symbol, interval), None)
+
+    def _compact(self, symbol: str, interval: str):
+        """최근 max_rows개만 남기도록 시리즈를 다시 씁니다."""
+        candles = self.load(symbol, interval, self.max_rows)
+        self._rewrite(symbol, interval, candles)
+        logger.debug(f"{symbol} {interval} 캔들 아카이브 정리: {len(candles)}개 유지")
+
+    def _rewrite(self, symbol: str, interval: str, candles: CandleArrays):
+        """임시 디렉터리에 새로 쓴 뒤 교체해서, 중간에 종료되어도 기존 시리즈가 남도록 합니다."""
+        series_dir = self._series_dir(symbol, interval)
+        tmp_dir = series_dir + ".tmp"
+        old_dir = series_dir + ".old"
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        os.makedirs(tmp_dir)
+        for i, name in enumerate(PRICE_COLUMNS):
+            candles.values[i].astype('<f8').tofile(self._column_path(tmp_dir, name))
+        candles.timestamp.astype('<i8').tofile(self._column_path(tmp_dir, 'timestamp'))
+
+        shutil.rmtree(old_dir, ignore_errors=True)
+        if os.path.isdir(series_dir):
+            os.replace(series_dir, old_dir)
+        os.replace(tmp_dir, series_dir)
+        shutil.rmtree(old_dir, ignore_errors=True)
+        self._last_timestamp[(symbol, interval)] = candles.last_timestamp
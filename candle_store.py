@@ -0,0 +1,214 @@
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+from candle_archive import CandleArchive
+from candles import CandleArrays, decode_klines
+from market_data import AsyncMarketDataClient, INTERVAL_MS, MAX_KLINES_PER_REQUEST
+
+logger = logging.getLogger(__name__)
+
+
+class CandleStore:
+    """(symbol, interval)별 캔들을 프로세스 메모리에 유지하는 롤링 저장소
+
+    처음에는 필요한 개수만큼 전체 조회(warm-up)하고, 이후에는 마지막으로 저장된
+    캔들의 시작 시간(startTime)부터만 조회해서 이어 붙입니다. 마지막 캔들은 아직
+    진행 중일 수 있으므로, 증분 조회 때 항상 다시 받아서 최신 값으로 교체합니다.
+
+    WebSocket 스트림이 연결된 시리즈(live)는 apply_kline()으로 갱신되므로 REST 조회를
+    건너뜁니다. 스트림에서 캔들 누락이 감지되면 다음 get()에서 증분 조회로 채웁니다.
+
+    캔들은 CandleArrays(컬럼별 NumPy 배열)로 보관하며 DataFrame은 만들지 않습니다.
+    archive가 있으면 마감된 캔들을 디스크에 기록하고, 재시작 후 첫 조회 때 디스크에서
+    불러와 종료 이후의 공백만 증분 조회합니다.
+    """
+
+    def __init__(self, market_data: AsyncMarketDataClient, max_candles: int = 1000,
+                 archive: Optional[CandleArchive] = None):
+        self.market_data = market_data
+        self.max_candles = max_candles
+        self.archive = archive
+        self._series: Dict[Tuple[str, str], CandleArrays] = {}
+        self._locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+        self._live: Set[Tuple[str, str]] = set()
+        self._stale: Set[Tuple[str, str]] = set()
+        # 스트림의 진행 중 캔들 갱신은 자주 오므로 최신 행만 보관했다가 get()에서 반영
+        self._forming: Dict[Tuple[str, str], List[Any]] = {}
+
+    def _lock(self, key: Tuple[str, str]) -> asyncio.Lock:
+        if key not in self._locks:
+            self._locks[key] = asyncio.Lock()
+        return self._locks[key]
+
+    async def get(self, symbol: str, interval: str, limit: int) -> Optional[CandleArrays]:
+        """최근 limit개의 캔들을 반환합니다 (마지막 행은 진행 중인 캔들일 수 있음)."""
+        key = (symbol, interval)
+        async with self._lock(key):
+            forming = self._forming.pop(key, None)
+            if forming is not None:
+                self._apply_row(key, forming)
+            series = self._series.get(key)
+            restored = False
+            if series is None and self.archive is not None:
+                # 재시작 직후: 디스크의 마감 캔들 + 종료 이후 공백만 증분 조회
+                series = self._load_archive(symbol, interval, limit)
+                restored = series is not None
+
+            if series is None or (len(series) < limit and not restored):
+                series = await self._fetch_full(symbol, interval, limit)
+            elif key in self._live and key not in self._stale and not restored:
+                # 스트림이 최신 상태로 유지 중
+                self._persist(symbol, interval, series)
+                return series.tail(limit)
+            else:
+                series = await self._fetch_delta(symbol, interval, series, limit)
+                if series is not None and len(series) < limit:
+                    series = await self._fetch_full(symbol, interval, limit)
+            self._stale.discard(key)
+
+            if series is None or len(series) == 0:
+                return None
+
+            series = series.tail(max(limit, self.max_candles))
+            self._series[key] = series
+            self._persist(symbol, interval, series)
+
+        return series.tail(limit)
+
+    def set_live(self, keys: Iterable[Tuple[str, str]], live: bool):
+        """스트림 연결 상태에 따라 시리즈의 REST 조회 생략 여부를 설정합니다."""
+        for key in keys:
+            if live:
+                self._live.add(key)
+                # 연결 전후로 놓친 캔들이 있을 수 있으므로 한 번은 증분 조회
+                self._stale.add(key)
+            else:
+                self._live.discard(key)
+
+    def apply_kline(self, symbol: str, interval: str, row: List[Any], is_closed: bool = True):
+        """스트림으로 받은 kline 한 개를 저장된 시리즈에 반영합니다.
+
+        같은 시작 시간이면 진행 중인 캔들을 교체하고, 바로 다음 캔들이면 이어 붙입니다.
+        중간 캔들이 빠졌으면 시리즈를 stale로 표시해 다음 get()에서 REST로 채웁니다.
+        """
+        key = (symbol, interval)
+        if not is_closed:
+            self._forming[key] = row
+            return
+        forming = self._forming.get(key)
+        if forming is not None and int(forming[0]) <= int(row[0]):
+            del self._forming[key]
+        self._apply_row(key, row)
+
+    def _apply_row(self, key: Tuple[str, str], row: List[Any]):
+        symbol, interval = key
+        series = self._series.get(key)
+        if series is None or len(series) == 0:
+            return
+
+        interval_ms = INTERVAL_MS.get(interval, INTERVAL_MS["5m"])
+        open_ms = int(row[0])
+        last_open_ms = series.last_timestamp * 1000
+
+        if open_ms < last_open_ms:
+            return
+        if open_ms > last_open_ms + interval_ms:
+            logger.debug(f"{symbol} {interval} 스트림 캔들 누락 감지 - REST 증분 조회 예정")
+            self._stale.add(key)
+            return
+
+        candle = decode_klines([row])
+        if open_ms == last_open_ms:
+            series = CandleArrays.concat([series[:-1], candle])
+        else:
+            series = CandleArrays.concat([series, candle]).tail(self.max_candles)
+        self._series[key] = series
+
+    def _load_archive(self, symbol: str, interval: str, limit: int) -> Optional[CandleArrays]:
+        """디스크에 저장된 캔들로 시리즈를 복원합니다."""
+        try:
+            series = self.archive.load(symbol, interval, max(limit, self.max_candles))
+        except (OSError, ValueError) as e:
+            logger.warning(f"{symbol} {interval} 캔들 아카이브 읽기 오류: {e}")
+            return None
+        if series is None:
+            return None
+        # 이전 버전이 남긴 공백이 있으면 마지막 공백 이후의 연속 구간만 사용
+        interval_s = INTERVAL_MS.get(interval, INTERVAL_MS["5m"]) // 1000
+        gaps = np.flatnonzero(np.diff(series.timestamp) != interval_s)
+        if len(gaps):
+            series = series[int(gaps[-1]) + 1:]
+            logger.warning(f"{symbol} {interval} 캔들 아카이브에 공백이 있어 최근 연속 구간 {len(series)}개만 복원")
+        logger.debug(f"{symbol} {interval} 캔들 아카이브에서 {len(series)}개 복원")
+        return series
+
+    def _persist(self, symbol: str, interval: str, series: CandleArrays):
+        """마감된 캔들 중 아직 디스크에 없는 것만 기록합니다."""
+        if self.archive is None or len(series) == 0:
+            return
+        interval_s = INTERVAL_MS.get(interval, INTERVAL_MS["5m"]) // 1000
+        now_s = int(time.time())
+        closed = series[:int(np.searchsorted(series.timestamp, now_s - interval_s, side='right'))]
+        try:
+            last = self.archive.last_timestamp(symbol, interval)
+            if last is not None and len(closed) and closed.timestamp[0] > last + interval_s:
+                # 종료 기간이 분석 창보다 길어 전체 조회로 다시 받은 경우: 이어 쓰면 아카이브에
+                # 공백이 남으므로 기존 시리즈를 버리고 새로 기록 (과거 구간은 run_backfill로 다시 채움)
+                logger.warning(f"{symbol} {interval} 캔들 아카이브와 새 캔들 사이에 공백이 있어 아카이브를 새로 시작")
+                self.archive.remove(symbol, interval)
+            self.archive.append(symbol, interval, closed)
+        except OSError as e:
+            logger.warning(f"{symbol} {interval} 캔들 아카이브 기록 오류: {e}")
+
+    async def _fetch_full(self, symbol: str, interval: str, limit: int) -> Optional[CandleArrays]:
+        """최근 limit개의 캔들을 한 번에 조회합니다 (warm-up)."""
+        candlesticks = await self.market_data.get_klines(
+            symbol=symbol, interval=interval, limit=min(limit, MAX_KLINES_PER_REQUEST)
+        )
+        if not candlesticks:
+            return None
+        logger.debug(f"{symbol} {interval} 캔들 전체 조회: {len(candlesticks)}개")
+        return decode_klines(candlesticks)
+
+    async def _fetch_delta(self, symbol: str, interval: str, series: CandleArrays,
+                           limit: int) -> Optional[CandleArrays]:
+        """마지막 저장 캔들 이후의 캔들만 조회해서 이어 붙입니다."""
+        interval_ms = INTERVAL_MS.get(interval, INTERVAL_MS["5m"])
+        last_open_ms = series.last_timestamp * 1000
+        now_ms = int(time.time() * 1000)
+
+        # 진행 중이던 마지막 캔들 + 그 이후 새로 생긴 캔들 수
+        expected = max(0, (now_ms - last_open_ms) // interval_ms) + 1
+        if expected > limit:
+            # 공백이 분석 창보다 길면 증분 조회의 이점이 없으므로 다시 전체 조회
+            return await self._fetch_full(symbol, interval, limit)
+
+        new_rows: List[List[Any]] = []
+        start_ms = last_open_ms
+        request_limit = min(expected + 2, MAX_KLINES_PER_REQUEST)  # 시계 오차 여유 2개
+        while True:
+            page = await self.market_data.get_klines(
+                symbol=symbol, interval=interval, limit=request_limit, start_time=start_ms
+            )
+            if not page:
+                break
+            new_rows.extend(page if not new_rows else page[1:])
+            if len(page) < request_limit:
+                break
+            if len(new_rows) > limit:
+                return await self._fetch_full(symbol, interval, limit)
+            # 응답이 꽉 찼으면 더 최근 캔들이 남아 있을 수 있으므로 이어서 조회
+            start_ms = int(page[-1][0])
+
+        if not new_rows:
+            return series
+
+        delta = decode_klines(new_rows)
+        # 시간순 정렬이므로 새 캔들의 첫 시작 시간 이전까지만 유지
+        kept = series[:int(np.searchsorted(series.timestamp, delta.timestamp[0]))]
+        logger.debug(f"{symbol} {interval} 캔들 증분 조회: {len(delta)}개")
+        return CandleArrays.concat([kept, delta])
@@ -0,0 +1,117 @@
+from typing import TYPE_CHECKING, Any, List, Optional, Sequence
+
+import numpy as np
+
+if TYPE_CHECKING:
+    # pandas는 .df 등 편의 기능에서만 필요할 때 가져옴 (분석 경로는 NumPy만 사용)
+    import pandas as pd
+
+# float64 가격/거래량 컬럼 (Binance kline 응답의 1~5번 필드)
+PRICE_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+
+
+class CandleArrays:
+    """OHLCV 캔들을 컬럼별 NumPy 배열로 보관하는 컨테이너
+
+    timestamp는 캔들 시작 시간(초, int64), 나머지는 float64 배열입니다.
+    슬라이싱은 복사 없이 뷰를 반환하며, DataFrame은 .df에 처음 접근할 때 한 번만 만듭니다.
+    """
+
+    __slots__ = ('timestamp', 'values', '_df')
+
+    def __init__(self, timestamp: np.ndarray, values: np.ndarray):
+        # values: (5, n) 행렬 - 각 행이 PRICE_COLUMNS 순서의 연속 메모리 컬럼
+        self.timestamp = timestamp
+        self.values = values
+        self._df: Optional['pd.DataFrame'] = None
+
+    @classmethod
+    def empty(cls) -> 'CandleArrays':
+        return cls(np.empty(0, dtype=np.int64), np.empty((len(PRICE_COLUMNS), 0), dtype=np.float64))
+
+    @classmethod
+    def from_dataframe(cls, df: 'pd.DataFrame') -> 'CandleArrays':
+        timestamp = df['timestamp'].to_numpy(dtype=np.int64)
+        values = np.ascontiguousarray(df[list(PRICE_COLUMNS)].to_numpy(dtype=np.float64).T)
+        return cls(timestamp, values)
+
+    @property
+    def open(self) -> np.ndarray:
+        return self.values[0]
+
+    @property
+    def high(self) -> np.ndarray:
+        return self.values[1]
+
+    @property
+    def low(self) -> np.ndarray:
+        return self.values[2]
+
+    @property
+    def close(self) -> np.ndarray:
+        return self.values[3]
+
+    @property
+    def volume(self) -> np.ndarray:
+        return self.values[4]
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+    def __getitem__(self, index: slice) -> 'CandleArrays':
+        if not isinstance(index, slice):
+            raise TypeError("CandleArrays는 슬라이스로만 인덱싱할 수 있습니다.")
+        return CandleArrays(self.timestamp[index], self.values[:, index])
+
+    def tail(self, n: int) -> 'CandleArrays':
+        """최근 n개 캔들 (뷰)"""
+        if n >= len(self):
+            return self
+        return self[len(self) - n:]
+
+    @property
+    def last_timestamp(self) -> int:
+        return int(self.timestamp[-1])
+
+    @staticmethod
+    def concat(parts: Sequence['CandleArrays']) -> 'CandleArrays':
+        parts = [p for p in parts if len(p)]
+        if not parts:
+            return CandleArrays.empty()
+        if len(parts) == 1:
+            return parts[0]
+        return CandleArrays(
+            np.concatenate([p.timestamp for p in parts]),
+            np.concatenate([p.values for p in parts], axis=1)
+        )
+
+    @property
+    def df(self) -> 'pd.DataFrame':
+        """pandas 기반 분석용 DataFrame (처음 접근할 때 생성 후 재사용)"""
+        if self._df is None:
+            import pandas as pd
+            df = pd.DataFrame({'timestamp': self.timestamp})
+            for i, column in enumerate(PRICE_COLUMNS):
+                df[column] = self.values[i]
+            df['datetime'] = pd.to_datetime(self.timestamp, unit='s', utc=True)
+            self._df = df
+        return self._df
+
+
+def decode_klines(candlesticks: List[List[Any]]) -> CandleArrays:
+    """Binance kline 응답을 미리 할당한 NumPy 배열로 바로 변환합니다.
+
+    Binance는 시작 시간 오름차순으로 응답하므로 정렬하지 않습니다.
+    """
+    n = len(candlesticks)
+    timestamp = np.fromiter((row[0] for row in candlesticks), dtype=np.int64, count=n) // 1000
+    values = np.empty((len(PRICE_COLUMNS), n), dtype=np.float64)
+    for i in range(len(PRICE_COLUMNS)):
+        # 문자열 가격을 NumPy가 한 번에 float64로 변환
+        values[i] = [row[i + 1] for row in candlesticks]
+    return CandleArrays(timestamp, values)
+
+
+def klines_to_dataframe(candlesticks: List[List[Any]]) -> 'pd.DataFrame':
+    """Binance kline 응답을 DataFrame으로 변환합니다."""
+    return decode_klines(candlesticks).df
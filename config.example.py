@@ -23,7 +23,17 @@ MONITOR_CONDITIONS = {
         "left_bars": 5,                     # 피벗 왼쪽 lookback
         "right_bars": 5,                    # 피벗 오른쪽 lookback
         "lookback_range": [5, 60],          # 피벗 포인트 간의 최소/최대 간격
-        "include_hidden": False             # Hidden 다이버전스 포함 여부
+        "include_hidden": False,            # Hidden 다이버전스 포함 여부
+        "recent_bars_only": 5               # 최근 N봉 안에서 확정된 피벗만 감지
+    },
+    "indicator_conditions": {               # 캔들당 O(1)로 갱신되는 증분 지표 (설정에서 뺀 지표는 계산 안 함)
+        "enabled": False,
+        "timeframes": ["5m", "15m"],
+        "macd": {"fast": 12, "slow": 26, "signal": 9},          # MACD/시그널 교차
+        "ema_cross": {"fast": 9, "slow": 21},                   # EMA 골든/데드 크로스
+        "bollinger": {"period": 20, "deviations": 2.0},         # 종가의 밴드 상단 돌파/하단 이탈
+        "atr": {"period": 14, "expansion": 1.5},                # 캔들 진폭이 ATR의 N배 이상
+        "vwap": {"period": 14, "deviation_percent": 2.0}        # 종가가 VWAP에서 N% 이상 이격
     }
 }
 
@@ -55,7 +65,18 @@ MARKET_SETTINGS = {
     "market_type": "futures",         # "spot" 또는 "futures"
     "settle": "usdt",                # futures 결제 통화 (usdt, btc)
     "top_volume_limit": 7,          # 거래량 상위 몇 개 종목을 모니터링할지
-    "max_alerts_per_cycle": 20        # 한 번에 최대 몇 개의 알림을 보낼지
+    "max_alerts_per_cycle": 20,       # 한 번에 최대 몇 개의 알림을 보낼지
+    "max_concurrent_requests": 10,    # Binance 시세 API 동시 요청 수 (aiohttp 세션 풀 크기)
+    "request_weight_limit": None,     # 분당 요청 가중치 한도 (None이면 spot 6000, futures 2400)
+    "resample_timeframes": True,      # 큰 timeframe(15m, 1h 등)을 가장 작은 timeframe 캔들에서 로컬로 합성
+    "candle_cache_dir": "logs/candles",  # 마감 캔들 디스크 캐시 (재시작 후 공백만 조회, ""이면 사용 안 함)
+    "analysis_workers": 0,            # 다이버전스 분석 워커 프로세스 수 (0이면 이벤트 루프에서 실행, None이면 CPU 수)
+    "max_concurrent_symbols": 20,     # 종목별 조건 확인을 동시에 실행할 최대 종목 수
+    "symbol_timeout_seconds": 30,     # 종목당 캔들 조회·조건 확인 제한 시간 (각각, 초과 시 이번 주기에서 제외, None이면 제한 없음)
+    "pipeline_queue_size": 32,        # 수집 → 분석 → 알림 단계 사이 대기열 크기 (가득 차면 앞 단계가 대기)
+    "analysis_batch_size": 16,        # 분석 단계가 캔들이 준비된 종목을 모아 일괄 계산하는 최대 종목 수
+    "cycle_deadline_margin_seconds": 5,  # 주기 마감 시한 = 다음 봉 마감 - 이 시간 (시한 이후 종목은 다음 주기로 넘김)
+    "data_mode": "polling"            # "polling" (주기적 REST 조회) 또는 "streaming" (WebSocket 봉 마감 즉시 분석)
 }
 
 # 체크 주기 (분)
@@ -1,12 +1,10 @@
-from binance.client import Client
-from binance.exceptions import BinanceAPIException, BinanceRequestException
 import asyncio
 import logging
 from telegram import Bot
 from telegram.error import TelegramError
 from datetime import datetime, timedelta
 import time
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Optional, Any, Set
 import json
 import pytz
 
@@ -16,6 +14,13 @@ from config import (
     NOTIFICATION_SCHEDULE
 )
 from watchlist import WATCHLIST
+from analysis_pool import AnalysisPool
+from candle_archive import CandleArchive
+from market_data import AsyncMarketDataClient, MarketDataError
+from rate_limiter import RequestWeightLimiter
+from kline_stream import KlineStream
+from pipeline import DONE, StageStats, run_stage
+from scheduler import TICKER_TIMER, CandleCloseScheduler, CycleBudget
 from technical_analysis import TechnicalAnalyzer
 
 # 로깅 설정
@@ -29,30 +34,68 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 다이버전스 감지에 사용하는 비교 캔들 수
+IMMEDIATE_DIVERGENCE_LOOKBACK = 10
+DIVERGENCE_LOOKBACK = 15
+
+# 스트리밍 모드에서 같은 시각에 마감되는 다른 종목의 캔들을 모으는 대기 시간 (초)
+STREAM_BATCH_DELAY_SECONDS = 0.5
+
+# 주기당 텔레그램으로 발송하는 최대 알림 수
+MAX_ALERT_MESSAGES = 5
+
 
 class CryptoMonitor:
     def __init__(self):
-        # Binance API 클라이언트 설정
-        if BINANCE_API_KEY and BINANCE_API_SECRET and BINANCE_API_KEY != "your_binance_api_key_here":
-            self.client = Client(BINANCE_API_KEY, BINANCE_API_SECRET)
-        else:
-            # 공개 데이터만 사용하는 경우
-            self.client = Client()
-        
         # 시장 설정
         self.market_settings = MARKET_SETTINGS
         self.market_type = MARKET_SETTINGS.get('market_type', 'spot')
         self.settle = MARKET_SETTINGS.get('settle', 'usdt')
         self.top_volume_limit = MARKET_SETTINGS.get('top_volume_limit', 30)
         self.max_alerts_per_cycle = MARKET_SETTINGS.get('max_alerts_per_cycle', 5)
+        self.max_concurrent_requests = MARKET_SETTINGS.get('max_concurrent_requests', 10)
+        self.data_mode = MARKET_SETTINGS.get('data_mode', 'polling')
+        # 분당 요청 가중치 한도 (None이면 시장 타입별 Binance 기본값)
+        self.request_weight_limit = MARKET_SETTINGS.get('request_weight_limit')
+        # 큰 timeframe을 가장 작은 timeframe 캔들에서 로컬로 합쳐 만들지 여부
+        self.resample_timeframes = MARKET_SETTINGS.get('resample_timeframes', True)
+        # 마감 캔들 디스크 캐시 경로 (재시작 시 공백만 조회, 빈 값이면 사용 안 함)
+        self.candle_cache_dir = MARKET_SETTINGS.get('candle_cache_dir', 'logs/candles')
+        # 다이버전스 분석 워커 프로세스 수 (0이면 이벤트 루프에서 실행, None이면 CPU 수)
+        self.analysis_workers = MARKET_SETTINGS.get('analysis_workers', 0)
+        # 종목별 조건 확인 동시 실행 수와 종목당 제한 시간 (초, None이면 제한 없음)
+        self.max_concurrent_symbols = MARKET_SETTINGS.get('max_concurrent_symbols', 20)
+        self.symbol_timeout_seconds = MARKET_SETTINGS.get('symbol_timeout_seconds', 30)
+        # 수집 → 분석 → 알림 파이프라인의 단계 간 대기열 크기와 분석 단계 배치 크기
+        self.pipeline_queue_size = MARKET_SETTINGS.get('pipeline_queue_size', 32)
+        self.analysis_batch_size = MARKET_SETTINGS.get('analysis_batch_size', 16)
+        # 주기 마감 시한을 다음 봉 마감보다 앞당기는 여유 시간 (초)
+        self.cycle_deadline_margin_seconds = MARKET_SETTINGS.get('cycle_deadline_margin_seconds', 5)
+        
+        # Binance 시세 클라이언트 설정 (비동기, 세션 풀 공유)
+        if BINANCE_API_KEY and BINANCE_API_KEY != "your_binance_api_key_here":
+            api_key = BINANCE_API_KEY
+        else:
+            # 공개 데이터만 사용하는 경우
+            api_key = None
+        self.market_data = AsyncMarketDataClient(
+            market_type=self.market_type,
+            api_key=api_key,
+            max_concurrent_requests=self.max_concurrent_requests,
+            limiter=RequestWeightLimiter.for_market(self.market_type, self.request_weight_limit)
+        )
         
         # 모니터링 조건
         self.monitor_conditions = MONITOR_CONDITIONS
         
         # 기술적 분석기 초기화
+        monitored_timeframes = self.get_monitored_timeframes()
         self.technical_analyzer = TechnicalAnalyzer(
-            client=self.client,
-            market_type=self.market_type
+            market_data=self.market_data,
+            market_type=self.market_type,
+            base_interval=monitored_timeframes[0] if self.resample_timeframes and monitored_timeframes else None,
+            candle_archive=CandleArchive(self.candle_cache_dir, self.market_type) if self.candle_cache_dir else None,
+            analysis_pool=AnalysisPool(self.analysis_workers) if self.analysis_workers != 0 else None
         )        # Telegram Bot 설정
         self.bot = Bot(token=TELEGRAM_BOT_TOKEN) if TELEGRAM_BOT_TOKEN else None
         self.chat_id = TELEGRAM_CHAT_ID
@@ -62,6 +105,30 @@ class CryptoMonitor:
         
         # 전체 알림 캐시 (중복 방지용)
         self.alert_cache = {}  # {cache_key: last_alert_time}
+        
+        # 전체 24시간 티커 스냅샷 {symbol: ticker} (주기당 한 번 조회)
+        self.ticker_snapshot: Dict[str, Dict] = {}
+        
+        # 최근 주기의 모니터링 대상 종목 (스트리밍 구독 대상)
+        self.monitored_symbols = set()
+        
+        # 종목별 조건 확인 잠금 (같은 종목이 겹쳐서 확인되지 않도록)
+        self._symbol_locks: Dict[str, asyncio.Lock] = {}
+        
+        # 최근 주기의 파이프라인 단계별 처리량/대기열 통계
+        self.pipeline_stats: List[StageStats] = []
+        
+        # 최근 주기의 마감 시한 예산 사용량 (부분 결과 여부 포함)
+        self.last_cycle_budget: Optional[CycleBudget] = None
+        
+        # timeframe별 봉 마감 타이머와 이번 주기에 마감된 타이머 (None이면 모든 조건 확인)
+        self.candle_scheduler = CandleCloseScheduler(self.get_schedule_periods())
+        self._cycle_due: Optional[Set[str]] = None
+        
+        # 스트리밍 모드: 캔들이 마감되어 분석을 기다리는 종목과 그 봉 마감 시각 (epoch 초)
+        self._pending_symbols = set()
+        self._pending_closes: Set[int] = set()
+        self._flush_task: Optional[asyncio.Future] = None
 
     def timeframe_to_minutes(self, timeframe: str) -> int:
         """타임프레임을 분 단위로 변환합니다."""
@@ -75,8 +142,8 @@ class CryptoMonitor:
             # 기본값 (알 수 없는 형식)
             return 5
     
-    def get_smallest_timeframe_minutes(self) -> int:
-        """설정된 timeframe 중 가장 작은 것을 분 단위로 반환합니다."""
+    def get_monitored_timeframes(self) -> List[str]:
+        """활성화된 조건들에 설정된 timeframe 목록을 반환합니다."""
         all_timeframes = []
         
         # RSI 조건의 timeframes
@@ -87,6 +154,16 @@ class CryptoMonitor:
         if 'divergence_conditions' in MONITOR_CONDITIONS and MONITOR_CONDITIONS['divergence_conditions'].get('enabled'):
             all_timeframes.extend(MONITOR_CONDITIONS['divergence_conditions'].get('timeframes', []))
         
+        # 지표(MACD/EMA 교차/볼린저/ATR/VWAP) 조건의 timeframes
+        if 'indicator_conditions' in MONITOR_CONDITIONS and MONITOR_CONDITIONS['indicator_conditions'].get('enabled'):
+            all_timeframes.extend(MONITOR_CONDITIONS['indicator_conditions'].get('timeframes', []))
+        
+        return sorted(set(all_timeframes), key=self.timeframe_to_minutes)
+    
+    def get_smallest_timeframe_minutes(self) -> int:
+        """설정된 timeframe 중 가장 작은 것을 분 단위로 반환합니다."""
+        all_timeframes = self.get_monitored_timeframes()
+        
         if not all_timeframes:
             return CHECK_INTERVAL_MINUTES  # 기본값
         
@@ -94,6 +171,79 @@ class CryptoMonitor:
         min_minutes = min(self.timeframe_to_minutes(tf) for tf in all_timeframes)
         return min_minutes
     
+    def get_schedule_periods(self) -> Dict[str, int]:
+        """봉 마감 스케줄러의 타이머별 주기(초)를 반환합니다.
+
+        활성화된 조건의 timeframe마다 타이머를 두고, 티커 기반 조건(가격/거래량 변동)은
+        CHECK_INTERVAL_MINUTES 간격의 TICKER_TIMER로 확인합니다.
+        """
+        periods = {tf: self.timeframe_to_minutes(tf) * 60 for tf in self.get_monitored_timeframes()}
+        periods[TICKER_TIMER] = CHECK_INTERVAL_MINUTES * 60
+        return periods
+
+    def _is_due(self, timer: str) -> bool:
+        """이번 주기에 timer가 마감되었는지 여부 (주기 밖이나 전체 확인 주기에서는 항상 True)"""
+        return self._cycle_due is None or timer in self._cycle_due
+
+    def _due_timeframes(self, timeframes: Iterable[str]) -> List[str]:
+        """timeframes 중 이번 주기에 봉이 마감된 것만 반환합니다."""
+        return [tf for tf in timeframes if self._is_due(tf)]
+
+    def get_candle_window_sizes(self) -> Dict[str, int]:
+        """활성화된 조건들이 timeframe별로 필요로 하는 최대 캔들 수를 반환합니다."""
+        windows: Dict[str, int] = {}
+        analyzer = self.technical_analyzer
+        
+        rsi_config = MONITOR_CONDITIONS.get('rsi_conditions', {})
+        if rsi_config.get('enabled', False):
+            window = analyzer.rsi_window(rsi_config.get('periods', [7, 14, 21]))
+            for tf in rsi_config.get('timeframes', ['5m', '15m']):
+                windows[tf] = max(windows.get(tf, 0), window)
+        
+        div_config = MONITOR_CONDITIONS.get('divergence_conditions', {})
+        if div_config.get('enabled', False):
+            rsi_period = div_config.get('rsi_period', 14)
+            window = max(
+                analyzer.immediate_divergence_window(rsi_period, IMMEDIATE_DIVERGENCE_LOOKBACK),
+                analyzer.divergence_window(rsi_period, DIVERGENCE_LOOKBACK),
+                analyzer.pivot_divergence_window(
+                    rsi_period,
+                    div_config.get('left_bars', 5),
+                    div_config.get('right_bars', 5),
+                    tuple(div_config.get('lookback_range', [5, 60])),
+                    div_config.get('recent_bars_only', 5)
+                )
+            )
+            for tf in div_config.get('timeframes', ['5m', '15m']):
+                windows[tf] = max(windows.get(tf, 0), window)
+        
+        indicator_config = MONITOR_CONDITIONS.get('indicator_conditions', {})
+        if indicator_config.get('enabled', False):
+            window = analyzer.indicator_window(analyzer.indicator_specs(indicator_config))
+            for tf in indicator_config.get('timeframes', ['5m', '15m']):
+                windows[tf] = max(windows.get(tf, 0), window)
+        
+        # 주기 중에는 이번에 봉이 마감된 timeframe의 캔들만 조회
+        return {tf: window for tf, window in windows.items() if self._is_due(tf)}
+
+    def get_fetch_timeframes(self) -> List[str]:
+        """리샘플링을 반영해 Binance에서 실제로 받아야 하는 timeframe 목록을 반환합니다."""
+        fetch_windows = self.technical_analyzer.fetch_window_sizes(self.get_candle_window_sizes())
+        return sorted(fetch_windows, key=self.timeframe_to_minutes)
+
+    def estimate_symbol_request_weight(self) -> int:
+        """한 종목의 캔들을 처음부터 모두 조회할 때 드는 요청 가중치를 반환합니다."""
+        fetch_windows = self.technical_analyzer.fetch_window_sizes(self.get_candle_window_sizes())
+        return sum(self.market_data.klines_weight(window) for window in fetch_windows.values())
+
+    def get_max_symbols_per_cycle(self) -> int:
+        """1분 요청 가중치 예산 안에서 한 주기에 전체 조회할 수 있는 최대 종목 수를 반환합니다."""
+        per_symbol = self.estimate_symbol_request_weight()
+        budget = self.market_data.limiter.capacity - self.market_data.ticker_weight()
+        if per_symbol <= 0:
+            return max(0, budget)
+        return max(0, budget // per_symbol)
+
     def get_next_candle_close_time(self, timeframe_minutes: int) -> datetime:
         """다음 봉 마감 시간을 초 단위까지 정밀하게 계산합니다."""
         now = datetime.now()
@@ -149,8 +299,38 @@ class CryptoMonitor:
         if ALERT_COOLDOWN.get('enabled', False):
             self.alert_cache[cache_key] = datetime.now()
 
-    def get_top_volume_pairs(self, limit: int = None) -> List[Dict]:
-        """거래 대금 상위 종목을 가져옵니다."""
+    def _claim_alert(self, cache_key: str, claimed: List[str]) -> bool:
+        """쿨다운 중이 아니면 claimed에 키를 추가하고 True를 반환합니다.
+
+        알림 캐시는 종목 확인이 끝난 뒤 claimed로 한 번에 갱신하므로, 도중에 취소(시간 초과)된
+        종목의 알림은 보내지 않았는데 쿨다운만 남는 일이 없습니다.
+        """
+        if self.is_alert_in_cooldown(cache_key):
+            return False
+        if ALERT_COOLDOWN.get('enabled', False):
+            # 같은 확인 안에서 이미 쓴 키는 바로 쿨다운 (캐시를 즉시 갱신하던 때와 같은 동작)
+            if cache_key in claimed:
+                return False
+            claimed.append(cache_key)
+        return True
+
+    async def refresh_ticker_snapshot(self) -> Dict[str, Dict]:
+        """전체 24시간 티커를 한 번에 조회해 심볼별 스냅샷으로 저장합니다."""
+        market_name = "Futures" if self.market_type == 'futures' else "Spot"
+        try:
+            tickers = await self.market_data.get_ticker()
+            self.ticker_snapshot = {ticker['symbol']: ticker for ticker in tickers}
+            logger.info(f"총 {len(self.ticker_snapshot)}개 티커 데이터 조회 완료")
+        except MarketDataError as e:
+            logger.error(f"Binance {market_name} API 오류: {e}")
+            self.ticker_snapshot = {}
+        return self.ticker_snapshot
+
+    async def get_top_volume_pairs(self, limit: int = None, refresh: bool = True) -> List[Dict]:
+        """거래 대금 상위 종목을 가져옵니다.
+
+        refresh가 False이면 이미 조회한 티커 스냅샷에서 순위만 계산합니다.
+        """
         if limit is None:
             limit = self.top_volume_limit
         
@@ -163,6 +343,9 @@ class CryptoMonitor:
         logger.info(f"시장 타입: {self.market_type}")
             
         try:
+            if refresh or not self.ticker_snapshot:
+                await self.refresh_ticker_snapshot()
+            
             if self.market_type == 'futures':
                 result = self._get_top_futures_volume(limit)
             else:
@@ -178,12 +361,9 @@ class CryptoMonitor:
             return []
 
     def _get_top_spot_volume(self, limit: int) -> List[Dict]:
-        """스팟 시장의 거래 대금 상위 종목을 가져옵니다."""
+        """티커 스냅샷에서 스팟 시장의 거래 대금 상위 종목을 가져옵니다."""
         try:
-            logger.info("Binance 스팟 티커 데이터 조회 시작...")
-            # 24시간 티커 통계 정보 가져오기
-            tickers = self.client.get_ticker()
-            logger.info(f"총 {len(tickers)}개 티커 데이터 조회 완료")
+            tickers = self.ticker_snapshot.values()
             
             # USDT 페어만 필터링하고 거래 대금으로 정렬
             usdt_tickers = [
@@ -202,9 +382,6 @@ class CryptoMonitor:
             logger.info(f"상위 {limit}개 종목 반환")
             return sorted_tickers[:limit]
             
-        except (BinanceAPIException, BinanceRequestException) as e:
-            logger.error(f"Binance Spot API 오류: {e}")
-            return []
         except Exception as e:
             logger.error(f"예상치 못한 오류: {e}")
             import traceback
@@ -212,33 +389,36 @@ class CryptoMonitor:
             return []
 
     def _get_top_futures_volume(self, limit: int) -> List[Dict]:
-        """퓨처스 시장의 거래 대금 상위 종목을 가져옵니다."""
-        try:
-            # 퓨처스 24시간 티커 통계 정보 가져오기
-            tickers = self.client.futures_ticker()
-            
-            # 거래 대금이 있는 계약만 필터링 (USDT 마진)
-            active_tickers = [
-                ticker for ticker in tickers 
-                if float(ticker['quoteVolume']) > 0
-            ]
-            
-            # 24시간 거래 대금 기준으로 정렬 (USDT 기준)
-            sorted_tickers = sorted(
-                active_tickers,
-                key=lambda x: float(x['quoteVolume']),
-                reverse=True
-            )
-            
-            return sorted_tickers[:limit]
-            
-        except (BinanceAPIException, BinanceRequestException) as e:
-            logger.error(f"Binance Futures API 오류: {e}")
-            return []
+        """티커 스냅샷에서 퓨처스 시장의 거래 대금 상위 종목을 가져옵니다."""
+        # 거래 대금이 있는 계약만 필터링 (USDT 마진)
+        active_tickers = [
+            ticker for ticker in self.ticker_snapshot.values()
+            if float(ticker['quoteVolume']) > 0
+        ]
+        
+        # 24시간 거래 대금 기준으로 정렬 (USDT 기준)
+        sorted_tickers = sorted(
+            active_tickers,
+            key=lambda x: float(x['quoteVolume']),
+            reverse=True
+        )
+        
+        return sorted_tickers[:limit]
+
+    async def check_conditions(self, ticker: Any, symbol: str,
+                               rsi_alerts: Optional[List[str]] = None,
+                               indicator_alerts: Optional[List[str]] = None) -> List[str]:
+        """조건을 확인하고 알림 메시지를 반환합니다.
 
-    def check_conditions(self, ticker: Any, symbol: str) -> List[str]:
-        """조건을 확인하고 알림 메시지를 반환합니다."""
+        rsi_alerts/indicator_alerts가 주어지면 (주기 전체를 한 번에 계산한 결과) 다시 계산하지 않습니다.
+        봉 마감 스케줄 주기에서는 이번에 마감된 timeframe의 조건만, 티커 기반 조건은 TICKER_TIMER가
+        마감된 주기에만 확인합니다 (previous_data도 그때만 갱신해 거래량 비교 간격을 유지).
+        알림 캐시와 previous_data는 확인이 끝난 뒤 await 없이 한 번에 반영하므로, 여러 종목을 동시에
+        확인하거나 도중에 취소되어도 일부만 반영되지 않습니다.
+        """
         alerts = []
+        claimed: List[str] = []
+        current_data = None
         
         try:
             # Binance API 데이터 구조에 맞게 수정
@@ -259,45 +439,44 @@ class CryptoMonitor:
             
             # 조건 확인
             conditions = MONITOR_CONDITIONS
+            ticker_due = self._is_due(TICKER_TIMER)
             
             # 가격 변동률 조건 확인
-            if 'price_change_24h_percent' in conditions:
+            if ticker_due and 'price_change_24h_percent' in conditions:
                 condition = conditions['price_change_24h_percent']
                 if 'min' in condition and price_change_24h <= condition['min']:
                     cache_key = self.generate_alert_cache_key(symbol, "price_drop", f"{condition['min']}")
-                    if not self.is_alert_in_cooldown(cache_key):
+                    if self._claim_alert(cache_key, claimed):
                         alert_msg = f"📉 24시간 가격 변동률: {price_change_24h:.2f}% (임계값: {condition['min']}% 이하)"
                         alerts.append(alert_msg)
-                        self.update_alert_cache(cache_key)
                         
                 if 'max' in condition and price_change_24h >= condition['max']:
                     cache_key = self.generate_alert_cache_key(symbol, "price_rise", f"{condition['max']}")
-                    if not self.is_alert_in_cooldown(cache_key):
+                    if self._claim_alert(cache_key, claimed):
                         alert_msg = f"📈 24시간 가격 변동률: {price_change_24h:.2f}% (임계값: {condition['max']}% 이상)"
                         alerts.append(alert_msg)
-                        self.update_alert_cache(cache_key)
             
             # 거래량 변화 조건 확인
-            if 'volume_change_24h' in conditions:
+            if ticker_due and 'volume_change_24h' in conditions:
                 condition = conditions['volume_change_24h']
                 if 'min' in condition and volume_change >= condition['min']:
                     cache_key = self.generate_alert_cache_key(symbol, "volume_surge", f"{condition['min']}")
-                    if not self.is_alert_in_cooldown(cache_key):
+                    if self._claim_alert(cache_key, claimed):
                         alert_msg = f"📊 거래량 증가: {volume_change:.2f}배 (임계값: {condition['min']}배 이상)"
                         alerts.append(alert_msg)
-                        self.update_alert_cache(cache_key)
             
             # RSI 조건 확인
             if 'rsi_conditions' in conditions and conditions['rsi_conditions'].get('enabled', False):
                 rsi_config = conditions['rsi_conditions']
-                timeframes = rsi_config.get('timeframes', ['5m', '15m'])
+                timeframes = self._due_timeframes(rsi_config.get('timeframes', ['5m', '15m']))
                 periods = rsi_config.get('periods', [7, 14, 21])
                 oversold = rsi_config.get('oversold', 30)
                 overbought = rsi_config.get('overbought', 70)
                 
-                rsi_alerts = self.technical_analyzer.analyze_rsi_conditions(
-                    symbol, timeframes, periods, oversold, overbought
-                )
+                if rsi_alerts is None:
+                    rsi_alerts = await self.technical_analyzer.analyze_rsi_conditions(
+                        symbol, timeframes, periods, oversold, overbought
+                    ) if timeframes else []
                 
                 # RSI 알림에 쿨다운 적용
                 for rsi_alert in rsi_alerts:
@@ -310,40 +489,57 @@ class CryptoMonitor:
                             break
                     
                     cache_key = self.generate_alert_cache_key(symbol, alert_type, timeframe_info)
-                    if not self.is_alert_in_cooldown(cache_key):
+                    if self._claim_alert(cache_key, claimed):
                         alerts.append(rsi_alert)
-                        self.update_alert_cache(cache_key)
+            
+            # 지표(MACD/EMA 교차/볼린저/ATR/VWAP) 조건 확인
+            if 'indicator_conditions' in conditions and conditions['indicator_conditions'].get('enabled', False):
+                indicator_config = conditions['indicator_conditions']
+                
+                indicator_timeframes = self._due_timeframes(indicator_config.get('timeframes', ['5m', '15m']))
+                
+                if indicator_alerts is None:
+                    indicator_alerts = await self.technical_analyzer.analyze_indicator_conditions(
+                        symbol, indicator_timeframes, indicator_config
+                    ) if indicator_timeframes else []
+                
+                # 지표 알림에 쿨다운 적용 (메시지 형식: "<이모지> <timeframe> <신호>: <값>")
+                for indicator_alert in indicator_alerts:
+                    _, timeframe_info, signal = indicator_alert.split(' ', 2)
+                    signal = signal.split(':')[0]
+                    cache_key = self.generate_alert_cache_key(symbol, "indicator", f"{timeframe_info}_{signal}")
+                    if self._claim_alert(cache_key, claimed):
+                        alerts.append(indicator_alert)
             
             # RSI 다이버전스 조건 확인
-            if 'divergence_conditions' in conditions and conditions['divergence_conditions'].get('enabled', False):
-                div_config = conditions['divergence_conditions']
-                div_timeframes = div_config.get('timeframes', ['5m', '15m'])
+            div_config = conditions.get('divergence_conditions', {})
+            div_timeframes = self._due_timeframes(div_config.get('timeframes', ['5m', '15m']))
+            if div_config.get('enabled', False) and div_timeframes:
                 rsi_period = div_config.get('rsi_period', 14)
                 left_bars = div_config.get('left_bars', 5)
                 right_bars = div_config.get('right_bars', 5)
                 lookback_range = tuple(div_config.get('lookback_range', [5, 60]))
+                recent_bars = div_config.get('recent_bars_only', 5)
                 include_hidden = div_config.get('include_hidden', False)
                 
+                # 즉시(실시간) + lookback(더 확실한 신호) + 피벗(확정된 피벗 쌍) 감지를 timeframe별로 한 번에
+                divergence_alerts = await self.technical_analyzer.detect_divergences(
+                    symbol,
+                    div_timeframes,
+                    rsi_period=rsi_period,
+                    immediate_lookback=IMMEDIATE_DIVERGENCE_LOOKBACK,
+                    lookback_periods=DIVERGENCE_LOOKBACK,  # 범위를 줄여서 더 최근 데이터만 사용
+                    left_bars=left_bars,
+                    right_bars=right_bars,
+                    lookback_range=lookback_range,
+                    recent_bars=recent_bars,
+                    include_hidden=include_hidden
+                )
+                
                 for timeframe in div_timeframes:
                     try:
-                        # 즉시 다이버전스 감지 (실시간) - 더 민감하고 즉시성 있는 감지
-                        immediate_alerts = self.technical_analyzer.detect_immediate_rsi_divergence(
-                            symbol=symbol,
-                            timeframe=timeframe,
-                            rsi_period=rsi_period,
-                            lookback_periods=10
-                        )
-                        
-                        # 기존 다이버전스 감지 (lookback 방식) - 더 확실한 신호
-                        lookback_alerts = self.technical_analyzer.detect_rsi_divergence(
-                            symbol=symbol,
-                            timeframe=timeframe,
-                            rsi_period=rsi_period,
-                            lookback_periods=15  # 범위를 줄여서 더 최근 데이터만 사용
-                        )
-                        
-                        # 즉시 감지를 우선하고, lookback은 보조적으로 사용
-                        all_divergence_alerts = immediate_alerts + lookback_alerts
+                        # 즉시 감지를 우선하고, lookback/피벗은 보조적으로 사용
+                        all_divergence_alerts = divergence_alerts.get(timeframe, [])
                         
                         # Hidden 다이버전스 필터링
                         if not include_hidden:
@@ -366,9 +562,8 @@ class CryptoMonitor:
                                 div_type = "hidden_bearish"
                             
                             cache_key = self.generate_alert_cache_key(symbol, "divergence", f"{timeframe}_{div_type}")
-                            if not self.is_alert_in_cooldown(cache_key):
+                            if self._claim_alert(cache_key, claimed):
                                 alerts.append(divergence_msg)
-                                self.update_alert_cache(cache_key)
                                 
                         if all_divergence_alerts:
                             logger.info(f"다이버전스 신호 발견: {symbol} {timeframe} - {len(all_divergence_alerts)}개")
@@ -377,15 +572,22 @@ class CryptoMonitor:
                         logger.error(f"{symbol} {timeframe} 다이버전스 분석 오류: {e}")
                         continue
             
-            # 현재 데이터 저장
-            self.previous_data[symbol] = {
-                'price': current_price,
-                'volume': volume_24h,
-                'timestamp': datetime.now().isoformat()
-            }
+            # 현재 데이터 (확인이 끝난 뒤 저장, 티커 기반 조건을 확인한 주기에만)
+            if ticker_due:
+                current_data = {
+                    'price': current_price,
+                    'volume': volume_24h,
+                    'timestamp': datetime.now().isoformat()
+                }
             
         except Exception as e:
             logger.error(f"{symbol} 조건 확인 오류: {e}")
+        
+        # 반환하는 알림의 쿨다운과 현재 데이터를 함께 반영
+        for cache_key in claimed:
+            self.update_alert_cache(cache_key)
+        if current_data is not None:
+            self.previous_data[symbol] = current_data
             
         return alerts
 
@@ -545,13 +747,18 @@ class CryptoMonitor:
 """
         return info.strip()
 
-    async def monitor_markets(self):
-        """시장을 모니터링합니다."""
+    async def monitor_markets(self, budget: Optional[CycleBudget] = None, due: Optional[Iterable[str]] = None):
+        """시장을 모니터링합니다.
+
+        budget이 있으면 그 마감 시한 안에서 확인한 종목까지만 결과로 남기고, due가 있으면 그 타이머
+        (봉이 마감된 timeframe과 TICKER_TIMER)의 조건만 확인합니다 (None이면 모든 조건).
+        """
         logger.info("암호화폐 모니터링을 시작합니다...")
         
         try:
-            # 1. 거래 대금 상위 종목 가져오기
-            top_volume_pairs = self.get_top_volume_pairs(self.top_volume_limit)
+            # 1. 전체 티커 스냅샷 조회 (주기당 티커 요청 1회) 후 거래 대금 상위 종목 선정
+            await self.refresh_ticker_snapshot()
+            top_volume_pairs = await self.get_top_volume_pairs(self.top_volume_limit, refresh=False)
 
             if self.top_volume_limit == 0:
                 logger.info("top_volume_limit이 0으로 설정되어, 관심 종목만 모니터링합니다.")
@@ -568,60 +775,21 @@ class CryptoMonitor:
             for ticker in top_volume_pairs:
                 all_symbols_to_check.add(ticker['symbol'])
             
+            self.monitored_symbols = all_symbols_to_check
+            # 대상에서 빠진 종목의 감지기 결과는 더 이상 쓰이지 않으므로 정리
+            self.technical_analyzer.retain_analysis_cache(all_symbols_to_check)
             logger.info(f"모니터링 대상 종목 수: {len(all_symbols_to_check)}")
+            max_symbols = self.get_max_symbols_per_cycle()
+            if len(all_symbols_to_check) > max_symbols:
+                logger.warning(
+                    f"모니터링 대상 종목 수({len(all_symbols_to_check)})가 분당 요청 가중치로 "
+                    f"전체 조회 가능한 종목 수({max_symbols})보다 많아 요청이 지연될 수 있습니다."
+                )
             
-            # 3. 각 종목별 조건 확인
-            alert_messages = []
-            
-            for symbol in all_symbols_to_check:
-                # 해당 심볼의 티커 정보 찾기
-                ticker = None
-                for t in top_volume_pairs:
-                    if t['symbol'] == symbol:
-                        ticker = t
-                        break
-                
-                # 거래 대금 상위에 없는 관심종목의 경우 개별 조회
-                if not ticker and symbol in WATCHLIST:
-                    try:
-                        if self.market_type == 'futures':
-                            # Futures 개별 조회
-                            individual_ticker = self.client.futures_ticker(symbol=symbol)
-                            if individual_ticker:
-                                ticker = individual_ticker
-                        else:
-                            # Spot 개별 조회
-                            individual_ticker = self.client.get_ticker(symbol=symbol)
-                            if individual_ticker:
-                                ticker = individual_ticker
-                    except Exception as e:
-                        logger.warning(f"{symbol} 티커 정보를 가져올 수 없습니다: {e}")
-                        continue
-                
-                if ticker:
-                    alerts = self.check_conditions(ticker, symbol)
-                    
-                    if alerts:
-                        message = f"🚨 <b>알림: {symbol}</b>\n"
-                        message += self.format_ticker_info(ticker) + "\n\n"
-                        message += "<b>조건 충족:</b>\n"
-                        for alert in alerts:
-                            message += f"• {alert}\n"
-                        message += f"\n⏰ 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-                        
-                        alert_messages.append(message)
-            
-            # 4. 알림 메시지 발송
-            if alert_messages:
-                for message in alert_messages[:5]:  # 최대 5개까지만 발송
-                    await self.send_telegram_message(message)
-                    await asyncio.sleep(1)  # 메시지 간격 조절
-                
-                logger.info(f"{len(alert_messages)}개의 알림을 발송했습니다.")
-            else:
-                logger.info("조건에 맞는 종목이 없습니다.")
+            # 3. 캔들 수집 → 조건 확인 → 알림 발송 (단계별로 겹쳐서 진행)
+            await self._evaluate_symbols(all_symbols_to_check, deliver=True, budget=budget, due=due)
             
-            # 5. 거래 대금 상위 종목 정보 (선택적 발송)
+            # 4. 거래 대금 상위 종목 정보 (선택적 발송)
             if datetime.now().hour == 9 and datetime.now().minute < CHECK_INTERVAL_MINUTES:
                 market_name = "Futures" if self.market_type == 'futures' else "Spot"
                 top_5_message = f"📊 <b>오늘의 {market_name} 거래 대금 상위 5개 종목</b>\n\n"
@@ -642,47 +810,227 @@ class CryptoMonitor:
             error_message = f"🔴 모니터링 오류 발생: {str(e)}\n시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
             await self.send_telegram_message(error_message)
 
+    async def _evaluate_symbols(self, symbols, deliver: bool = False, budget: Optional[CycleBudget] = None,
+                                due: Optional[Iterable[str]] = None) -> List[str]:
+        """여러 종목의 조건을 수집 → 분석 → 알림 3단계 파이프라인으로 확인하고 알림 메시지 목록을 반환합니다.
+
+        - 수집: max_concurrent_symbols개 워커가 종목별 캔들을 주기 캐시에 채움
+        - 분석: 캔들이 준비된 종목을 analysis_batch_size개까지 모아 RSI/지표 일괄 계산 후 종목별 조건 확인
+        - 알림: deliver이면 메시지를 텔레그램으로 발송 (주기당 MAX_ALERT_MESSAGES개까지)
+        단계 사이 대기열은 pipeline_queue_size로 제한되어, 앞 종목의 분석과 알림 발송이 뒤 종목의
+        수집과 겹쳐 진행되며 느린 단계가 앞 단계를 늦춥니다 (메시지는 분석이 끝난 순서).
+        budget의 마감 시한이 지나면 아직 수집/분석을 시작하지 않은 종목은 건너뛰고, 진행 중인 종목은
+        남은 시간 안에서만 확인합니다 (건너뛴 종목 수는 budget.skipped, 종목당 제한 시간으로 제외된 종목 수는
+        budget.timed_out).
+        due가 있으면 그 타이머의 조건만 확인하며, 캔들도 해당 timeframe만 조회합니다.
+        """
+        symbols = list(symbols)
+        if budget is not None:
+            budget.total += len(symbols)
+        workers = max(1, self.max_concurrent_symbols or 1)
+        # 종목별 확인은 max_concurrent_symbols개까지 동시에 실행
+        semaphore = asyncio.Semaphore(workers)
+        
+        fetch_queue: asyncio.Queue = asyncio.Queue()
+        for symbol in symbols:
+            fetch_queue.put_nowait(symbol)
+        for _ in range(workers):
+            fetch_queue.put_nowait(DONE)
+        analysis_queue: asyncio.Queue = asyncio.Queue(self.pipeline_queue_size)
+        alert_queue: asyncio.Queue = asyncio.Queue(self.pipeline_queue_size)
+        fetch_stats = StageStats("수집", fetch_queue, workers)
+        analysis_stats = StageStats("분석", analysis_queue)
+        alert_stats = StageStats("알림", alert_queue)
+        alert_messages: List[str] = []
+        
+        async def fetch(batch):
+            if budget is not None and budget.expired():
+                budget.skipped += len(batch)
+                return []
+            # 캔들 조회(거래소 응답, 요청 한도 대기 포함)도 종목당 제한 시간 안에서만 기다림
+            timeout = self._symbol_timeout(budget)
+            try:
+                # 캔들이 부족한 종목도 분석 단계로 넘겨 기존과 같이 경고를 남김
+                await asyncio.wait_for(self.technical_analyzer.prefetch_candles(batch[0]), timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"{batch[0]} 캔들 조회 시간 초과 ({timeout:.1f}초) - 이번 주기에서 제외")
+                if budget is not None:
+                    budget.record_timeout(len(batch))
+                return []
+            return batch
+        
+        async def analyze(batch):
+            return await self._analyze_symbols(batch, semaphore, budget)
+        
+        async def send(batch):
+            for message in batch:
+                alert_messages.append(message)
+                if budget is not None:
+                    budget.alerts += 1
+                if deliver and len(alert_messages) <= MAX_ALERT_MESSAGES:
+                    await self.send_telegram_message(message)
+                    await asyncio.sleep(1)  # 메시지 간격 조절
+            return []
+        
+        # 주기 캐시: (symbol, timeframe)마다 캔들을 한 번만 조회해 모든 조건이 공유
+        self._cycle_due = set(due) if due is not None else None
+        self.technical_analyzer.begin_cycle(self.get_candle_window_sizes())
+        try:
+            await asyncio.gather(
+                run_stage(fetch_stats, fetch, analysis_queue),
+                run_stage(analysis_stats, analyze, alert_queue, batch_size=max(1, self.analysis_batch_size or 1)),
+                run_stage(alert_stats, send)
+            )
+        finally:
+            self.technical_analyzer.end_cycle()
+            self._cycle_due = None
+        
+        self.pipeline_stats = [fetch_stats, analysis_stats, alert_stats]
+        for stats in self.pipeline_stats:
+            logger.info(f"파이프라인 {stats.summary()}")
+        limiter = self.market_data.limiter
+        logger.info(f"요청 가중치 사용량: {limiter.used_weight}/{limiter.weight_limit} (여유 {limiter.headroom})")
+        if deliver:
+            if alert_messages:
+                logger.info(f"{len(alert_messages)}개의 알림을 발송했습니다.")
+            else:
+                logger.info("조건에 맞는 종목이 없습니다.")
+        return alert_messages
+
+    async def _analyze_symbols(self, symbols: List[str], semaphore: asyncio.Semaphore,
+                               budget: Optional[CycleBudget] = None) -> List[str]:
+        """캔들이 준비된 종목들의 RSI/지표를 일괄 계산한 뒤 종목별 조건을 확인합니다."""
+        if budget is not None and budget.expired():
+            budget.skipped += len(symbols)
+            return []
+        rsi_alerts = await self._evaluate_rsi(symbols)
+        indicator_alerts = await self._evaluate_indicators(symbols)
+        symbol_results = await asyncio.gather(*[
+            self._check_symbol_bounded(symbol, semaphore,
+                                       rsi_alerts.get(symbol) if rsi_alerts is not None else None,
+                                       indicator_alerts.get(symbol) if indicator_alerts is not None else None,
+                                       budget)
+            for symbol in symbols
+        ])
+        return [message for message in symbol_results if message]
+
+    async def _evaluate_rsi(self, symbols) -> Optional[Dict[str, List[str]]]:
+        """모든 종목의 RSI 알림을 한 번에 계산합니다 (RSI 조건이 꺼져 있으면 None)."""
+        rsi_config = MONITOR_CONDITIONS.get('rsi_conditions', {})
+        if not rsi_config.get('enabled', False):
+            return None
+        timeframes = self._due_timeframes(rsi_config.get('timeframes', ['5m', '15m']))
+        if not timeframes:
+            return {symbol: [] for symbol in symbols}
+        return await self.technical_analyzer.analyze_rsi_conditions_batch(
+            list(symbols),
+            timeframes,
+            rsi_config.get('periods', [7, 14, 21]),
+            rsi_config.get('oversold', 30),
+            rsi_config.get('overbought', 70)
+        )
+
+    async def _evaluate_indicators(self, symbols) -> Optional[Dict[str, List[str]]]:
+        """모든 종목의 지표 알림을 한 번에 계산합니다 (지표 조건이 꺼져 있으면 None)."""
+        indicator_config = MONITOR_CONDITIONS.get('indicator_conditions', {})
+        if not indicator_config.get('enabled', False):
+            return None
+        timeframes = self._due_timeframes(indicator_config.get('timeframes', ['5m', '15m']))
+        if not timeframes:
+            return {symbol: [] for symbol in symbols}
+        return await self.technical_analyzer.analyze_indicator_conditions_batch(
+            list(symbols),
+            timeframes,
+            indicator_config
+        )
+
+    def _symbol_timeout(self, budget: Optional[CycleBudget] = None) -> Optional[float]:
+        """종목당 제한 시간 (주기 마감 시한까지 남은 시간이 더 짧으면 그 시간, 제한 없으면 None)"""
+        timeout = self.symbol_timeout_seconds
+        remaining = budget.remaining() if budget is not None else None
+        if remaining is not None and (timeout is None or remaining < timeout):
+            timeout = remaining
+        return timeout
+
+    async def _check_symbol_bounded(self, symbol: str, semaphore: asyncio.Semaphore,
+                                    rsi_alerts: Optional[List[str]] = None,
+                                    indicator_alerts: Optional[List[str]] = None,
+                                    budget: Optional[CycleBudget] = None) -> Optional[str]:
+        """동시 실행 수와 종목당 제한 시간(주기 마감 시한이 더 가까우면 그때까지) 안에서 한 종목의 조건을 확인합니다.
+
+        제한 시간을 넘기면 그 종목은 이번 주기에서 제외하며, 알림 캐시/previous_data는 바뀌지 않습니다.
+        """
+        async with semaphore:
+            # 동시 실행 자리를 기다리는 사이 시한이 지났으면 시작하지 않음
+            if budget is not None and budget.expired():
+                budget.skipped += 1
+                return None
+            timeout = self._symbol_timeout(budget)
+            try:
+                result = await asyncio.wait_for(self._check_symbol(symbol, rsi_alerts, indicator_alerts), timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"{symbol} 조건 확인 시간 초과 ({timeout:.1f}초) - 이번 주기에서 제외")
+                if budget is not None:
+                    budget.record_timeout()
+                return None
+            if budget is not None:
+                budget.checked += 1
+            return result
+
+    async def _check_symbol(self, symbol: str, rsi_alerts: Optional[List[str]] = None,
+                            indicator_alerts: Optional[List[str]] = None) -> Optional[str]:
+        """한 종목의 조건을 확인하고 알림 메시지를 반환합니다 (없으면 None)."""
+        # 관심종목과 거래 대금 상위 종목 모두 티커 스냅샷에서 조회
+        ticker = self.ticker_snapshot.get(symbol)
+        if not ticker:
+            logger.warning(f"{symbol} 티커 정보를 가져올 수 없습니다: 티커 스냅샷에 없음")
+            return None
+        
+        lock = self._symbol_locks.setdefault(symbol, asyncio.Lock())
+        async with lock:
+            alerts = await self.check_conditions(ticker, symbol, rsi_alerts, indicator_alerts)
+        if not alerts:
+            return None
+        
+        message = f"🚨 <b>알림: {symbol}</b>\n"
+        message += self.format_ticker_info(ticker) + "\n\n"
+        message += "<b>조건 충족:</b>\n"
+        for alert in alerts:
+            message += f"• {alert}\n"
+        message += f"\n⏰ 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        return message
+
     async def run_continuous_monitoring(self):
         """지속적인 모니터링을 스마트 스케줄링으로 실행합니다."""
-        smallest_tf_minutes = self.get_smallest_timeframe_minutes()
+        if self.data_mode == 'streaming':
+            await self.run_streaming_monitoring()
+            return
+        
+        scheduler = self.candle_scheduler
         
         logger.info(f"지속적 모니터링 시작")
-        logger.info(f"  - 가장 작은 타임프레임: {smallest_tf_minutes}분")
-        logger.info(f"  - 기본 체크 간격: {CHECK_INTERVAL_MINUTES}분")
+        logger.info(f"  - 봉 마감 타이머: {', '.join(scheduler.periods)} (UTC 봉 경계 기준)")
+        logger.info(f"  - 티커 조건 확인 간격: {CHECK_INTERVAL_MINUTES}분")
         
-        # 첫 번째 즉시 실행
+        # 첫 번째 즉시 실행 (모든 조건, 마감 시한은 다음 봉 마감)
         logger.info("🚀 시작 시 즉시 모니터링 실행...")
         try:
-            await self.monitor_markets()
+            await self.run_scheduled_cycle()
         except Exception as e:
             logger.error(f"초기 모니터링 오류: {e}")
         
-        # 다음 봉 마감까지 대기 후 실행
-        next_candle_time = self.get_next_candle_close_time(smallest_tf_minutes)
-        wait_seconds = (next_candle_time - datetime.now()).total_seconds()
-        
-        if wait_seconds > 0:
-            logger.info(f"⏰ 다음 {smallest_tf_minutes}분봉 마감까지 {wait_seconds:.0f}초 대기...")
-            logger.info(f"   다음 실행 시간: {next_candle_time.strftime('%Y-%m-%d %H:%M:%S')}")
-            await asyncio.sleep(wait_seconds)
-        
-        # 봉 마감 시점에 한 번 실행
-        logger.info(f"📊 {smallest_tf_minutes}분봉 마감 - 모니터링 실행...")
-        try:
-            await self.monitor_markets()
-        except Exception as e:
-            logger.error(f"봉 마감 시점 모니터링 오류: {e}")
-        
-        # 이후부터는 정기적인 간격으로 실행
-        logger.info(f"🔄 정기 모니터링 시작 (간격: {CHECK_INTERVAL_MINUTES}분)")
-        
         while True:
             try:
-                # CHECK_INTERVAL_MINUTES 간격으로 대기
-                await asyncio.sleep(CHECK_INTERVAL_MINUTES * 60)
+                # 주기 실행 시간과 상관없이 다음 봉 마감에 시작 (이미 지난 마감은 건너뜀)
+                close_at, due = scheduler.next_close()
+                wait_seconds = close_at - time.time()
+                if wait_seconds > 0:
+                    logger.info(f"⏰ 다음 봉 마감({', '.join(due)})까지 {wait_seconds:.0f}초 대기 "
+                                f"(다음 실행 시간: {datetime.fromtimestamp(close_at).strftime('%Y-%m-%d %H:%M:%S')})")
+                    await asyncio.sleep(wait_seconds)
                 
-                logger.info(f"⏰ 정기 모니터링 실행 ({datetime.now().strftime('%H:%M:%S')})")
-                await self.monitor_markets()
+                logger.info(f"📊 봉 마감 ({', '.join(due)}) - 모니터링 실행")
+                await self.run_scheduled_cycle(due, close_at)
                 
             except KeyboardInterrupt:
                 logger.info("사용자에 의해 모니터링이 중단되었습니다.")
@@ -691,14 +1039,137 @@ class CryptoMonitor:
                 logger.error(f"지속적 모니터링 오류: {e}")
                 await asyncio.sleep(60)  # 오류 시 1분 후 재시도
 
+    async def run_scheduled_cycle(self, due: Optional[List[str]] = None,
+                                  started_at: Optional[float] = None) -> CycleBudget:
+        """due 타이머의 조건을 다음 봉 마감(에서 여유 시간을 뺀 시각)까지의 마감 시한으로 실행합니다.
+
+        started_at은 이번 주기의 봉 마감 시각이며 (sleep이 조금 일찍 깨어나도 같은 마감을 다음
+        마감으로 잡지 않도록), 시한 안에 확인하지 못한 종목은 건너뛰고 예산 사용량을 기록합니다.
+        """
+        now = time.time()
+        next_close, _ = self.candle_scheduler.next_close(max(now, started_at or now))
+        budget = CycleBudget.until(next_close, self.cycle_deadline_margin_seconds, now)
+        try:
+            await self.monitor_markets(budget, due)
+        finally:
+            self._finish_cycle_budget(budget)
+        
+        # 주기가 다음 봉 마감을 넘겼다면 밀린 주기를 몰아서 실행하지 않고 건너뜀
+        overrun = time.time() - next_close
+        if overrun > 0:
+            logger.warning(f"⚠️ 주기가 다음 봉 마감을 {overrun:.1f}초 넘김 - 밀린 봉 마감은 건너뛰고 다음 마감에 실행")
+        return budget
+
+    def _finish_cycle_budget(self, budget: CycleBudget):
+        """주기 예산 사용량을 기록합니다."""
+        budget.finish()
+        self.last_cycle_budget = budget
+        if budget.partial:
+            logger.warning(f"⚠️ 주기 마감 시한 도달 - 부분 결과: {budget.summary()}")
+        else:
+            logger.info(f"⏱️ 주기 예산 사용: {budget.summary()}")
+
+    async def run_streaming_monitoring(self):
+        """WebSocket kline 스트림으로 봉 마감 즉시 조건을 확인합니다.
+
+        REST 주기 조회 대신, 마감된 캔들이 도착하면 해당 종목만 바로 분석합니다.
+        모니터링 대상 종목은 CHECK_INTERVAL_MINUTES마다 다시 계산해 구독을 갱신합니다.
+        """
+        logger.info("📡 스트리밍 모니터링 시작")
+        
+        # 시작 시 REST로 한 번 실행해 종목 목록과 캔들 저장소를 채움 (warm-up)
+        try:
+            await self.monitor_markets()
+        except Exception as e:
+            logger.error(f"초기 모니터링 오류: {e}")
+        
+        symbols = set(self.monitored_symbols)
+        stream, stream_task = self._start_kline_stream(symbols)
+        try:
+            while True:
+                await asyncio.sleep(CHECK_INTERVAL_MINUTES * 60)
+                try:
+                    top_volume_pairs = await self.get_top_volume_pairs(self.top_volume_limit)
+                    latest_symbols = set(WATCHLIST.keys()) | {t['symbol'] for t in top_volume_pairs}
+                except Exception as e:
+                    logger.error(f"모니터링 대상 종목 갱신 오류: {e}")
+                    continue
+                
+                if latest_symbols and latest_symbols != symbols:
+                    logger.info(f"🔄 모니터링 대상 변경 - 스트림 재구독 ({len(latest_symbols)}개 종목)")
+                    await stream.stop()
+                    await stream_task
+                    symbols = latest_symbols
+                    self.monitored_symbols = symbols
+                    stream, stream_task = self._start_kline_stream(symbols)
+        finally:
+            await stream.stop()
+            await stream_task
+
+    def _start_kline_stream(self, symbols):
+        """모니터링 대상 종목의 kline 스트림 구독을 시작합니다."""
+        candle_store = self.technical_analyzer.candle_store
+        stream = KlineStream(
+            market_type=self.market_type,
+            symbols=symbols,
+            intervals=self.get_fetch_timeframes(),
+            on_kline=self._on_stream_kline,
+            on_connect=lambda keys: candle_store.set_live(keys, True),
+            on_disconnect=lambda keys: candle_store.set_live(keys, False)
+        )
+        return stream, asyncio.ensure_future(stream.run())
+
+    def _on_stream_kline(self, symbol: str, interval: str, row: List, is_closed: bool):
+        """스트림 kline을 캔들 저장소에 반영하고, 마감된 캔들이면 분석을 예약합니다."""
+        self.technical_analyzer.candle_store.apply_kline(symbol, interval, row, is_closed)
+        if not is_closed:
+            return
+        
+        self._pending_symbols.add(symbol)
+        self._pending_closes.add(int(row[6]) // 1000 + 1)  # 마감 시간(ms, 다음 봉 시작 - 1ms) → 봉 경계
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.ensure_future(self._flush_closed_candles())
+
+    async def _flush_closed_candles(self):
+        """캔들이 마감된 종목들을 모아서 분석하고 알림을 발송합니다."""
+        while self._pending_symbols:
+            await asyncio.sleep(STREAM_BATCH_DELAY_SECONDS)
+            symbols, self._pending_symbols = self._pending_symbols, set()
+            closes, self._pending_closes = self._pending_closes, set()
+            # 마감된 봉 경계에 해당하는 timeframe(리샘플링되는 큰 timeframe 포함)의 조건만 확인
+            due = self.candle_scheduler.due_at(closes)
+            logger.info(f"📊 봉 마감 ({', '.join(due)}) - {len(symbols)}개 종목 분석")
+            # 다음 봉 마감 전에 끝나도록 마감 시한 적용
+            next_close, _ = self.candle_scheduler.next_close(max([time.time(), *closes]))
+            budget = CycleBudget.until(next_close, self.cycle_deadline_margin_seconds)
+            try:
+                await self.refresh_ticker_snapshot()
+                await self._evaluate_symbols(symbols, deliver=True, budget=budget, due=due)
+            except Exception as e:
+                logger.error(f"봉 마감 분석 오류: {e}")
+            finally:
+                self._finish_cycle_budget(budget)
+
+    async def close(self):
+        """시세 클라이언트 세션과 분석 프로세스 풀을 정리합니다."""
+        await self.market_data.close()
+        if self.technical_analyzer.analysis_pool is not None:
+            self.technical_analyzer.analysis_pool.close()
+
+    async def _run_and_close(self, coro):
+        try:
+            await coro
+        finally:
+            await self.close()
+
     def run_once(self):
         """한 번만 모니터링을 실행합니다."""
         logger.info("단일 모니터링 실행...")
-        asyncio.run(self.monitor_markets())
+        asyncio.run(self._run_and_close(self.monitor_markets()))
 
     def run_continuous(self):
         """지속적 모니터링을 시작합니다."""
-        asyncio.run(self.run_continuous_monitoring())
+        asyncio.run(self._run_and_close(self.run_continuous_monitoring()))
 
 
 if __name__ == "__main__":
@@ -709,6 +1180,10 @@ if __name__ == "__main__":
     if len(sys.argv) > 1 and sys.argv[1] == "once":
         # 한 번만 실행
         monitor.run_once()
+    elif len(sys.argv) > 1 and sys.argv[1] == "stream":
+        # WebSocket 스트리밍 모드로 실행
+        monitor.data_mode = 'streaming'
+        monitor.run_continuous()
     else:
         # 지속적 실행
         monitor.run_continuous()
@@ -0,0 +1,727 @@
+import importlib.util
+import logging
+import math
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from candles import CandleArrays
+from market_data import INTERVAL_MS
+
+logger = logging.getLogger(__name__)
+
+# RSI/피벗/다이버전스 반복문 실행 방식: numba가 설치되어 있으면 컴파일된 커널, 없으면 NumPy/Python 반복문
+# numba는 import 자체가 느리므로 여기서는 설치 여부만 확인하고, jit_kernels는 첫 커널 호출 때 import
+_NUMBA_INSTALLED = importlib.util.find_spec('numba') is not None
+_backend = 'numba' if _NUMBA_INSTALLED else 'numpy'
+_jit = None
+
+
+def backend() -> str:
+    """현재 지표 커널 백엔드 ('numba' 또는 'numpy')"""
+    return _backend
+
+
+def set_backend(name: str) -> str:
+    """지표 커널 백엔드를 바꾸고 이전 값을 반환합니다 (numba가 없으면 'numpy'만 가능)."""
+    global _backend
+    if name not in ('numba', 'numpy'):
+        raise ValueError(f"알 수 없는 백엔드: {name}")
+    if name == 'numba' and not _NUMBA_INSTALLED:
+        raise ValueError("numba가 설치되어 있지 않습니다.")
+    previous, _backend = _backend, name
+    return previous
+
+
+def _use_jit() -> bool:
+    """numba 백엔드이면 jit_kernels를 (처음 한 번) import하고 True를 반환합니다."""
+    global _backend, _jit
+    if _backend != 'numba':
+        return False
+    if _jit is None:
+        import jit_kernels
+        if not jit_kernels.AVAILABLE:
+            logger.warning("numba를 불러올 수 없어 NumPy 구현을 사용합니다.")
+            _backend = 'numpy'
+            return False
+        _jit = jit_kernels
+    return True
+
+
+def _wilder_step(average: float, value: float, alpha: float, decay: float) -> float:
+    """pandas ewm(adjust=False)와 같은 순서로 계산한 Wilder 평활 한 단계"""
+    if average == value:
+        return average
+    return (decay * average + alpha * value) / (decay + alpha)
+
+
+def _wilder_alpha(period):
+    """pandas ewm(alpha=1/period)가 실제로 쓰는 alpha (alpha → com → alpha 변환 후 값)
+
+    com = (1 - alpha) / alpha로 바꾼 뒤 1 / (1 + com)을 쓰므로 기간에 따라 1/period와 마지막 비트가 다릅니다.
+    """
+    alpha = 1.0 / period
+    return 1.0 / (1.0 + (1.0 - alpha) / alpha)
+
+
+def _rsi_value(avg_gain: float, avg_loss: float) -> float:
+    if avg_loss == 0:
+        return 100.0
+    return 100 - (100 / (1 + avg_gain / avg_loss))
+
+
+def rsi_series(close: np.ndarray, period: int) -> np.ndarray:
+    """ta.momentum.RSIIndicator(close, window=period).rsi()와 비트 단위로 같은 RSI 배열
+
+    첫 캔들의 상승/하락폭을 0으로 두고 alpha=1/period로 평활하며, 앞의 period-1개는 NaN입니다.
+    numba 백엔드이면 컴파일된 커널을 쓰고, 아니면 값마다 Python 반복문으로 계산합니다.
+    """
+    close = np.asarray(close, dtype=np.float64)
+    if _use_jit():
+        return _jit.wilder_rsi(close, period, _wilder_alpha(period))
+    n = len(close)
+    out = np.full(n, np.nan)
+    if n == 0:
+        return out
+
+    diff = np.diff(close, prepend=close[0])
+    gains = np.where(diff > 0, diff, 0.0).tolist()
+    losses = np.where(diff < 0, -diff, 0.0).tolist()
+    alpha = _wilder_alpha(period)
+    decay = 1.0 - alpha
+    denominator = decay + alpha
+
+    avg_gain = avg_loss = 0.0
+    values = [np.nan] * n
+    for i in range(n):
+        gain = gains[i]
+        loss = losses[i]
+        if avg_gain != gain:
+            avg_gain = (decay * avg_gain + alpha * gain) / denominator
+        if avg_loss != loss:
+            avg_loss = (decay * avg_loss + alpha * loss) / denominator
+        if i + 1 >= period:
+            values[i] = 100.0 if avg_loss == 0 else 100 - (100 / (1 + avg_gain / avg_loss))
+    out[:] = values
+    return out
+
+
+def ema(values: np.ndarray, period: int) -> np.ndarray:
+    """ta.trend.EMAIndicator(close, window=period).ema_indicator()와 비트 단위로 같은 EMA 배열
+
+    pandas ewm(span=period, adjust=False)와 같은 순서로 계산하며, 앞의 period-1개는 NaN입니다.
+    값마다 Python 반복문으로 계산합니다 (numba 커널 없음).
+    """
+    values = np.asarray(values, dtype=np.float64)
+    n = len(values)
+    out = np.full(n, np.nan)
+    if n == 0:
+        return out
+
+    # pandas는 span을 com으로 바꾼 뒤 alpha를 구함
+    alpha = 1.0 / (1.0 + (period - 1) / 2.0)
+    decay = 1.0 - alpha
+    denominator = decay + alpha
+
+    data = values.tolist()
+    result = [np.nan] * n
+    average = data[0]
+    for i in range(n):
+        value = data[i]
+        if i and average != value:
+            average = (decay * average + alpha * value) / denominator
+        if i + 1 >= period:
+            result[i] = average
+    out[:] = result
+    return out
+
+
+def sma(values: np.ndarray, period: int) -> np.ndarray:
+    """ta.trend.SMAIndicator(close, window=period).sma_indicator()와 비트 단위로 같은 SMA 배열
+
+    pandas rolling mean처럼 Kahan 보정 합계를 더하고 빼며 갱신하므로 캔들당 O(1)이지만,
+    값마다 Python 반복문으로 계산합니다 (numba 커널 없음).
+    """
+    data = np.asarray(values, dtype=np.float64).tolist()
+    n = len(data)
+    out = np.full(n, np.nan)
+    total = add_compensation = remove_compensation = 0.0
+    negatives = 0
+    same_count = 0
+    previous = data[0] if n else 0.0
+    result = [np.nan] * n
+    for i in range(n):
+        value = data[i]
+        # 창에서 빠지는 값을 먼저 빼고 새 값을 더함 (pandas와 같은 순서)
+        if i >= period:
+            old = data[i - period]
+            y = -old - remove_compensation
+            t = total + y
+            remove_compensation = t - total - y
+            total = t
+            if old < 0 or (old == 0 and math.copysign(1.0, old) < 0):
+                negatives -= 1
+        y = value - add_compensation
+        t = total + y
+        add_compensation = t - total - y
+        total = t
+        if value < 0 or (value == 0 and math.copysign(1.0, value) < 0):
+            negatives += 1
+        same_count = same_count + 1 if value == previous else 1
+        previous = value
+        if i + 1 >= period:
+            mean = total / period
+            if same_count >= period:
+                mean = previous
+            elif negatives == 0 and mean < 0:
+                mean = 0.0
+            elif negatives == period and mean > 0:
+                mean = 0.0
+            result[i] = mean
+    out[:] = result
+    return out
+
+
+def _wilder_rsi_kernel(close: np.ndarray, periods: np.ndarray
+                       ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """(symbols × bars) 종가 행렬에 대해 모든 기간의 RSI와 마지막 Wilder 상태를 계산합니다.
+
+    캔들 축으로만 반복하고 (기간 × 종목) 축은 한 번에 계산합니다. 길이가 짧은 종목은
+    앞을 NaN으로 채우면 되고, 각 행은 첫 유효 종가부터 rsi_series와 같은 값이 됩니다.
+    반환: (rsi (P, S, N), avg_gain (P, S), avg_loss (P, S), 유효 캔들 수 (S,))
+    """
+    close = np.atleast_2d(np.asarray(close, dtype=np.float64))
+    if _use_jit():
+        return _jit.wilder_rsi_matrix(close, periods, _wilder_alpha(periods.astype(np.float64)))
+    n_symbols, n_bars = close.shape
+    alpha = _wilder_alpha(periods.astype(np.float64))[:, None]
+    decay = 1.0 - alpha
+    denominator = decay + alpha
+
+    valid = ~np.isnan(close)
+    start = np.where(valid.any(axis=1), valid.argmax(axis=1), n_bars)
+    diff = np.zeros_like(close)
+    diff[:, 1:] = close[:, 1:] - close[:, :-1]
+    with np.errstate(invalid='ignore'):
+        gains = np.where(diff > 0, diff, 0.0)
+        losses = np.where(diff < 0, -diff, 0.0)
+
+    avg_gain = np.zeros((len(periods), n_symbols))
+    avg_loss = np.zeros((len(periods), n_symbols))
+    rsi = np.full((len(periods), n_symbols, n_bars), np.nan)
+    for j in range(n_bars):
+        active = j >= start
+        gain = gains[:, j]
+        loss = losses[:, j]
+        avg_gain = np.where(active & (avg_gain != gain),
+                            (decay * avg_gain + alpha * gain) / denominator, avg_gain)
+        avg_loss = np.where(active & (avg_loss != loss),
+                            (decay * avg_loss + alpha * loss) / denominator, avg_loss)
+        ready = (j - start + 1)[None, :] >= periods[:, None]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            value = np.where(avg_loss == 0, 100.0, 100 - (100 / (1 + avg_gain / avg_loss)))
+        rsi[:, :, j] = np.where(ready, value, np.nan)
+    return rsi, avg_gain, avg_loss, np.maximum(n_bars - start, 0)
+
+
+def rsi_matrix(close: np.ndarray, periods: Iterable[int]) -> np.ndarray:
+    """여러 종목 × 여러 기간의 RSI를 한 번에 계산합니다.
+
+    close는 (symbols, bars) 행렬(짧은 종목은 앞을 NaN으로 채움)이고, 결과는 (periods, symbols, bars)
+    배열입니다. 각 [p, s]는 rsi_series(close[s], periods[p])와 비트 단위로 같습니다.
+    """
+    return _wilder_rsi_kernel(close, np.asarray(list(periods), dtype=np.int64))[0]
+
+
+def pad_closes(candles_list: List[CandleArrays], closed: Optional[List[int]] = None) -> np.ndarray:
+    """종목별 종가를 오른쪽 정렬한 (symbols, bars) 행렬로 만듭니다 (앞은 NaN)."""
+    lengths = [len(c) if closed is None else closed[i] for i, c in enumerate(candles_list)]
+    width = max(lengths, default=0)
+    matrix = np.full((len(candles_list), width), np.nan)
+    for i, candles in enumerate(candles_list):
+        if lengths[i]:
+            matrix[i, width - lengths[i]:] = candles.close[:lengths[i]]
+    return matrix
+
+
+def _sliding_extreme(values: np.ndarray, window: int, ufunc: np.ufunc) -> np.ndarray:
+    """마지막 축 기준 길이 window 구간의 최솟값/최댓값 (van Herk/Gil-Werman, O(n))
+
+    결과의 j번째는 values[..., j:j + window]의 극값이고 길이는 n - window + 1입니다.
+    구간에 NaN이 있으면 NaN입니다.
+    """
+    n = values.shape[-1]
+    blocks = -(-n // window)
+    padded = np.full(values.shape[:-1] + (blocks * window,), np.nan)
+    padded[..., :n] = values
+    shaped = padded.reshape(values.shape[:-1] + (blocks, window))
+    prefix = ufunc.accumulate(shaped, axis=-1).reshape(padded.shape)
+    suffix = ufunc.accumulate(shaped[..., ::-1], axis=-1)[..., ::-1].reshape(padded.shape)
+    return ufunc(suffix[..., :n - window + 1], prefix[..., window - 1:n])
+
+
+def pivot_masks(values: np.ndarray, left_bars: int, right_bars: int) -> Tuple[np.ndarray, np.ndarray]:
+    """피벗 로우/하이 위치를 불리언 배열로 반환합니다 (1차원 또는 (series, bars) 2차원).
+
+    피벗 로우는 왼쪽 left_bars개와 오른쪽 right_bars개 값보다 모두 '작은' 지점,
+    피벗 하이는 모두 '큰' 지점입니다. 같은 값이나 NaN이 섞인 구간은 피벗이 아닙니다.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if values.size and _use_jit():
+        lows, highs = _jit.pivot_scan(values.reshape(-1, values.shape[-1]), left_bars, right_bars)
+        return lows.reshape(values.shape), highs.reshape(values.shape)
+    n = values.shape[-1]
+    lows = np.zeros(values.shape, dtype=bool)
+    highs = np.zeros(values.shape, dtype=bool)
+    if n < left_bars + right_bars + 1:
+        return lows, highs
+
+    center = values[..., left_bars:n - right_bars]
+    is_low = np.ones(center.shape, dtype=bool)
+    is_high = np.ones(center.shape, dtype=bool)
+    with np.errstate(invalid='ignore'):
+        if left_bars:
+            # i번째 후보의 왼쪽 구간은 i - left_bars부터 시작
+            is_low &= center < _sliding_extreme(values[..., :n - right_bars - 1], left_bars, np.minimum)
+            is_high &= center > _sliding_extreme(values[..., :n - right_bars - 1], left_bars, np.maximum)
+        if right_bars:
+            # 오른쪽 구간은 후보 바로 다음 캔들부터 시작
+            is_low &= center < _sliding_extreme(values[..., left_bars + 1:], right_bars, np.minimum)
+            is_high &= center > _sliding_extreme(values[..., left_bars + 1:], right_bars, np.maximum)
+    lows[..., left_bars:n - right_bars] = is_low
+    highs[..., left_bars:n - right_bars] = is_high
+    return lows, highs
+
+
+def find_divergences(rsi: np.ndarray, low: np.ndarray, high: np.ndarray, left_bars: int,
+                     right_bars: int, lookback_range: Tuple[int, int],
+                     include_hidden: bool = True) -> List[Dict]:
+    """연속된 RSI 피벗 쌍에서 Pine Script 방식의 Regular/Hidden 다이버전스를 찾습니다.
+
+    RSI 피벗 로우끼리 비교해 bullish를, 피벗 하이끼리 비교해 bearish를 판단하며
+    가격은 같은 캔들의 저가/고가를 씁니다. 두 피벗 간격이 lookback_range 안에 있어야 하고,
+    피벗 index는 right_bars 캔들 뒤(index + right_bars)에 확정됩니다.
+    """
+    rsi = np.asarray(rsi, dtype=np.float64)
+    low = np.asarray(low, dtype=np.float64)
+    high = np.asarray(high, dtype=np.float64)
+    lows, highs = pivot_masks(rsi, left_bars, right_bars)
+    min_gap, max_gap = lookback_range
+
+    if _use_jit():
+        kinds, indices, previous = _jit.divergence_scan(rsi, low, high, lows, highs,
+                                                               min_gap, max_gap, include_hidden)
+        found = []
+        for code, cur, prev in zip(kinds.tolist(), indices.tolist(), previous.tolist()):
+            price = low if code < 2 else high
+            found.append({
+                'kind': _jit.DIVERGENCE_KINDS[code],
+                'index': cur,
+                'prev_index': prev,
+                'rsi': float(rsi[cur]),
+                'prev_rsi': float(rsi[prev]),
+                'price': float(price[cur]),
+                'prev_price': float(price[prev]),
+            })
+        return found
+
+    found = []
+    for mask, price, kinds in ((lows, low, ('regular_bullish', 'hidden_bullish')),
+                               (highs, high, ('regular_bearish', 'hidden_bearish'))):
+        pivots = np.flatnonzero(mask)
+        if len(pivots) < 2:
+            continue
+        prev, cur = pivots[:-1], pivots[1:]
+        gap = cur - prev
+        in_range = (gap >= min_gap) & (gap <= max_gap)
+        rsi_up = rsi[cur] > rsi[prev]
+        rsi_down = rsi[cur] < rsi[prev]
+        price_up = price[cur] > price[prev]
+        price_down = price[cur] < price[prev]
+
+        if kinds[0] == 'regular_bullish':
+            # 가격은 더 낮은 저점, RSI는 더 높은 저점 (Hidden은 반대)
+            conditions = {'regular_bullish': rsi_up & price_down, 'hidden_bullish': rsi_down & price_up}
+        else:
+            # 가격은 더 높은 고점, RSI는 더 낮은 고점 (Hidden은 반대)
+            conditions = {'regular_bearish': rsi_down & price_up, 'hidden_bearish': rsi_up & price_down}
+
+        for kind in kinds:
+            if kind.startswith('hidden') and not include_hidden:
+                continue
+            for k in np.flatnonzero(in_range & conditions[kind]):
+                found.append({
+                    'kind': kind,
+                    'index': int(cur[k]),
+                    'prev_index': int(prev[k]),
+                    'rsi': float(rsi[cur[k]]),
+                    'prev_rsi': float(rsi[prev[k]]),
+                    'price': float(price[cur[k]]),
+                    'prev_price': float(price[prev[k]]),
+                })
+    found.sort(key=lambda d: d['index'])
+    return found
+
+
+def immediate_divergence(close: np.ndarray, rsi_period: int,
+                         rsi: Optional[np.ndarray] = None) -> Optional[Dict]:
+    """마지막 캔들과 바로 이전 캔들의 가격/RSI 변화가 엇갈리는지 확인합니다.
+
+    가격 0.5% 이상, RSI 2포인트 이상 반대로 움직이면 {'kind', 'price_change', 'rsi_change'}를 반환합니다.
+    rsi를 주면 (close와 같은 길이) 다시 계산하지 않습니다.
+    """
+    if rsi is None:
+        rsi = rsi_series(close, rsi_period)
+    valid = ~np.isnan(rsi)
+    close = np.asarray(close, dtype=np.float64)[valid]
+    rsi = rsi[valid]
+    if len(close) < 10:
+        return None
+
+    price_change = ((close[-1] - close[-2]) / close[-2]) * 100
+    rsi_change = rsi[-1] - rsi[-2]
+    if abs(price_change) < 0.5 or abs(rsi_change) < 2:
+        return None
+    if price_change < 0 and rsi_change > 0:
+        kind = 'bullish'
+    elif price_change > 0 and rsi_change < 0:
+        kind = 'bearish'
+    else:
+        return None
+    return {'kind': kind, 'price_change': float(price_change), 'rsi_change': float(rsi_change)}
+
+
+def lookback_divergence(close: np.ndarray, rsi_period: int, lookback_periods: int,
+                        rsi: Optional[np.ndarray] = None) -> Optional[Dict]:
+    """마지막 캔들을 lookback_periods 범위의 과거 캔들과 한 번에 비교해 첫 다이버전스를 찾습니다.
+
+    Regular(RSI 3포인트 이상)를 먼저 찾고 없으면 Hidden(2포인트 이상)을 찾으며,
+    {'kind', 'price_change', 'rsi_change', 'bars'}를 반환합니다 (rsi_change는 절댓값).
+    rsi를 주면 (close와 같은 길이) 다시 계산하지 않습니다.
+    """
+    if rsi is None:
+        rsi = rsi_series(close, rsi_period)
+    valid = ~np.isnan(rsi)
+    close = np.asarray(close, dtype=np.float64)[valid]
+    rsi = rsi[valid]
+    if len(close) < lookback_periods:
+        return None
+
+    if _use_jit():
+        code, offset = _jit.lookback_scan(close, rsi, lookback_periods)
+        if code < 0:
+            return None
+        past_close = close[-(offset + 1)]
+        past_rsi = rsi[-(offset + 1)]
+        price_change = ((close[-1] - past_close) / past_close) * 100
+        # bullish Regular와 bearish Hidden은 가격 하락 + RSI 상승
+        rsi_change = rsi[-1] - past_rsi if code in (0, 3) else past_rsi - rsi[-1]
+        return {'kind': _jit.DIVERGENCE_KINDS[code], 'price_change': float(price_change),
+                'rsi_change': float(rsi_change), 'bars': int(offset)}
+
+    current_close = close[-1]
+    current_rsi = rsi[-1]
+    # 최소 5개 이전부터 검사
+    offsets = np.arange(5, min(lookback_periods, len(close) - 1))
+    past_close = close[-(offsets + 1)]
+    past_rsi = rsi[-(offsets + 1)]
+    price_down = (current_close < past_close) & (current_rsi > past_rsi)
+    price_up = (current_close > past_close) & (current_rsi < past_rsi)
+    rsi_rise = current_rsi - past_rsi
+    rsi_fall = past_rsi - current_rsi
+
+    # Regular: 가격 하락 + RSI 상승(Bullish) 또는 가격 상승 + RSI 하락(Bearish)
+    regular = (price_down & (rsi_rise >= 3)) | (price_up & (rsi_fall >= 3))
+    if regular.any():
+        j = int(np.argmax(regular))
+        kind = 'regular_bullish' if price_down[j] else 'regular_bearish'
+    else:
+        # Hidden: 가격 상승 + RSI 하락(Bullish, 상승 추세) 또는 가격 하락 + RSI 상승(Bearish, 하락 추세)
+        hidden = (price_up & (rsi_fall >= 2)) | (price_down & (rsi_rise >= 2))
+        if not hidden.any():
+            return None
+        j = int(np.argmax(hidden))
+        kind = 'hidden_bullish' if price_up[j] else 'hidden_bearish'
+
+    price_change = ((current_close - past_close[j]) / past_close[j]) * 100
+    rsi_change = rsi_rise[j] if price_down[j] else rsi_fall[j]
+    return {'kind': kind, 'price_change': float(price_change), 'rsi_change': float(rsi_change),
+            'bars': int(offsets[j])}
+
+
+def closed_count(timestamp: np.ndarray, interval: str, now: Optional[float] = None) -> int:
+    """앞에서부터 마감된 캔들 수 (시작 시간 + 간격이 현재 이전이면 마감)"""
+    step = INTERVAL_MS.get(interval, INTERVAL_MS["5m"]) // 1000
+    now_s = time.time() if now is None else now
+    return int(np.searchsorted(timestamp, now_s - step, side='right'))
+
+
+def recent_pivot_divergences(timestamp: np.ndarray, close: np.ndarray, low: np.ndarray,
+                             high: np.ndarray, interval: str, rsi_period: int, left_bars: int,
+                             right_bars: int, lookback_range: Tuple[int, int], recent_bars: int,
+                             include_hidden: bool = True, now: Optional[float] = None,
+                             rsi: Optional[np.ndarray] = None) -> List[Dict]:
+    """마감된 캔들로 피벗 다이버전스를 찾고 최근 recent_bars개 캔들 안에서 확정된 것만 반환합니다.
+
+    각 결과에는 find_divergences 항목에 피벗 캔들 시작 시간 'timestamp'(초)가 추가됩니다.
+    rsi를 주면 (timestamp와 같은 길이) 다시 계산하지 않습니다.
+    """
+    # 진행 중인 캔들은 피벗이 흔들리므로 제외
+    closed = closed_count(timestamp, interval, now)
+
+    rsi = rsi_series(close[:closed], rsi_period) if rsi is None else rsi[:closed]
+    recent = []
+    for divergence in find_divergences(rsi, low[:closed], high[:closed], left_bars, right_bars,
+                                       lookback_range, include_hidden):
+        # 피벗은 right_bars 캔들 뒤에 확정
+        if divergence['index'] + right_bars < closed - recent_bars:
+            continue
+        divergence['timestamp'] = int(timestamp[divergence['index']])
+        recent.append(divergence)
+    return recent
+
+
+# 지표 그래프에서 쓰는 전체 구간 지표: 이름 -> (candles, *params) -> candles와 같은 길이의 배열
+INDICATORS = {
+    'rsi': lambda candles, period: rsi_series(candles.close, period),
+    'ema': lambda candles, period: ema(candles.close, period),
+    'sma': lambda candles, period: sma(candles.close, period),
+}
+
+
+class IndicatorGraph:
+    """주기 단위 지표 계산 그래프
+
+    (symbol, interval, 지표 이름, 파라미터)마다 그 주기의 캔들 전체(모든 조건이 필요로 하는
+    가장 큰 창)로 한 번만 계산하고, 조건들은 필요한 길이만큼 뒤에서 잘라 씁니다.
+    같은 지표를 읽는 조건이 늘어나도 계산은 늘어나지 않습니다.
+    """
+
+    def __init__(self):
+        self._series: Dict[Tuple, Tuple[CandleArrays, np.ndarray]] = {}
+        self.computed = 0
+        self.reused = 0
+
+    def series(self, symbol: str, interval: str, candles: CandleArrays, name: str,
+               params: Tuple = ()) -> np.ndarray:
+        """candles 전체에 대한 지표 배열 (이미 계산했으면 재사용)"""
+        values = self.peek(symbol, interval, candles, name, params)
+        if values is not None:
+            self.reused += 1
+            return values
+        values = INDICATORS[name](candles, *params)
+        self._series[(symbol, interval, name, tuple(params))] = (candles, values)
+        self.computed += 1
+        return values
+
+    def peek(self, symbol: str, interval: str, candles: CandleArrays, name: str,
+             params: Tuple = ()) -> Optional[np.ndarray]:
+        """계산하지 않고 같은 캔들로 이미 계산된 지표만 반환합니다 (없으면 None)."""
+        entry = self._series.get((symbol, interval, name, tuple(params)))
+        # 주기 중 더 큰 창으로 다시 조회된 캔들이면 새로 계산해야 함
+        if entry is None or entry[0] is not candles:
+            return None
+        return entry[1]
+
+    def latest_rsi_many(self, symbols: List[str], interval: str, candles_list: List[CandleArrays],
+                        periods: Iterable[int]) -> List[Dict[int, float]]:
+        """여러 종목의 마지막 캔들 기준 RSI (RSIEngine.latest_many와 같은 형식, 데이터 부족 시 NaN)
+
+        아직 계산하지 않은 종목은 rsi_matrix 한 번으로 모든 기간을 계산해 그래프에 넣으므로,
+        같은 주기의 다이버전스 감지기도 같은 RSI 배열을 읽습니다.
+        """
+        periods = list(periods)
+        missing = [i for i, (symbol, candles) in enumerate(zip(symbols, candles_list))
+                   if any(self.peek(symbol, interval, candles, 'rsi', (p,)) is None for p in periods)]
+        self.reused += len(symbols) * len(periods)
+        if missing:
+            matrix = rsi_matrix(pad_closes([candles_list[i] for i in missing]), periods)
+            width = matrix.shape[2]
+            for row, i in enumerate(missing):
+                candles = candles_list[i]
+                for p, period in enumerate(periods):
+                    if self.peek(symbols[i], interval, candles, 'rsi', (period,)) is None:
+                        values = matrix[p, row, width - len(candles):].copy()
+                        self._series[(symbols[i], interval, 'rsi', (period,))] = (candles, values)
+                        self.computed += 1
+                        self.reused -= 1
+
+        results = []
+        for symbol, candles in zip(symbols, candles_list):
+            result = {}
+            for period in periods:
+                values = self.peek(symbol, interval, candles, 'rsi', (period,))
+                result[period] = float(values[-1]) if len(values) else np.nan
+            results.append(result)
+        return results
+
+
+class WilderRSI:
+    """한 시리즈/기간의 Wilder RSI 상태
+
+    평균 상승폭/하락폭과 직전 종가만 보관하므로 새 캔들 하나를 O(1)로 반영합니다.
+    계산 순서는 ta 라이브러리(pandas ewm)와 같아서 처음부터 반영하면 rsi_series와 일치합니다.
+    """
+
+    __slots__ = ('period', 'alpha', 'decay', 'count', 'prev_close', 'avg_gain', 'avg_loss')
+
+    def __init__(self, period: int):
+        self.period = period
+        self.alpha = _wilder_alpha(period)
+        self.decay = 1.0 - self.alpha
+        self.count = 0
+        self.prev_close = np.nan
+        self.avg_gain = 0.0
+        self.avg_loss = 0.0
+
+    def _next(self, close: float) -> Tuple[float, float]:
+        if self.count == 0:
+            return 0.0, 0.0
+        diff = close - self.prev_close
+        gain = diff if diff > 0 else 0.0
+        loss = -diff if diff < 0 else 0.0
+        return (_wilder_step(self.avg_gain, gain, self.alpha, self.decay),
+                _wilder_step(self.avg_loss, loss, self.alpha, self.decay))
+
+    def update(self, close: float) -> float:
+        """마감된 캔들의 종가를 반영하고 RSI를 반환합니다."""
+        self.avg_gain, self.avg_loss = self._next(close)
+        self.prev_close = close
+        self.count += 1
+        return self.value
+
+    def peek(self, close: float) -> float:
+        """상태를 바꾸지 않고, 다음 캔들 종가가 close일 때의 RSI를 반환합니다."""
+        if self.count + 1 < self.period:
+            return np.nan
+        return _rsi_value(*self._next(close))
+
+    @property
+    def value(self) -> float:
+        """마지막으로 반영한 캔들 기준 RSI (데이터 부족 시 NaN)"""
+        if self.count < self.period:
+            return np.nan
+        return _rsi_value(self.avg_gain, self.avg_loss)
+
+
+class _SeriesRSI:
+    __slots__ = ('last_timestamp', 'states')
+
+    def __init__(self):
+        self.last_timestamp: Optional[int] = None
+        self.states: Dict[int, WilderRSI] = {}
+
+
+class RSIEngine:
+    """(symbol, interval, period)별 Wilder RSI 상태를 유지하는 증분 엔진
+
+    마감된 캔들은 처음 볼 때 한 번만 반영(commit)하고, 진행 중인 캔들은 상태를 바꾸지 않고
+    계산(peek)합니다. 처음 보는 시리즈나 캔들이 끊긴 시리즈는 받은 캔들 전체로 다시 시작하므로
+    첫 값은 같은 캔들에 대한 ta 계산과 같고, 이후에는 이력이 길어져도 캔들당 O(1)로 갱신됩니다.
+    """
+
+    def __init__(self):
+        self._series: Dict[Tuple[str, str], _SeriesRSI] = {}
+
+    def reset(self, symbol: Optional[str] = None):
+        """상태를 비웁니다 (symbol이 있으면 해당 종목만)."""
+        if symbol is None:
+            self._series.clear()
+        else:
+            for key in [k for k in self._series if k[0] == symbol]:
+                del self._series[key]
+
+    def latest(self, symbol: str, interval: str, candles: CandleArrays,
+               periods: Iterable[int], now: Optional[float] = None) -> Dict[int, float]:
+        """마지막 캔들 기준 기간별 RSI를 반환합니다 (데이터 부족 시 NaN)."""
+        return self.latest_many([symbol], interval, [candles], periods, now)[0]
+
+    def latest_many(self, symbols: List[str], interval: str, candles_list: List[CandleArrays],
+                    periods: Iterable[int], now: Optional[float] = None) -> List[Dict[int, float]]:
+        """여러 종목의 마지막 캔들 기준 RSI를 한 번에 계산합니다.
+
+        처음 보는 종목들은 벡터화 커널 한 번으로 상태를 만들고,
+        이어서 갱신하는 종목은 새로 마감된 캔들만 O(1)로 반영합니다.
+        """
+        periods = list(periods)
+        step = INTERVAL_MS.get(interval, INTERVAL_MS["5m"]) // 1000
+        now_s = time.time() if now is None else now
+
+        # 시작 시간 + 간격이 현재 이전이면 마감된 캔들
+        closed = [int(np.searchsorted(c.timestamp, now_s - step, side='right')) for c in candles_list]
+
+        seeds = []
+        for i, (symbol, candles) in enumerate(zip(symbols, candles_list)):
+            if len(candles) == 0:
+                continue
+            series = self._series.get((symbol, interval))
+            if series is None or not self._continues(series, candles, step, periods):
+                seeds.append(i)
+                continue
+            # 마감 캔들 반영 (기존 시리즈면 새로 마감된 캔들 몇 개만)
+            start = int(np.searchsorted(candles.timestamp, series.last_timestamp, side='right'))
+            if closed[i] > start:
+                for close in candles.close[start:closed[i]]:
+                    for state in series.states.values():
+                        state.update(float(close))
+                series.last_timestamp = int(candles.timestamp[closed[i] - 1])
+
+        if seeds:
+            self._seed([symbols[i] for i in seeds], interval,
+                       [candles_list[i] for i in seeds], [closed[i] for i in seeds], periods)
+
+        results = []
+        for i, (symbol, candles) in enumerate(zip(symbols, candles_list)):
+            if len(candles) == 0:
+                results.append({period: np.nan for period in periods})
+                continue
+            series = self._series[(symbol, interval)]
+            forming = candles.close[closed[i]:]
+            result = {}
+            for period in periods:
+                state = series.states[period]
+                if len(forming) == 0:
+                    result[period] = state.value
+                elif len(forming) == 1:
+                    result[period] = state.peek(float(forming[0]))
+                else:
+                    # 마감 판정과 어긋난 캔들이 여러 개면 복사본으로 순서대로 계산
+                    scratch = WilderRSI(period)
+                    for slot in WilderRSI.__slots__:
+                        setattr(scratch, slot, getattr(state, slot))
+                    for close in forming:
+                        scratch.update(float(close))
+                    result[period] = scratch.value
+            results.append(result)
+        return results
+
+    def _seed(self, symbols: List[str], interval: str, candles_list: List[CandleArrays],
+              closed: List[int], periods: List[int]):
+        """받은 마감 캔들 전체로 여러 종목의 상태를 한 번에 새로 만듭니다."""
+        closes = pad_closes(candles_list, closed)
+        _, avg_gain, avg_loss, counts = _wilder_rsi_kernel(closes, np.asarray(periods, dtype=np.int64))
+        for s, (symbol, candles) in enumerate(zip(symbols, candles_list)):
+            series = _SeriesRSI()
+            for p, period in enumerate(periods):
+                state = WilderRSI(period)
+                state.count = int(counts[s])
+                if state.count:
+                    state.avg_gain = float(avg_gain[p, s])
+                    state.avg_loss = float(avg_loss[p, s])
+                    state.prev_close = float(candles.close[closed[s] - 1])
+                series.states[period] = state
+            if closed[s]:
+                series.last_timestamp = int(candles.timestamp[closed[s] - 1])
+            self._series[(symbol, interval)] = series
+
+    @staticmethod
+    def _continues(series: _SeriesRSI, candles: CandleArrays, step: int,
+                   periods: Iterable[int]) -> bool:
+        """저장된 상태에 받은 캔들을 이어서 반영할 수 있는지 확인합니다."""
+        if series.last_timestamp is None or any(p not in series.states for p in periods):
+            return False
+        first = int(candles.timestamp[0])
+        last = int(candles.timestamp[-1])
+        # 마지막 반영 캔들이 범위 안에 있거나 바로 다음 캔들부터 시작해야 함
+        return first <= series.last_timestamp + step and last >= series.last_timestamp
@@ -0,0 +1,178 @@
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # numba가 없으면 indicators가 NumPy 구현을 사용
+    numba = None
+
+# numba로 컴파일된 커널을 쓸 수 있는지 여부
+AVAILABLE = numba is not None
+
+# 다이버전스 종류 코드 (커널은 문자열 대신 이 순서의 index를 반환)
+DIVERGENCE_KINDS = ('regular_bullish', 'hidden_bullish', 'regular_bearish', 'hidden_bearish')
+
+
+def _jit(function):
+    """numba가 있으면 네이티브 코드로 컴파일합니다 (컴파일 결과는 __pycache__에 캐시).
+
+    numba가 없으면 함수를 그대로 돌려주므로 결과는 같지만 느립니다 (indicators는 이 경우 NumPy 구현 사용).
+    """
+    if numba is None:
+        return function
+    return numba.njit(cache=True, nogil=True)(function)
+
+
+@_jit
+def wilder_rsi(close, period, alpha):
+    """indicators.rsi_series와 같은 순서로 계산하는 Wilder RSI 반복식"""
+    n = close.shape[0]
+    out = np.full(n, np.nan)
+    decay = 1.0 - alpha
+    denominator = decay + alpha
+    avg_gain = 0.0
+    avg_loss = 0.0
+    previous = close[0] if n else 0.0
+    for i in range(n):
+        diff = close[i] - previous
+        previous = close[i]
+        gain = diff if diff > 0 else 0.0
+        loss = -diff if diff < 0 else 0.0
+        if avg_gain != gain:
+            avg_gain = (decay * avg_gain + alpha * gain) / denominator
+        if avg_loss != loss:
+            avg_loss = (decay * avg_loss + alpha * loss) / denominator
+        if i + 1 >= period:
+            out[i] = 100.0 if avg_loss == 0 else 100 - (100 / (1 + avg_gain / avg_loss))
+    return out
+
+
+@_jit
+def wilder_rsi_matrix(close, periods, alphas):
+    """indicators._wilder_rsi_kernel과 같은 결과를 종목/기간별 반복식으로 계산합니다.
+
+    반환: (rsi (P, S, N), avg_gain (P, S), avg_loss (P, S), 유효 캔들 수 (S,))
+    """
+    n_symbols, n_bars = close.shape
+    n_periods = periods.shape[0]
+    rsi = np.full((n_periods, n_symbols, n_bars), np.nan)
+    avg_gains = np.zeros((n_periods, n_symbols))
+    avg_losses = np.zeros((n_periods, n_symbols))
+    counts = np.zeros(n_symbols, dtype=np.int64)
+    for s in range(n_symbols):
+        # 앞의 NaN(짧은 종목 패딩)은 건너뛰고 첫 유효 종가부터 시작
+        start = n_bars
+        for j in range(n_bars):
+            if not np.isnan(close[s, j]):
+                start = j
+                break
+        counts[s] = n_bars - start
+        for p in range(n_periods):
+            alpha = alphas[p]
+            decay = 1.0 - alpha
+            denominator = decay + alpha
+            avg_gain = 0.0
+            avg_loss = 0.0
+            for j in range(start, n_bars):
+                diff = close[s, j] - close[s, j - 1] if j > start else 0.0
+                gain = diff if diff > 0 else 0.0
+                loss = -diff if diff < 0 else 0.0
+                if avg_gain != gain:
+                    avg_gain = (decay * avg_gain + alpha * gain) / denominator
+                if avg_loss != loss:
+                    avg_loss = (decay * avg_loss + alpha * loss) / denominator
+                if j - start + 1 >= periods[p]:
+                    rsi[p, s, j] = 100.0 if avg_loss == 0 else 100 - (100 / (1 + avg_gain / avg_loss))
+            avg_gains[p, s] = avg_gain
+            avg_losses[p, s] = avg_loss
+    return rsi, avg_gains, avg_losses, counts
+
+
+@_jit
+def pivot_scan(values, left_bars, right_bars):
+    """(series, bars) 배열의 피벗 로우/하이 (indicators.pivot_masks와 같은 정의)"""
+    n_series, n = values.shape
+    lows = np.zeros((n_series, n), dtype=np.bool_)
+    highs = np.zeros((n_series, n), dtype=np.bool_)
+    for s in range(n_series):
+        for i in range(left_bars, n - right_bars):
+            center = values[s, i]
+            is_low = True
+            is_high = True
+            for k in range(i - left_bars, i + right_bars + 1):
+                if k == i:
+                    continue
+                # NaN과의 비교는 항상 거짓이므로 NaN이 섞이면 피벗이 아님
+                if not center < values[s, k]:
+                    is_low = False
+                if not center > values[s, k]:
+                    is_high = False
+                if not is_low and not is_high:
+                    break
+            lows[s, i] = is_low
+            highs[s, i] = is_high
+    return lows, highs
+
+
+@_jit
+def divergence_scan(rsi, low, high, lows, highs, min_gap, max_gap, include_hidden):
+    """연속 RSI 피벗 쌍을 캔들 순서대로 비교합니다 (indicators.find_divergences와 같은 순서).
+
+    반환: (종류 코드(DIVERGENCE_KINDS index), 피벗 index, 이전 피벗 index) 배열
+    """
+    n = rsi.shape[0]
+    kinds = np.empty(2 * n, dtype=np.int64)
+    indices = np.empty(2 * n, dtype=np.int64)
+    previous = np.empty(2 * n, dtype=np.int64)
+    count = 0
+    last_low = -1
+    last_high = -1
+    for i in range(n):
+        if lows[i]:
+            if last_low >= 0 and min_gap <= i - last_low <= max_gap:
+                # 가격은 더 낮은 저점, RSI는 더 높은 저점 (Hidden은 반대)
+                if rsi[i] > rsi[last_low] and low[i] < low[last_low]:
+                    kinds[count], indices[count], previous[count] = 0, i, last_low
+                    count += 1
+                if include_hidden and rsi[i] < rsi[last_low] and low[i] > low[last_low]:
+                    kinds[count], indices[count], previous[count] = 1, i, last_low
+                    count += 1
+            last_low = i
+        if highs[i]:
+            if last_high >= 0 and min_gap <= i - last_high <= max_gap:
+                # 가격은 더 높은 고점, RSI는 더 낮은 고점 (Hidden은 반대)
+                if rsi[i] < rsi[last_high] and high[i] > high[last_high]:
+                    kinds[count], indices[count], previous[count] = 2, i, last_high
+                    count += 1
+                if include_hidden and rsi[i] > rsi[last_high] and high[i] < high[last_high]:
+                    kinds[count], indices[count], previous[count] = 3, i, last_high
+                    count += 1
+            last_high = i
+    return kinds[:count], indices[:count], previous[:count]
+
+
+@_jit
+def lookback_scan(close, rsi, lookback_periods):
+    """마지막 캔들과 5..lookback_periods-1개 전 캔들을 비교해 첫 다이버전스를 찾습니다.
+
+    Regular(RSI 3포인트 이상)를 먼저 찾고 없으면 Hidden(2포인트 이상)을 찾으며,
+    (종류 코드(DIVERGENCE_KINDS index), 비교한 캔들 수)를 반환합니다 (없으면 (-1, -1)).
+    """
+    n = close.shape[0]
+    current_close = close[n - 1]
+    current_rsi = rsi[n - 1]
+    end = min(lookback_periods, n - 1)
+    for offset in range(5, end):
+        past_close = close[n - 1 - offset]
+        past_rsi = rsi[n - 1 - offset]
+        if current_close < past_close and current_rsi > past_rsi and current_rsi - past_rsi >= 3:
+            return 0, offset
+        if current_close > past_close and current_rsi < past_rsi and past_rsi - current_rsi >= 3:
+            return 2, offset
+    for offset in range(5, end):
+        past_close = close[n - 1 - offset]
+        past_rsi = rsi[n - 1 - offset]
+        if current_close > past_close and current_rsi < past_rsi and past_rsi - current_rsi >= 2:
+            return 1, offset
+        if current_close < past_close and current_rsi > past_rsi and current_rsi - past_rsi >= 2:
+            return 3, offset
+    return -1, -1
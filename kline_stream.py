@@ -0,0 +1,131 @@
+import asyncio
+import json
+import logging
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+# on_kline(symbol, interval, kline_row, is_closed)
+KlineCallback = Callable[[str, str, List[Any], bool], None]
+
+
+class KlineStream:
+    """Binance combined kline 스트림을 구독하는 WebSocket 클라이언트
+
+    모니터링 대상 (symbol, interval) 조합을 연결당 최대 MAX_STREAMS_PER_CONNECTION개씩
+    나눠 구독하고, 수신한 kline을 REST 응답과 같은 형식의 행으로 변환해 on_kline에 전달합니다.
+    연결이 끊기면 on_disconnect로 알린 뒤 reconnect_delay초 후 다시 연결합니다.
+    """
+
+    SPOT_STREAM_URL = "wss://stream.binance.com:9443"
+    FUTURES_STREAM_URL = "wss://fstream.binance.com"
+    MAX_STREAMS_PER_CONNECTION = 200
+
+    def __init__(self, market_type: str, symbols: Iterable[str], intervals: Iterable[str],
+                 on_kline: KlineCallback,
+                 on_connect: Optional[Callable[[List[Tuple[str, str]]], None]] = None,
+                 on_disconnect: Optional[Callable[[List[Tuple[str, str]]], None]] = None,
+                 base_url: Optional[str] = None, reconnect_delay: float = 5.0):
+        self.market_type = market_type
+        self.streams = [(symbol, interval) for symbol in sorted(set(symbols))
+                        for interval in sorted(set(intervals))]
+        self.on_kline = on_kline
+        self.on_connect = on_connect
+        self.on_disconnect = on_disconnect
+        self.reconnect_delay = reconnect_delay
+
+        if base_url:
+            self.base_url = base_url.rstrip('/')
+        elif market_type == 'futures':
+            self.base_url = self.FUTURES_STREAM_URL
+        else:
+            self.base_url = self.SPOT_STREAM_URL
+
+        self._stopped = asyncio.Event()
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _chunks(self) -> List[List[Tuple[str, str]]]:
+        size = self.MAX_STREAMS_PER_CONNECTION
+        return [self.streams[i:i + size] for i in range(0, len(self.streams), size)]
+
+    def _stream_url(self, chunk: List[Tuple[str, str]]) -> str:
+        names = "/".join(f"{symbol.lower()}@kline_{interval}" for symbol, interval in chunk)
+        return f"{self.base_url}/stream?streams={names}"
+
+    @staticmethod
+    def parse_message(payload: Any) -> Optional[Tuple[str, str, List[Any], bool]]:
+        """combined 스트림 메시지를 (symbol, interval, kline 행, 마감 여부)로 변환합니다."""
+        data = payload.get('data', payload) if isinstance(payload, dict) else None
+        if not data or data.get('e') != 'kline':
+            return None
+        k = data['k']
+        row = [k['t'], k['o'], k['h'], k['l'], k['c'], k['v'], k['T'],
+               k.get('q', "0"), k.get('n', 0), k.get('V', "0"), k.get('Q', "0"), "0"]
+        return data['s'], k['i'], row, bool(k['x'])
+
+    async def run(self):
+        """stop()이 호출될 때까지 모든 스트림 연결을 유지합니다."""
+        self._stopped.clear()
+        self._session = aiohttp.ClientSession()
+        try:
+            await asyncio.gather(*[self._run_connection(chunk) for chunk in self._chunks()])
+        finally:
+            await self._session.close()
+            self._session = None
+
+    async def stop(self):
+        self._stopped.set()
+
+    async def _run_connection(self, chunk: List[Tuple[str, str]]):
+        url = self._stream_url(chunk)
+        while not self._stopped.is_set():
+            try:
+                async with self._session.ws_connect(url, heartbeat=60) as ws:
+                    logger.info(f"kline 스트림 연결: {len(chunk)}개 스트림")
+                    if self.on_connect:
+                        self.on_connect(chunk)
+                    await self._receive(ws)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.warning(f"kline 스트림 연결 오류: {e}")
+            finally:
+                if self.on_disconnect:
+                    self.on_disconnect(chunk)
+
+            if not self._stopped.is_set():
+                logger.info(f"{self.reconnect_delay}초 후 kline 스트림 재연결...")
+                try:
+                    await asyncio.wait_for(self._stopped.wait(), timeout=self.reconnect_delay)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def _receive(self, ws: aiohttp.ClientWebSocketResponse):
+        stop_task = asyncio.ensure_future(self._stopped.wait())
+        try:
+            while True:
+                receive_task = asyncio.ensure_future(ws.receive())
+                done, _ = await asyncio.wait(
+                    {receive_task, stop_task}, return_when=asyncio.FIRST_COMPLETED
+                )
+                if stop_task in done:
+                    receive_task.cancel()
+                    await ws.close()
+                    return
+
+                msg = receive_task.result()
+                if msg.type != aiohttp.WSMsgType.TEXT:
+                    if msg.type in (aiohttp.WSMsgType.CLOSE, aiohttp.WSMsgType.CLOSED,
+                                    aiohttp.WSMsgType.ERROR):
+                        return
+                    continue
+
+                try:
+                    parsed = self.parse_message(json.loads(msg.data))
+                except (ValueError, KeyError) as e:
+                    logger.warning(f"kline 스트림 메시지 파싱 오류: {e}")
+                    continue
+                if parsed:
+                    self.on_kline(*parsed)
+        finally:
+            stop_task.cancel()
@@ -0,0 +1,210 @@
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+
+from rate_limiter import RequestWeightLimiter
+
+logger = logging.getLogger(__name__)
+
+# Binance 캔들 간격별 길이 (밀리초)
+INTERVAL_MS = {
+    "1m": 60_000,
+    "5m": 5 * 60_000,
+    "15m": 15 * 60_000,
+    "1h": 60 * 60_000,
+    "4h": 4 * 60 * 60_000,
+    "1d": 24 * 60 * 60_000,
+}
+
+# 요청당 최대 캔들 수 (spot 1000, futures 1500 중 공통 상한)
+MAX_KLINES_PER_REQUEST = 1000
+
+# 429/418 응답의 Retry-After가 이보다 길면 기다리지 않고 실패 처리 (초)
+MAX_RETRY_AFTER_SECONDS = 120
+
+
+class MarketDataError(Exception):
+    """Binance 시세 API 요청 실패를 나타내는 예외"""
+
+    def __init__(self, status: int, message: str, code: Optional[int] = None):
+        super().__init__(f"HTTP {status} (code={code}): {message}")
+        self.status = status
+        self.code = code
+        self.message = message
+        # 429/418 응답의 Retry-After (초)
+        self.retry_after: Optional[float] = None
+
+
+def _parse_retry_after(headers) -> Optional[float]:
+    value = headers.get('Retry-After')
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+class AsyncMarketDataClient:
+    """aiohttp 세션 풀 기반의 비동기 Binance 시세 클라이언트
+
+    CryptoMonitor와 TechnicalAnalyzer가 같은 인스턴스를 공유하며,
+    동시에 진행되는 요청 수는 max_concurrent_requests로 제한됩니다.
+    모든 요청은 엔드포인트 가중치만큼 limiter의 분당 예산을 소비합니다.
+    """
+
+    SPOT_BASE_URL = "https://api.binance.com"
+    FUTURES_BASE_URL = "https://fapi.binance.com"
+
+    # 시장 타입별 엔드포인트 경로
+    ENDPOINTS = {
+        'spot': {
+            'ticker': '/api/v3/ticker/24hr',
+            'klines': '/api/v3/klines',
+        },
+        'futures': {
+            'ticker': '/fapi/v1/ticker/24hr',
+            'klines': '/fapi/v1/klines',
+        },
+    }
+
+    def __init__(self, market_type: str = 'spot', api_key: Optional[str] = None,
+                 max_concurrent_requests: int = 10, timeout: float = 10.0,
+                 base_url: Optional[str] = None,
+                 limiter: Optional[RequestWeightLimiter] = None, max_retries: int = 3):
+        self.market_type = 'futures' if market_type == 'futures' else 'spot'
+        self.api_key = api_key
+        self.max_concurrent_requests = max(1, int(max_concurrent_requests))
+        self.timeout = timeout
+        self.limiter = limiter or RequestWeightLimiter.for_market(self.market_type)
+        self.max_retries = max_retries
+
+        if base_url:
+            self.base_url = base_url.rstrip('/')
+        elif self.market_type == 'futures':
+            self.base_url = self.FUTURES_BASE_URL
+        else:
+            self.base_url = self.SPOT_BASE_URL
+
+        self._endpoints = self.ENDPOINTS[self.market_type]
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """이벤트 루프 안에서 세션과 커넥션 풀을 지연 생성합니다."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrent_requests,
+                ttl_dns_cache=300
+            )
+            headers = {}
+            if self.api_key:
+                headers['X-MBX-APIKEY'] = self.api_key
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        return self._session
+
+    def klines_weight(self, limit: int) -> int:
+        """klines 요청의 가중치 (Binance 문서 기준)"""
+        if self.market_type == 'spot':
+            return 2
+        if limit < 100:
+            return 1
+        if limit < 500:
+            return 2
+        if limit <= 1000:
+            return 5
+        return 10
+
+    def ticker_weight(self, symbol: Optional[str] = None) -> int:
+        """24시간 티커 요청의 가중치 (Binance 문서 기준)"""
+        if self.market_type == 'spot':
+            return 2 if symbol else 80
+        return 1 if symbol else 40
+
+    async def _request(self, path: str, params: Optional[Dict[str, Any]] = None,
+                       weight: int = 1) -> Any:
+        """GET 요청을 보내고 JSON 응답을 반환합니다.
+
+        429(한도 초과)/418(IP 차단) 응답은 Retry-After만큼 모든 요청을 멈춘 뒤 재시도합니다.
+        """
+        attempt = 0
+        while True:
+            try:
+                return await self._send(path, params, weight)
+            except MarketDataError as e:
+                if e.status not in (418, 429) or attempt >= self.max_retries:
+                    raise
+                if e.retry_after is None or e.retry_after > MAX_RETRY_AFTER_SECONDS:
+                    raise
+                attempt += 1
+                logger.warning(f"{path} 요청 한도 초과 (HTTP {e.status}) - "
+                               f"{e.retry_after:.0f}초 후 재시도 ({attempt}/{self.max_retries})")
+
+    async def _send(self, path: str, params: Optional[Dict[str, Any]], weight: int) -> Any:
+        session = await self._get_session()
+        query = {k: v for k, v in (params or {}).items() if v is not None}
+
+        await self.limiter.acquire(weight)
+        async with self._semaphore:
+            try:
+                async with session.get(self.base_url + path, params=query) as response:
+                    self.limiter.update_from_headers(response.headers)
+                    if response.status >= 400:
+                        text = await response.text()
+                        code = None
+                        message = text
+                        try:
+                            payload = await response.json(content_type=None)
+                            code = payload.get('code')
+                            message = payload.get('msg', text)
+                        except (ValueError, AttributeError):
+                            pass
+                        error = MarketDataError(response.status, message, code)
+                        if response.status in (418, 429):
+                            error.retry_after = _parse_retry_after(response.headers)
+                            if error.retry_after is not None:
+                                self.limiter.block_for(error.retry_after)
+                        raise error
+                    return await response.json(content_type=None)
+            except asyncio.TimeoutError:
+                raise MarketDataError(0, f"{path} 요청 시간 초과 ({self.timeout}초)")
+            except aiohttp.ClientError as e:
+                raise MarketDataError(0, f"{path} 요청 실패: {e}")
+
+    async def get_ticker(self, symbol: Optional[str] = None) -> Any:
+        """24시간 티커 통계를 조회합니다. symbol이 없으면 전체 목록을 반환합니다."""
+        return await self._request(self._endpoints['ticker'], {'symbol': symbol},
+                                   weight=self.ticker_weight(symbol))
+
+    async def get_klines(self, symbol: str, interval: str, limit: int = 500,
+                         start_time: Optional[int] = None,
+                         end_time: Optional[int] = None) -> List[List[Any]]:
+        """캔들스틱(kline) 데이터를 조회합니다. 시간은 밀리초 단위입니다."""
+        params = {
+            'symbol': symbol,
+            'interval': interval,
+            'limit': limit,
+            'startTime': start_time,
+            'endTime': end_time,
+        }
+        return await self._request(self._endpoints['klines'], params,
+                                   weight=self.klines_weight(limit))
+
+    async def close(self):
+        """세션과 커넥션 풀을 닫습니다."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self) -> 'AsyncMarketDataClient':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
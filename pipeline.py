@@ -0,0 +1,111 @@
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 대기열 종료 표시 (워커 하나당 하나씩 넣음)
+DONE = object()
+
+
+class StageStats:
+    """파이프라인 한 단계의 처리량과 입력 대기열 깊이를 기록합니다.
+
+    가동률은 워커들이 항목을 처리한 시간의 비율이며, 가동률이 가장 높은 단계가 병목입니다.
+    """
+
+    def __init__(self, name: str, queue: asyncio.Queue, workers: int = 1):
+        self.name = name
+        self.queue = queue
+        self.workers = workers
+        self.processed = 0
+        self.batches = 0
+        self.busy_seconds = 0.0
+        self.max_depth = 0
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+
+    @property
+    def elapsed(self) -> float:
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.perf_counter()) - self.started
+
+    @property
+    def throughput(self) -> float:
+        """초당 처리 항목 수"""
+        elapsed = self.elapsed
+        return self.processed / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def utilization(self) -> float:
+        elapsed = self.elapsed
+        return self.busy_seconds / (elapsed * self.workers) if elapsed > 0 else 0.0
+
+    def observe_depth(self):
+        self.max_depth = max(self.max_depth, self.queue.qsize())
+
+    def summary(self) -> str:
+        capacity = f"/{self.queue.maxsize}" if self.queue.maxsize > 0 else ""
+        return (f"{self.name}: {self.processed}건 ({self.throughput:.1f}건/초), "
+                f"가동률 {self.utilization:.0%} (워커 {self.workers}), 대기열 최대 {self.max_depth}{capacity}")
+
+
+async def _next_batch(stats: StageStats, batch_size: int) -> Tuple[List[Any], bool]:
+    """입력 대기열에서 한 항목을 기다린 뒤 이미 도착한 항목을 batch_size개까지 더 꺼냅니다.
+
+    반환: (항목 목록, DONE을 받았는지 여부)
+    """
+    stats.observe_depth()
+    item = await stats.queue.get()
+    if item is DONE:
+        return [], True
+    batch = [item]
+    while len(batch) < batch_size:
+        try:
+            item = stats.queue.get_nowait()
+        except asyncio.QueueEmpty:
+            break
+        if item is DONE:
+            return batch, True
+        batch.append(item)
+    return batch, False
+
+
+async def run_stage(stats: StageStats, handler: Callable[[List[Any]], Awaitable[List[Any]]],
+                    output: Optional[asyncio.Queue] = None, output_workers: int = 1, batch_size: int = 1):
+    """stats.workers개 워커로 입력 대기열을 처리하고 handler 결과를 output 대기열에 넣습니다.
+
+    워커는 DONE을 받으면 끝나며, 모든 워커가 끝나면 다음 단계 워커 수(output_workers)만큼
+    DONE을 넘깁니다. handler 오류는 기록만 하고 다음 항목을 계속 처리하므로, 한 단계의 실패로
+    앞 단계가 가득 찬 대기열에서 멈추지 않습니다.
+    """
+    stats.started = time.perf_counter()
+
+    async def worker():
+        done = False
+        while not done:
+            batch, done = await _next_batch(stats, batch_size)
+            if not batch:
+                continue
+            started = time.perf_counter()
+            try:
+                results = await handler(batch)
+            except Exception as e:
+                logger.error(f"파이프라인 {stats.name} 단계 오류: {e}")
+                results = []
+            stats.busy_seconds += time.perf_counter() - started
+            stats.processed += len(batch)
+            stats.batches += 1
+            if output is not None:
+                for result in results or []:
+                    await output.put(result)
+
+    try:
+        await asyncio.gather(*(worker() for _ in range(stats.workers)))
+    finally:
+        stats.finished = time.perf_counter()
+    if output is not None:
+        for _ in range(output_workers):
+            await output.put(DONE)
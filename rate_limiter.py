@@ -0,0 +1,109 @@
+import asyncio
+import logging
+import time
+from typing import Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class RequestWeightLimiter:
+    """Binance 분당 요청 가중치(request weight) 예산을 관리하는 토큰 버킷
+
+    요청마다 엔드포인트 가중치만큼 토큰을 소비하고, 토큰은 분당 한도에 맞춰 연속으로
+    채워집니다. 응답의 X-MBX-USED-WEIGHT-1M 헤더로 서버 기준 사용량을 반영하며,
+    예산이 부족하면 요청을 실패시키지 않고 토큰이 찰 때까지 대기시킵니다.
+    """
+
+    # Binance 기본 IP 한도 (분당 가중치)
+    DEFAULT_WEIGHT_LIMITS = {
+        'spot': 6000,
+        'futures': 2400,
+    }
+    USED_WEIGHT_HEADER = 'X-MBX-USED-WEIGHT-1M'
+
+    def __init__(self, weight_limit: int, safety_margin: float = 0.1):
+        self.weight_limit = weight_limit
+        # 다른 프로세스/수동 요청을 위해 한도의 일부를 남겨둠
+        self.capacity = max(1, int(weight_limit * (1 - safety_margin)))
+        self.refill_per_second = self.capacity / 60.0
+
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+
+        # 서버가 알려준 최근 사용량 (분 단위 창)
+        self.server_used_weight: Optional[int] = None
+        self._server_window: Optional[int] = None
+
+    @classmethod
+    def for_market(cls, market_type: str, weight_limit: Optional[int] = None,
+                   safety_margin: float = 0.1) -> 'RequestWeightLimiter':
+        """시장 타입의 기본 한도(또는 지정한 한도)로 리미터를 생성합니다."""
+        if weight_limit is None:
+            weight_limit = cls.DEFAULT_WEIGHT_LIMITS.get(market_type, cls.DEFAULT_WEIGHT_LIMITS['spot'])
+        return cls(weight_limit, safety_margin)
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        self._tokens = min(float(self.capacity), self._tokens + elapsed * self.refill_per_second)
+
+    async def acquire(self, weight: int):
+        """weight만큼의 예산을 확보할 때까지 대기합니다."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        weight = min(weight, self.capacity)
+
+        # 먼저 온 요청부터 순서대로 예산 배정
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if self._blocked_until > now:
+                    await asyncio.sleep(self._blocked_until - now)
+                    continue
+
+                self._refill()
+                if self._tokens >= weight:
+                    self._tokens -= weight
+                    return
+
+                wait = (weight - self._tokens) / self.refill_per_second
+                logger.debug(f"요청 가중치 예산 부족 - {wait:.2f}초 대기 (필요 {weight}, 남은 {self._tokens:.0f})")
+                await asyncio.sleep(wait)
+
+    def update_from_headers(self, headers: Mapping[str, str]):
+        """응답 헤더의 서버 기준 사용량으로 남은 예산을 보정합니다."""
+        used = headers.get(self.USED_WEIGHT_HEADER)
+        if used is None:
+            return
+        try:
+            used = int(used)
+        except ValueError:
+            return
+
+        self.server_used_weight = used
+        self._server_window = int(time.time() // 60)
+        self._refill()
+        self._tokens = min(self._tokens, float(self.capacity - used))
+
+    def block_for(self, seconds: float):
+        """429/418 응답 이후 지정된 시간 동안 모든 요청을 멈춥니다."""
+        until = time.monotonic() + max(0.0, seconds)
+        if until > self._blocked_until:
+            self._blocked_until = until
+            logger.warning(f"Binance 요청 한도 초과 - {seconds:.0f}초 동안 요청 중지")
+
+    @property
+    def used_weight(self) -> int:
+        """이번 1분 창에서 사용한 가중치 (서버 헤더 우선, 없으면 로컬 추정치)"""
+        if self.server_used_weight is not None and self._server_window == int(time.time() // 60):
+            return self.server_used_weight
+        self._refill()
+        return int(self.capacity - max(0.0, self._tokens))
+
+    @property
+    def headroom(self) -> int:
+        """지금 바로 사용할 수 있는 가중치 예산"""
+        return max(0, self.capacity - self.used_weight)
@@ -0,0 +1,59 @@
+from typing import Optional
+
+import numpy as np
+
+from candles import CandleArrays, PRICE_COLUMNS
+from market_data import INTERVAL_MS
+
+
+def resample_ratio(source_interval: str, target_interval: str) -> Optional[int]:
+    """target 캔들 하나에 들어가는 source 캔들 수를 반환합니다 (리샘플링 불가면 None)."""
+    source_ms = INTERVAL_MS.get(source_interval)
+    target_ms = INTERVAL_MS.get(target_interval)
+    if not source_ms or not target_ms or target_ms <= source_ms or target_ms % source_ms:
+        return None
+    return target_ms // source_ms
+
+
+def source_window(source_interval: str, target_interval: str, limit: int) -> int:
+    """target 캔들 limit개를 만들기 위해 필요한 source 캔들 수
+
+    맨 앞 버킷은 중간부터 시작해 잘려나갈 수 있으므로 버킷 하나만큼 여유를 둡니다.
+    """
+    ratio = resample_ratio(source_interval, target_interval)
+    if ratio is None:
+        raise ValueError(f"{source_interval} 캔들로 {target_interval} 캔들을 만들 수 없습니다.")
+    return (limit + 1) * ratio
+
+
+def resample_candles(candles: CandleArrays, source_interval: str, target_interval: str) -> CandleArrays:
+    """작은 간격의 OHLCV 캔들을 큰 간격 캔들로 합칩니다.
+
+    Binance와 같이 UTC epoch 기준으로 버킷을 정렬합니다 (15m은 :00/:15/..., 4h는 00/04/... UTC).
+    앞부분이 잘린 첫 버킷은 버리고, 진행 중인 마지막 버킷은 REST 응답처럼 그대로 남깁니다.
+    """
+    ratio = resample_ratio(source_interval, target_interval)
+    if ratio is None:
+        raise ValueError(f"{source_interval} 캔들로 {target_interval} 캔들을 만들 수 없습니다.")
+    if candles is None or len(candles) == 0:
+        return CandleArrays.empty()
+
+    step = INTERVAL_MS[target_interval] // 1000
+    bucket = (candles.timestamp // step) * step
+
+    # 시간순 정렬이므로 버킷이 바뀌는 위치가 각 target 캔들의 시작
+    starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+    ends = np.r_[starts[1:], len(bucket)] - 1
+
+    values = np.empty((len(PRICE_COLUMNS), len(starts)), dtype=np.float64)
+    values[0] = candles.open[starts]
+    values[1] = np.maximum.reduceat(candles.high, starts)
+    values[2] = np.minimum.reduceat(candles.low, starts)
+    values[3] = candles.close[ends]
+    values[4] = np.add.reduceat(candles.volume, starts)
+    resampled = CandleArrays(bucket[starts], values)
+
+    # 첫 버킷의 시작 캔들이 없으면 open/high/low/volume이 불완전하므로 제외
+    if candles.timestamp[0] != bucket[0]:
+        resampled = resampled[1:]
+    return resampled
@@ -38,7 +38,7 @@ case "$1" in
         ;;
     "test-rsi")
         echo "📊 RSI 분석 테스트 중..."
-        uv run --with-requirements requirements.txt python test/test_rsi.py
+        uv run --with-requirements requirements.txt --with-requirements requirements-optional.txt python test/test_rsi.py
         ;;
     "test-div")
         echo "🎯 RSI 다이버전스 테스트 중..."
@@ -46,7 +46,7 @@ case "$1" in
         ;;
     "test-all")
         echo "🔄 모든 테스트 실행 중..."
-        uv run --with-requirements requirements.txt python run_tests.py
+        uv run --with-requirements requirements.txt --with-requirements requirements-optional.txt python run_tests.py
         ;;
     "once")
         echo "🎯 단일 모니터링 실행..."
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+과거 캔들 백필 실행 스크립트
+
+관심 종목과 거래 대금 상위 종목의 과거 캔들을 Binance에서 받아
+캔들 아카이브(기본 logs/candles)에 저장합니다. 중단 후 다시 실행하면 이어서 받습니다.
+
+사용 예:
+    python run_backfill.py                      # 설정된 timeframe, 최근 90일
+    python run_backfill.py --days 180 --timeframes 5m 1h
+    python run_backfill.py --symbols BTCUSDT ETHUSDT --top 0
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+
+from backfill import CandleBackfiller
+from candle_archive import CandleArchive
+from crypto_monitor import CryptoMonitor
+from watchlist import WATCHLIST
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="과거 캔들 백필")
+    parser.add_argument("--days", type=int, default=90, help="받을 기간 (일, 기본 90)")
+    parser.add_argument("--timeframes", nargs="+", help="받을 timeframe (기본: 모니터링 설정에서 실제 조회하는 timeframe)")
+    parser.add_argument("--symbols", nargs="+", help="받을 종목 (기본: 관심 종목 + 거래 대금 상위 종목)")
+    parser.add_argument("--top", type=int, help="거래 대금 상위 종목 수 (기본: top_volume_limit)")
+    parser.add_argument("--concurrency", type=int, default=4, help="종목별 동시 요청 구간 수 (기본 4)")
+    parser.add_argument("--parallel", type=int, default=4, help="동시에 채울 (종목, timeframe) 수 (기본 4)")
+    parser.add_argument("--cache-dir", help="캔들 아카이브 경로 (기본: candle_cache_dir 설정)")
+    return parser.parse_args()
+
+
+async def main():
+    args = parse_args()
+    monitor = CryptoMonitor()
+
+    try:
+        cache_dir = args.cache_dir or monitor.candle_cache_dir or "logs/candles"
+        # 요청한 기간 전체를 보관하도록 최대 캔들 수 제한 없이 기록
+        archive = CandleArchive(cache_dir, monitor.market_type, max_rows=None)
+        timeframes = args.timeframes or monitor.get_fetch_timeframes()
+
+        if args.symbols:
+            symbols = list(args.symbols)
+        else:
+            top = monitor.top_volume_limit if args.top is None else args.top
+            symbols = list(WATCHLIST.keys())
+            if top > 0:
+                for ticker in await monitor.get_top_volume_pairs(top):
+                    if ticker['symbol'] not in symbols:
+                        symbols.append(ticker['symbol'])
+
+        print("📦 과거 캔들 백필을 시작합니다...")
+        print(f"📊 시장 타입: {monitor.market_type}")
+        print(f"📈 대상 종목: {len(symbols)}개")
+        print(f"⏱️  timeframe: {', '.join(timeframes)}")
+        print(f"📅 기간: 최근 {args.days}일")
+        print(f"💾 저장 경로: {archive.root}")
+
+        def on_progress(symbol: str, interval: str, written: int, remaining: int):
+            if remaining == 0:
+                print(f"  ✅ {symbol} {interval}: {written}개 저장")
+
+        backfiller = CandleBackfiller(monitor.market_data, archive, concurrency=args.concurrency,
+                                      on_progress=on_progress, series_concurrency=args.parallel)
+        start_ms = int((time.time() - args.days * 86400) * 1000)
+        started = time.perf_counter()
+        total = await backfiller.backfill_many(symbols, timeframes, start_ms)
+
+        limiter = monitor.market_data.limiter
+        print(f"\n🎉 백필 완료: {total}개 캔들 저장 ({time.perf_counter() - started:.1f}초)")
+        print(f"📊 요청 가중치 사용량: {limiter.used_weight}/{limiter.weight_limit}")
+
+    finally:
+        await monitor.close()
+
+
+if __name__ == "__main__":
+    # Ctrl+C는 asyncio.run이 main 태스크를 취소한 뒤 KeyboardInterrupt로 다시 올려 보내므로
+    # 코루틴 밖에서 처리 (monitor.close()는 main의 finally에서 실행됨)
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        print("\n⏹️  백필이 중단되었습니다. 다시 실행하면 이어서 받습니다.")
@@ -17,9 +17,9 @@ async def main():
     """실제 모니터링 실행"""
     print("🚀 암호화폐 Futures 모니터링을 시작합니다...")
     
+    monitor = CryptoMonitor()
+    
     try:
-        monitor = CryptoMonitor()
-        
         print(f"📊 시장 타입: {monitor.market_type}")
         print(f"📈 모니터링 대상: 거래 대금 상위 {monitor.market_settings['top_volume_limit']}개")
         print(f"⏱️  체크 주기: {monitor.market_settings.get('check_interval', 3)}분")
@@ -40,6 +40,8 @@ async def main():
         print(f"❌ 오류 발생: {e}")
         import traceback
         traceback.print_exc()
+    finally:
+        await monitor.close()
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -48,6 +48,29 @@ def main():
         ("test/test_scheduling.py", "스마트 스케줄링 테스트"),
         ("test/test_unified_cooldown.py", "통합 쿨다운 시스템 테스트"),
         ("test/test_simple_cooldown.py", "간단한 쿨다운 테스트"),
+        ("test/test_market_data.py", "비동기 시세 클라이언트 테스트"),
+        ("test/test_candle_cache.py", "주기 캔들 캐시 테스트"),
+        ("test/test_candle_store.py", "롤링 캔들 저장소 테스트"),
+        ("test/test_kline_stream.py", "kline 스트리밍 테스트"),
+        ("test/test_ticker_snapshot.py", "티커 스냅샷 테스트"),
+        ("test/test_rate_limiter.py", "요청 가중치 리미터 테스트"),
+        ("test/test_resampler.py", "멀티 타임프레임 리샘플링 테스트"),
+        ("test/test_candle_archive.py", "디스크 캔들 아카이브 테스트"),
+        ("test/test_backfill.py", "과거 캔들 백필 테스트"),
+        ("test/test_rsi_engine.py", "증분 RSI 엔진 테스트"),
+        ("test/test_rsi_matrix.py", "벡터화 RSI 커널 테스트"),
+        ("test/test_pivots.py", "피벗 탐지 테스트"),
+        ("test/test_pivot_divergence.py", "피벗 다이버전스 테스트"),
+        ("test/test_rsi_divergence.py", "lookback RSI 다이버전스 테스트"),
+        ("test/test_analysis_pool.py", "분석 프로세스 풀 테스트"),
+        ("test/test_indicator_graph.py", "지표 그래프 테스트"),
+        ("test/test_streaming_indicators.py", "증분 지표 테스트"),
+        ("test/test_jit_kernels.py", "numba JIT 커널 테스트"),
+        ("test/test_concurrent_checks.py", "종목별 동시 확인 테스트"),
+        ("test/test_pipeline.py", "수집/분석/알림 파이프라인 테스트"),
+        ("test/test_cycle_budget.py", "주기 마감 시한 테스트"),
+        ("test/test_candle_scheduler.py", "봉 마감 스케줄러 테스트"),
+        ("test/test_dirty_tracking.py", "감지기 결과 재사용 테스트"),
     ]
     
     # 선택적 테스트 (오류 발생해도 계속)
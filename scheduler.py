@@ -0,0 +1,106 @@
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# 봉이 아니라 CHECK_INTERVAL_MINUTES마다 확인하는 티커 기반 조건(가격/거래량 변동)의 타이머 이름
+TICKER_TIMER = 'ticker'
+
+
+class CandleCloseScheduler:
+    """timeframe별 타이머로 다음 봉 마감 시각과 그때 마감되는 timeframe들을 계산합니다.
+
+    봉 경계는 거래소와 같이 UTC epoch 기준(1d는 UTC 자정)이며, 같은 시각에 마감되는 timeframe은
+    한 번에 반환합니다. 시각은 epoch 초(time.time 기준)입니다.
+    """
+
+    def __init__(self, periods: Dict[str, int]):
+        """periods: {타이머 이름(timeframe 또는 TICKER_TIMER): 주기(초)}"""
+        if not periods:
+            raise ValueError("타이머가 하나 이상 필요합니다.")
+        self.periods = dict(sorted(periods.items(), key=lambda item: item[1]))
+
+    def next_close(self, now: Optional[float] = None) -> Tuple[int, List[str]]:
+        """now 이후 가장 가까운 봉 마감 시각과 그때 마감되는 타이머 이름 목록 (짧은 주기 순)"""
+        now = time.time() if now is None else now
+        closes = {name: (int(now // period) + 1) * period for name, period in self.periods.items()}
+        close_at = min(closes.values())
+        return close_at, [name for name, close in closes.items() if close == close_at]
+
+    def due_at(self, close_times: Iterable[int]) -> List[str]:
+        """주어진 봉 마감 시각들 중 하나에라도 마감되는 타이머 이름 목록 (짧은 주기 순)"""
+        close_times = [int(close) for close in close_times]
+        return [name for name, period in self.periods.items()
+                if any(close % period == 0 for close in close_times)]
+
+
+class CycleBudget:
+    """한 모니터링 주기의 마감 시한과 예산 사용량을 기록합니다.
+
+    마감 시한은 다음 주기가 시작되는 봉 마감 시각이며, 시한이 지나면 아직 시작하지 않은 종목은
+    건너뛰고(skipped) 그때까지 확인한 결과만 남깁니다. 시한 전에 종목당 제한 시간을 넘겨 제외된
+    종목은 따로 셉니다(timed_out). 시간은 time.monotonic 기준입니다.
+    """
+
+    def __init__(self, deadline: Optional[float] = None, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self.started = clock()
+        self.deadline = deadline
+        self.finished: Optional[float] = None
+        self.total = 0
+        self.checked = 0
+        self.skipped = 0
+        self.timed_out = 0
+        self.alerts = 0
+
+    @classmethod
+    def until(cls, close_at: float, margin_seconds: float = 0.0, now: Optional[float] = None) -> 'CycleBudget':
+        """봉 마감 시각 close_at(epoch 초)보다 margin_seconds 앞선 시각을 마감 시한으로 하는 예산을 만듭니다."""
+        now = time.time() if now is None else now
+        budget = cls()
+        budget.deadline = budget.started + (close_at - now) - margin_seconds
+        return budget
+
+    @property
+    def budget_seconds(self) -> Optional[float]:
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - self.started)
+
+    @property
+    def elapsed(self) -> float:
+        return (self.finished if self.finished is not None else self._clock()) - self.started
+
+    def remaining(self) -> Optional[float]:
+        """마감 시한까지 남은 시간 (초, 시한이 없으면 None)"""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - self._clock())
+
+    def expired(self) -> bool:
+        return self.deadline is not None and self._clock() >= self.deadline
+
+    def record_timeout(self, count: int = 1):
+        """제한 시간에 걸려 제외된 종목을 기록합니다 (주기 마감 시한 때문이면 skipped, 아니면 timed_out)."""
+        if self.expired():
+            self.skipped += count
+        else:
+            self.timed_out += count
+
+    @property
+    def partial(self) -> bool:
+        """마감 시한 때문에 건너뛴 종목이 있는지 여부"""
+        return self.skipped > 0
+
+    def finish(self):
+        self.finished = self._clock()
+
+    def summary(self) -> str:
+        checked = f"확인 {self.checked}/{self.total}종목, 알림 {self.alerts}개"
+        if self.skipped:
+            checked += f", 시한 초과로 {self.skipped}종목 건너뜀"
+        if self.timed_out:
+            checked += f", 종목당 제한 시간 초과 {self.timed_out}종목"
+        budget = self.budget_seconds
+        if budget is None:
+            return f"{self.elapsed:.1f}초 ({checked})"
+        usage = self.elapsed / budget if budget > 0 else float('inf')
+        return f"{self.elapsed:.1f}초/{budget:.1f}초 ({usage:.0%}, {checked})"
@@ -0,0 +1,455 @@
+import copy
+import math
+import time
+from collections import deque
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from candles import CandleArrays
+from market_data import INTERVAL_MS
+
+# 지표 지정: (이름, 파라미터 튜플) 예) ('macd', (12, 26, 9))
+IndicatorSpec = Tuple[str, Tuple]
+
+
+class _EMAState:
+    """pandas ewm(span=period, adjust=False)와 같은 순서로 계산하는 EMA 평균 상태"""
+
+    __slots__ = ('period', 'alpha', 'decay', 'count', 'average')
+
+    def __init__(self, period: int):
+        self.period = period
+        # pandas는 span을 com으로 바꾼 뒤 alpha를 구함
+        self.alpha = 1.0 / (1.0 + (period - 1) / 2.0)
+        self.decay = 1.0 - self.alpha
+        self.count = 0
+        self.average = np.nan
+
+    def next(self, value: float) -> float:
+        """상태를 바꾸지 않고 value를 반영한 평균을 반환합니다."""
+        if self.count == 0:
+            return value
+        if self.average == value:
+            return self.average
+        return (self.decay * self.average + self.alpha * value) / (self.decay + self.alpha)
+
+    def push(self, value: float) -> float:
+        self.average = self.next(value)
+        self.count += 1
+        return self.average
+
+
+def _cross(previous: float, current: float) -> int:
+    """0선 교차 방향: 위로 1, 아래로 -1, 없으면 0"""
+    if math.isnan(previous) or math.isnan(current):
+        return 0
+    if previous <= 0 < current:
+        return 1
+    if previous >= 0 > current:
+        return -1
+    return 0
+
+
+class StreamingEMA:
+    """EMA 종가 (ta EMAIndicator와 비트 단위로 같음, 앞의 period-1개는 NaN)"""
+
+    __slots__ = ('ema',)
+
+    def __init__(self, period: int):
+        self.ema = _EMAState(period)
+
+    def update(self, candle: Sequence[float]) -> float:
+        """마감된 캔들(open, high, low, close, volume)을 반영하고 값을 반환합니다."""
+        self.ema.push(candle[3])
+        return self.value
+
+    def peek(self, candle: Sequence[float]) -> float:
+        """상태를 바꾸지 않고 다음 캔들이 candle일 때의 값을 반환합니다."""
+        if self.ema.count + 1 < self.ema.period:
+            return np.nan
+        return self.ema.next(candle[3])
+
+    @property
+    def value(self) -> float:
+        return self.ema.average if self.ema.count >= self.ema.period else np.nan
+
+
+class StreamingMACD:
+    """MACD 선/시그널/히스토그램 (ta MACD와 비트 단위로 같음)
+
+    cross는 히스토그램(MACD - 시그널)이 이번 캔들에서 0을 위로(1)/아래로(-1) 지났는지 나타냅니다.
+    """
+
+    __slots__ = ('fast', 'slow', 'signal', 'histogram', '_value')
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        self.fast = _EMAState(fast)
+        self.slow = _EMAState(slow)
+        self.signal = _EMAState(signal)
+        # 마지막으로 반영한 캔들의 히스토그램 (교차 판정용)
+        self.histogram = np.nan
+        self._value = self._result(np.nan, np.nan, 0)
+
+    @staticmethod
+    def _result(macd: float, signal: float, cross: int) -> Dict[str, float]:
+        return {'macd': macd, 'signal': signal, 'histogram': macd - signal, 'cross': cross}
+
+    def _next(self, close: float) -> Tuple[float, float, float, float]:
+        fast = self.fast.next(close)
+        slow = self.slow.next(close)
+        count = self.fast.count + 1
+        macd = fast - slow if count >= max(self.fast.period, self.slow.period) else np.nan
+        signal_average = self.signal.next(macd) if not math.isnan(macd) else self.signal.average
+        signal_count = self.signal.count + (0 if math.isnan(macd) else 1)
+        signal = signal_average if signal_count >= self.signal.period else np.nan
+        return fast, slow, macd, signal
+
+    def update(self, candle: Sequence[float]) -> Dict[str, float]:
+        """마감된 캔들(open, high, low, close, volume)을 반영하고 값을 반환합니다."""
+        close = candle[3]
+        _, _, macd, signal = self._next(close)
+        self.fast.push(close)
+        self.slow.push(close)
+        if not math.isnan(macd):
+            # 시그널은 MACD가 처음 계산된 캔들부터 평활 (ta와 같이 앞의 NaN은 건너뜀)
+            self.signal.push(macd)
+        self._value = self._result(macd, signal, _cross(self.histogram, macd - signal))
+        self.histogram = macd - signal
+        return self._value
+
+    def peek(self, candle: Sequence[float]) -> Dict[str, float]:
+        """상태를 바꾸지 않고 다음 캔들이 candle일 때의 값을 반환합니다."""
+        _, _, macd, signal = self._next(candle[3])
+        return self._result(macd, signal, _cross(self.histogram, macd - signal))
+
+    @property
+    def value(self) -> Dict[str, float]:
+        return self._value
+
+
+class EMACross:
+    """빠른/느린 EMA와 교차 방향 (cross: 빠른 EMA가 위로 교차 1, 아래로 교차 -1)"""
+
+    __slots__ = ('fast', 'slow', 'spread', '_value')
+
+    def __init__(self, fast: int = 9, slow: int = 21):
+        self.fast = StreamingEMA(fast)
+        self.slow = StreamingEMA(slow)
+        # 마지막으로 반영한 캔들의 빠른 EMA - 느린 EMA
+        self.spread = np.nan
+        self._value = {'fast': np.nan, 'slow': np.nan, 'cross': 0}
+
+    def update(self, candle: Sequence[float]) -> Dict[str, float]:
+        """마감된 캔들(open, high, low, close, volume)을 반영하고 값을 반환합니다."""
+        fast = self.fast.update(candle)
+        slow = self.slow.update(candle)
+        self._value = {'fast': fast, 'slow': slow, 'cross': _cross(self.spread, fast - slow)}
+        self.spread = fast - slow
+        return self._value
+
+    def peek(self, candle: Sequence[float]) -> Dict[str, float]:
+        """상태를 바꾸지 않고 다음 캔들이 candle일 때의 값을 반환합니다."""
+        fast = self.fast.peek(candle)
+        slow = self.slow.peek(candle)
+        return {'fast': fast, 'slow': slow, 'cross': _cross(self.spread, fast - slow)}
+
+    @property
+    def value(self) -> Dict[str, float]:
+        return self._value
+
+
+class _RollingWindow:
+    """최근 period개 값의 평균/분산을 O(1)로 갱신하는 창 (Welford 방식)
+
+    빼고 더하는 오차가 쌓이지 않도록 창이 한 바퀴 돌 때마다 버퍼로 다시 계산합니다 (분할 상환 O(1)).
+    """
+
+    __slots__ = ('period', 'values', 'mean', 'm2', 'since_sync')
+
+    def __init__(self, period: int):
+        self.period = period
+        self.values = deque(maxlen=period)
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.since_sync = 0
+
+    def next(self, value: float) -> Tuple[float, float]:
+        """상태를 바꾸지 않고 value를 넣은 뒤의 (평균, 제곱편차 합)을 반환합니다."""
+        if len(self.values) < self.period:
+            count = len(self.values) + 1
+            delta = value - self.mean
+            mean = self.mean + delta / count
+            return mean, self.m2 + delta * (value - mean)
+        old = self.values[0]
+        mean = self.mean + (value - old) / self.period
+        return mean, self.m2 + (value - old) * (value - mean + old - self.mean)
+
+    def push(self, value: float) -> Tuple[float, float]:
+        """value를 넣고 (평균, 제곱편차 합)을 반환합니다 (재계산 전 값이라 next와 항상 같음)."""
+        result = self.mean, self.m2 = self.next(value)
+        self.values.append(value)
+        self.since_sync += 1
+        if self.since_sync >= self.period and len(self.values) == self.period:
+            self.mean = math.fsum(self.values) / self.period
+            self.m2 = math.fsum((v - self.mean) ** 2 for v in self.values)
+            self.since_sync = 0
+        return result
+
+    def full_after_push(self) -> bool:
+        return len(self.values) + 1 >= self.period
+
+
+class StreamingBollinger:
+    """볼린저 밴드 (period개 종가의 평균 ± deviations × 모표준편차, ta BollingerBands와 같은 정의)"""
+
+    __slots__ = ('window', 'deviations', '_value')
+
+    def __init__(self, period: int = 20, deviations: float = 2.0):
+        self.window = _RollingWindow(period)
+        self.deviations = deviations
+        self._value = self._result(np.nan, np.nan)
+
+    def _result(self, mean: float, m2: float) -> Dict[str, float]:
+        std = math.sqrt(max(m2 / self.window.period, 0.0)) if not math.isnan(m2) else np.nan
+        return {'middle': mean, 'upper': mean + self.deviations * std, 'lower': mean - self.deviations * std}
+
+    def update(self, candle: Sequence[float]) -> Dict[str, float]:
+        """마감된 캔들(open, high, low, close, volume)을 반영하고 값을 반환합니다."""
+        ready = self.window.full_after_push()
+        mean, m2 = self.window.push(candle[3])
+        self._value = self._result(mean, m2) if ready else self._result(np.nan, np.nan)
+        return self._value
+
+    def peek(self, candle: Sequence[float]) -> Dict[str, float]:
+        """상태를 바꾸지 않고 다음 캔들이 candle일 때의 값을 반환합니다."""
+        if not self.window.full_after_push():
+            return self._result(np.nan, np.nan)
+        return self._result(*self.window.next(candle[3]))
+
+    @property
+    def value(self) -> Dict[str, float]:
+        return self._value
+
+
+class StreamingATR:
+    """Wilder ATR (첫 period개 진폭의 평균으로 시작, ta AverageTrueRange와 같은 정의)
+
+    true_range는 마지막 캔들의 진폭이며, ATR 대비 진폭으로 변동성 확장을 판단할 수 있습니다.
+    """
+
+    __slots__ = ('period', 'count', 'prev_close', 'total', 'atr', '_value')
+
+    def __init__(self, period: int = 14):
+        self.period = period
+        self.count = 0
+        self.prev_close = np.nan
+        # 첫 period개 진폭 합 (초기 평균용)
+        self.total = 0.0
+        self.atr = np.nan
+        self._value = {'atr': np.nan, 'true_range': np.nan}
+
+    def _next(self, candle: Sequence[float]) -> Tuple[float, float]:
+        high, low = candle[1], candle[2]
+        true_range = high - low
+        if self.count:
+            true_range = max(true_range, abs(high - self.prev_close), abs(low - self.prev_close))
+        count = self.count + 1
+        if count < self.period:
+            return np.nan, true_range
+        if count == self.period:
+            return (self.total + true_range) / self.period, true_range
+        return (self.atr * (self.period - 1) + true_range) / self.period, true_range
+
+    def update(self, candle: Sequence[float]) -> Dict[str, float]:
+        """마감된 캔들(open, high, low, close, volume)을 반영하고 값을 반환합니다."""
+        atr, true_range = self._next(candle)
+        if self.count + 1 < self.period:
+            self.total += true_range
+        self.atr = atr
+        self.prev_close = candle[3]
+        self.count += 1
+        self._value = {'atr': atr, 'true_range': true_range}
+        return self._value
+
+    def peek(self, candle: Sequence[float]) -> Dict[str, float]:
+        """상태를 바꾸지 않고 다음 캔들이 candle일 때의 값을 반환합니다."""
+        atr, true_range = self._next(candle)
+        return {'atr': atr, 'true_range': true_range}
+
+    @property
+    def value(self) -> Dict[str, float]:
+        return self._value
+
+
+class StreamingVWAP:
+    """최근 period개 캔들의 거래량 가중 평균 가격 (대표가격 (고가+저가+종가)/3, ta VWAP과 같은 정의)
+
+    합계는 더하고 빼며 O(1)로 갱신하고, 창이 한 바퀴 돌 때마다 버퍼로 다시 계산합니다.
+    """
+
+    __slots__ = ('period', 'values', 'price_volume', 'volume', 'since_sync', '_value')
+
+    def __init__(self, period: int = 14):
+        self.period = period
+        self.values = deque(maxlen=period)
+        self.price_volume = 0.0
+        self.volume = 0.0
+        self.since_sync = 0
+        self._value = np.nan
+
+    def _next(self, candle: Sequence[float]) -> Tuple[float, float, float]:
+        volume = candle[4]
+        price_volume = (candle[1] + candle[2] + candle[3]) / 3.0 * volume
+        total_pv = self.price_volume + price_volume
+        total_volume = self.volume + volume
+        if len(self.values) == self.period:
+            old_pv, old_volume = self.values[0]
+            total_pv -= old_pv
+            total_volume -= old_volume
+        return price_volume, total_pv, total_volume
+
+    def _vwap(self, total_pv: float, total_volume: float, count: int) -> float:
+        if count < self.period or total_volume <= 0:
+            return np.nan
+        return total_pv / total_volume
+
+    def update(self, candle: Sequence[float]) -> float:
+        """마감된 캔들(open, high, low, close, volume)을 반영하고 값을 반환합니다."""
+        price_volume, self.price_volume, self.volume = self._next(candle)
+        self.values.append((price_volume, candle[4]))
+        # 재계산 전 합계로 값을 구해 같은 캔들의 peek 결과와 일치시킴
+        self._value = self._vwap(self.price_volume, self.volume, len(self.values))
+        self.since_sync += 1
+        if self.since_sync >= self.period and len(self.values) == self.period:
+            self.price_volume = math.fsum(pv for pv, _ in self.values)
+            self.volume = math.fsum(v for _, v in self.values)
+            self.since_sync = 0
+        return self._value
+
+    def peek(self, candle: Sequence[float]) -> float:
+        """상태를 바꾸지 않고 다음 캔들이 candle일 때의 값을 반환합니다."""
+        _, total_pv, total_volume = self._next(candle)
+        return self._vwap(total_pv, total_volume, min(len(self.values) + 1, self.period))
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+
+# 이름 -> 증분 지표 클래스 (파라미터는 생성자 인자 순서)
+STREAMING_INDICATORS = {
+    'ema': StreamingEMA,
+    'macd': StreamingMACD,
+    'ema_cross': EMACross,
+    'bollinger': StreamingBollinger,
+    'atr': StreamingATR,
+    'vwap': StreamingVWAP,
+}
+
+
+def create_indicator(spec: IndicatorSpec):
+    name, params = spec
+    return STREAMING_INDICATORS[name](*params)
+
+
+def indicator_lookback(spec: IndicatorSpec) -> int:
+    """지표의 첫 값이 나오는 데 필요한 캔들 수"""
+    name, params = spec
+    if name == 'macd':
+        return params[1] + params[2] - 1
+    if name == 'ema_cross':
+        return max(params[0], params[1])
+    return params[0]
+
+
+class _SeriesState:
+    __slots__ = ('last_timestamp', 'states')
+
+    def __init__(self):
+        self.last_timestamp: Optional[int] = None
+        self.states: Dict[Hashable, object] = {}
+
+
+class IndicatorEngine:
+    """(symbol, interval)별 증분 지표 상태를 유지하는 엔진 (RSIEngine과 같은 방식)
+
+    마감된 캔들은 처음 볼 때 한 번만 반영(commit)하고, 진행 중인 캔들은 상태를 바꾸지 않고
+    계산(peek)합니다. 처음 보는 시리즈, 캔들이 끊긴 시리즈, 새 지표가 추가된 시리즈는
+    받은 마감 캔들 전체로 다시 시작하며, 이후에는 지표마다 캔들당 O(1)로 갱신됩니다.
+    """
+
+    def __init__(self):
+        self._series: Dict[Tuple[str, str], _SeriesState] = {}
+
+    def reset(self, symbol: Optional[str] = None):
+        """상태를 비웁니다 (symbol이 있으면 해당 종목만)."""
+        if symbol is None:
+            self._series.clear()
+        else:
+            for key in [k for k in self._series if k[0] == symbol]:
+                del self._series[key]
+
+    def latest(self, symbol: str, interval: str, candles: CandleArrays,
+               specs: Iterable[IndicatorSpec], now: Optional[float] = None) -> Dict[IndicatorSpec, object]:
+        """마지막 캔들 기준 지표 값을 {spec: 값}으로 반환합니다 (데이터 부족 시 NaN)."""
+        return self.latest_many([symbol], interval, [candles], specs, now)[0]
+
+    def latest_many(self, symbols: List[str], interval: str, candles_list: List[CandleArrays],
+                    specs: Iterable[IndicatorSpec], now: Optional[float] = None) -> List[Dict[IndicatorSpec, object]]:
+        """여러 종목의 마지막 캔들 기준 지표 값을 계산합니다."""
+        specs = [(name, tuple(params)) for name, params in specs]
+        step = INTERVAL_MS.get(interval, INTERVAL_MS["5m"]) // 1000
+        now_s = time.time() if now is None else now
+
+        results = []
+        for symbol, candles in zip(symbols, candles_list):
+            if len(candles) == 0:
+                results.append({spec: create_indicator(spec).value for spec in specs})
+                continue
+
+            # 시작 시간 + 간격이 현재 이전이면 마감된 캔들
+            closed = int(np.searchsorted(candles.timestamp, now_s - step, side='right'))
+            series = self._series.get((symbol, interval))
+            if series is None or not self._continues(series, candles, step, specs):
+                series = _SeriesState()
+                series.states = {spec: create_indicator(spec) for spec in specs}
+                self._series[(symbol, interval)] = series
+                start = 0
+            else:
+                start = int(np.searchsorted(candles.timestamp, series.last_timestamp, side='right'))
+
+            # 마감 캔들 반영 (기존 시리즈면 새로 마감된 캔들 몇 개만)
+            if closed > start:
+                for candle in candles.values[:, start:closed].T.tolist():
+                    for state in series.states.values():
+                        state.update(candle)
+                series.last_timestamp = int(candles.timestamp[closed - 1])
+
+            forming = candles.values[:, closed:].T.tolist()
+            result = {}
+            for spec in specs:
+                state = series.states[spec]
+                if not forming:
+                    result[spec] = state.value
+                elif len(forming) == 1:
+                    result[spec] = state.peek(forming[0])
+                else:
+                    # 마감 판정과 어긋난 캔들이 여러 개면 복사본으로 순서대로 계산
+                    scratch = copy.deepcopy(state)
+                    for candle in forming:
+                        scratch.update(candle)
+                    result[spec] = scratch.value
+            results.append(result)
+        return results
+
+    @staticmethod
+    def _continues(series: _SeriesState, candles: CandleArrays, step: int,
+                   specs: Iterable[IndicatorSpec]) -> bool:
+        """저장된 상태에 받은 캔들을 이어서 반영할 수 있는지 확인합니다."""
+        if series.last_timestamp is None or any(spec not in series.states for spec in specs):
+            return False
+        first = int(candles.timestamp[0])
+        last = int(candles.timestamp[-1])
+        # 마지막 반영 캔들이 범위 안에 있거나 바로 다음 캔들부터 시작해야 함
+        return first <= series.last_timestamp + step and last >= series.last_timestamp
@@ -1,84 +1,331 @@
-import pandas as pd
 import numpy as np
-from ta.momentum import RSIIndicator
 from datetime import datetime, timedelta
 import logging
-from typing import Dict, List, Optional, Tuple
-from binance.client import Client
-from binance.exceptions import BinanceAPIException, BinanceRequestException
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+import asyncio
 import pytz
 
+from market_data import AsyncMarketDataClient, MarketDataError, MAX_KLINES_PER_REQUEST
+from analysis_pool import AnalysisPool, analyze_divergences_many
+from candle_archive import CandleArchive
+from candle_store import CandleStore
+from candles import CandleArrays
+from indicators import (
+    INDICATORS, IndicatorGraph, RSIEngine, closed_count, immediate_divergence, lookback_divergence,
+    pivot_masks, recent_pivot_divergences, rsi_series
+)
+from streaming_indicators import IndicatorEngine, IndicatorSpec, indicator_lookback
+from resampler import resample_candles, resample_ratio, source_window
+
+if TYPE_CHECKING:
+    # pandas는 get_candlestick_data 등 DataFrame 편의 기능에서만 사용 (분석 경로는 NumPy만 사용)
+    import pandas as pd
+
 logger = logging.getLogger(__name__)
 
 
 class TechnicalAnalyzer:
     """기술적 분석을 수행하는 클래스"""
     
-    def __init__(self, client: Client, market_type='spot'):
-        self.client = client
+    # 지원하는 Binance 캔들 간격
+    SUPPORTED_INTERVALS = ("1m", "5m", "15m", "1h", "4h", "1d")
+
+    def __init__(self, market_data: AsyncMarketDataClient, market_type='spot',
+                 base_interval: Optional[str] = None,
+                 candle_archive: Optional[CandleArchive] = None,
+                 analysis_pool: Optional[AnalysisPool] = None):
+        self.market_data = market_data
         self.market_type = market_type
         
-    def get_candlestick_data(self, symbol: str, interval: str, limit: int = 200) -> Optional[pd.DataFrame]:
-        """캔들스틱 데이터를 가져와서 DataFrame으로 변환합니다."""
+        # 설정되면 더 큰 timeframe은 이 간격의 캔들을 로컬에서 합쳐서 만듦 (예: 5m → 15m/1h)
+        self.base_interval = base_interval
+        
+        # 프로세스 수명 동안 유지되는 캔들 저장소 (이후 주기에는 새 캔들만 증분 조회)
+        # candle_archive가 있으면 마감 캔들을 디스크에 보관해 재시작 후에도 이어서 사용
+        self.candle_store = CandleStore(market_data, archive=candle_archive)
+        
+        # 주기(cycle) 단위 캔들 캐시: {(symbol, interval): (캔들 수, 조회 Task)}
+        self._cycle_windows: Optional[Dict[str, int]] = None
+        self._cycle_cache: Dict[Tuple[str, str], Tuple[int, asyncio.Future]] = {}
+        
+        # 주기 단위 지표 그래프: (symbol, interval, 지표, 파라미터)마다 한 번만 계산해 모든 조건이 공유
+        self._indicator_graph: Optional[IndicatorGraph] = None
+        
+        # (symbol, interval, period)별 Wilder RSI 상태 (새로 마감된 캔들만 O(1)로 반영)
+        self.rsi_engine = RSIEngine()
+        
+        # (symbol, interval)별 MACD/EMA 교차/볼린저/ATR/VWAP 증분 상태
+        self.indicator_engine = IndicatorEngine()
+        
+        # 감지기 결과 재사용: {(감지기, symbol, interval, 파라미터): (캔들 표식, 알림 메시지 또는 다이버전스 감지 결과)}
+        # 감지기가 읽는 캔들 값이 지난 분석 때와 같으면 다시 실행하지 않음 (주기별 계산/재사용 횟수 기록)
+        self._analysis_results: Dict[Tuple, Tuple[Tuple, List]] = {}
+        self.analysis_computed = 0
+        self.analysis_reused = 0
+        
+        # 설정되면 다이버전스 감지를 워커 프로세스에서 실행 (없으면 이벤트 루프에서 실행)
+        self.analysis_pool = analysis_pool
+
+    @staticmethod
+    def rsi_window(periods: List[int]) -> int:
+        """RSI 조건 분석에 필요한 캔들 수"""
+        return max(periods) + 50
+
+    @staticmethod
+    def indicator_specs(conditions: Dict) -> List[IndicatorSpec]:
+        """지표 조건 설정에서 증분 지표 목록을 만듭니다 (설정에 없는 지표는 제외)."""
+        specs = []
+        if 'macd' in conditions:
+            macd = conditions['macd']
+            specs.append(('macd', (macd.get('fast', 12), macd.get('slow', 26), macd.get('signal', 9))))
+        if 'ema_cross' in conditions:
+            cross = conditions['ema_cross']
+            specs.append(('ema_cross', (cross.get('fast', 9), cross.get('slow', 21))))
+        if 'bollinger' in conditions:
+            bands = conditions['bollinger']
+            specs.append(('bollinger', (bands.get('period', 20), float(bands.get('deviations', 2.0)))))
+        if 'atr' in conditions:
+            specs.append(('atr', (conditions['atr'].get('period', 14),)))
+        if 'vwap' in conditions:
+            specs.append(('vwap', (conditions['vwap'].get('period', 14),)))
+        return specs
+
+    @staticmethod
+    def indicator_window(specs: List[IndicatorSpec]) -> int:
+        """증분 지표 조건 분석에 필요한 캔들 수"""
+        return max((indicator_lookback(spec) for spec in specs), default=0) + 50
+
+    @staticmethod
+    def immediate_divergence_window(rsi_period: int, lookback_periods: int) -> int:
+        """즉시 다이버전스 분석에 필요한 캔들 수"""
+        return lookback_periods + rsi_period + 5
+
+    @staticmethod
+    def divergence_window(rsi_period: int, lookback_periods: int) -> int:
+        """lookback 다이버전스 분석에 필요한 캔들 수"""
+        return lookback_periods + rsi_period + 10
+
+    @staticmethod
+    def pivot_divergence_window(rsi_period: int, left_bars: int, right_bars: int,
+                                lookback_range: Tuple[int, int], recent_bars: int) -> int:
+        """피벗 다이버전스 분석에 필요한 캔들 수 (진행 중인 캔들 포함)"""
+        return rsi_period + left_bars + lookback_range[1] + right_bars + recent_bars + 11
+
+    def resample_source_limit(self, interval: str, limit: int) -> Optional[int]:
+        """interval 캔들 limit개를 base_interval에서 리샘플링할 때 필요한 캔들 수
+
+        리샘플링하지 않는 경우(기준 간격 미설정, 배수가 아님, 한 번의 요청 한도 초과) None을 반환합니다.
+        """
+        if not self.base_interval or interval == self.base_interval:
+            return None
+        if resample_ratio(self.base_interval, interval) is None:
+            return None
+        needed = source_window(self.base_interval, interval, limit)
+        if needed > MAX_KLINES_PER_REQUEST:
+            return None
+        return needed
+
+    def fetch_window_sizes(self, window_sizes: Dict[str, int]) -> Dict[str, int]:
+        """리샘플링을 반영해 실제로 조회할 {interval: 캔들 수}를 반환합니다."""
+        fetch_windows: Dict[str, int] = {}
+        for interval, window in window_sizes.items():
+            needed = self.resample_source_limit(interval, window)
+            if needed is None:
+                fetch_windows[interval] = max(fetch_windows.get(interval, 0), window)
+            else:
+                base = self.base_interval
+                fetch_windows[base] = max(fetch_windows.get(base, 0), needed)
+        return fetch_windows
+
+    def begin_cycle(self, window_sizes: Dict[str, int]):
+        """모니터링 주기를 시작합니다.
+
+        window_sizes는 {interval: 필요한 최대 캔들 수}이며, 주기 동안
+        (symbol, interval)마다 이 크기로 한 번만 조회한 뒤 모든 분석기에 잘라서 제공합니다.
+        리샘플링되는 interval은 기준 간격 캔들을 그만큼 더 넉넉히 조회합니다.
+        """
+        windows = dict(window_sizes)
+        for interval, window in self.fetch_window_sizes(window_sizes).items():
+            windows[interval] = max(windows.get(interval, 0), window)
+        self._cycle_windows = windows
+        self._cycle_cache = {}
+        self._indicator_graph = IndicatorGraph()
+        self.analysis_computed = 0
+        self.analysis_reused = 0
+
+    def end_cycle(self):
+        """모니터링 주기를 종료하고 캔들 캐시와 지표 그래프를 비웁니다."""
+        graph = self._indicator_graph
+        if graph is not None and (graph.computed or graph.reused):
+            logger.debug(f"지표 그래프: 계산 {graph.computed}회, 재사용 {graph.reused}회")
+        if self.analysis_computed or self.analysis_reused:
+            logger.debug(f"감지기 결과: 계산 {self.analysis_computed}회, 캔들 변경 없음으로 재사용 {self.analysis_reused}회")
+        self._cycle_windows = None
+        self._cycle_cache = {}
+        self._indicator_graph = None
+
+    def load_history(self, symbol: str, interval: str, start: Optional[datetime] = None,
+                     end: Optional[datetime] = None) -> Optional[CandleArrays]:
+        """디스크 캔들 아카이브(run_backfill.py로 채운 데이터 포함)에서 과거 캔들을 읽습니다.
+
+        start/end는 캔들 시작 시간 기준 [start, end) 구간이며, 없으면 저장된 전체를 반환합니다.
+        """
+        archive = self.candle_store.archive
+        if archive is None:
+            logger.warning("캔들 아카이브가 설정되지 않아 과거 캔들을 읽을 수 없습니다.")
+            return None
+        return archive.load_range(
+            symbol, interval,
+            start=int(start.timestamp()) if start else None,
+            end=int(end.timestamp()) if end else None
+        )
+
+    async def get_candlestick_data(self, symbol: str, interval: str, limit: int = 200) -> Optional['pd.DataFrame']:
+        """캔들스틱 데이터를 가져와서 DataFrame으로 변환합니다 (pandas 필요, 분석 경로는 get_candles 사용).
+
+        주기가 진행 중이면 주기 캐시에서 최근 limit개만 잘라서 반환합니다.
+        DataFrame은 조회한 캔들마다 한 번만 만들어 같은 주기의 분석기들이 공유합니다.
+        """
+        candles = await self._get_cached_candles(symbol, interval, limit)
+        if candles is None:
+            return None
+        return candles.df.iloc[-limit:].reset_index(drop=True)
+
+    async def get_candles(self, symbol: str, interval: str, limit: int = 200) -> Optional[CandleArrays]:
+        """캔들을 DataFrame 변환 없이 컬럼별 NumPy 배열로 반환합니다."""
+        candles = await self._get_cached_candles(symbol, interval, limit)
+        if candles is None:
+            return None
+        return candles.tail(limit)
+
+    async def get_indicator(self, symbol: str, interval: str, name: str, params: Tuple,
+                            limit: int) -> Optional[Tuple[CandleArrays, np.ndarray]]:
+        """최근 limit개 캔들과 그 구간의 지표 배열(indicators.INDICATORS의 name)을 반환합니다.
+
+        주기 중에는 주기 캐시의 캔들 전체(모든 조건이 필요로 하는 가장 큰 창)로 (symbol, interval,
+        name, params)마다 한 번만 계산해 조건들이 뒤에서 잘라 쓰고, 주기 밖에서는 limit개로 바로 계산합니다.
+        """
+        candles = await self._get_cached_candles(symbol, interval, limit)
+        if candles is None:
+            return None
+        if self._indicator_graph is None:
+            candles = candles.tail(limit)
+            return candles, INDICATORS[name](candles, *params)
+        values = self._indicator_graph.series(symbol, interval, candles, name, params)
+        return candles.tail(limit), values[-limit:]
+
+    async def _get_cached_candles(self, symbol: str, interval: str, limit: int) -> Optional[CandleArrays]:
+        """주기 캐시를 거쳐 최소 limit개의 캔들을 반환합니다."""
+        if self._cycle_windows is None:
+            return await self._fetch_candles(symbol, interval, limit)
+        
+        key = (symbol, interval)
+        cached = self._cycle_cache.get(key)
+        if cached is None or cached[0] < limit:
+            fetch_limit = max(limit, self._cycle_windows.get(interval, 0))
+            task = asyncio.ensure_future(self._fetch_candles(symbol, interval, fetch_limit))
+            cached = (fetch_limit, task)
+            self._cycle_cache[key] = cached
+        
+        return await cached[1]
+
+    async def prefetch_candles(self, symbol: str) -> bool:
+        """주기 캐시에 종목의 모든 timeframe 캔들을 미리 채웁니다 (파이프라인 수집 단계).
+
+        반환: 모든 timeframe 캔들을 받았는지 여부 (주기 밖에서는 False)
+        """
+        if self._cycle_windows is None:
+            return False
+        fetched = await asyncio.gather(
+            *(self._get_cached_candles(symbol, interval, window) for interval, window in self._cycle_windows.items()),
+            return_exceptions=True
+        )
+        return all(isinstance(candles, CandleArrays) for candles in fetched)
+
+    async def _fetch_candles(self, symbol: str, interval: str, limit: int) -> Optional[CandleArrays]:
+        """Binance에서 캔들스틱 데이터를 조회합니다."""
         try:
-            # Binance 간격 매핑
-            interval_mapping = {
-                "1m": Client.KLINE_INTERVAL_1MINUTE,
-                "5m": Client.KLINE_INTERVAL_5MINUTE, 
-                "15m": Client.KLINE_INTERVAL_15MINUTE,
-                "1h": Client.KLINE_INTERVAL_1HOUR,
-                "4h": Client.KLINE_INTERVAL_4HOUR,
-                "1d": Client.KLINE_INTERVAL_1DAY
-            }
-            
-            binance_interval = interval_mapping.get(interval, Client.KLINE_INTERVAL_5MINUTE)
+            binance_interval = interval if interval in self.SUPPORTED_INTERVALS else "5m"
             
-            # 시장 타입에 따라 다른 API 사용
-            if self.market_type == 'futures':
-                candlesticks = self.client.futures_klines(
-                    symbol=symbol,
-                    interval=binance_interval,
-                    limit=limit
-                )
+            source_limit = self.resample_source_limit(binance_interval, limit)
+            if source_limit is not None:
+                # 기준 간격 캔들(주기 캐시 공유)을 합쳐서 생성
+                base = await self.get_candles(symbol, self.base_interval, source_limit)
+                if base is None:
+                    return None
+                candles = resample_candles(base, self.base_interval, binance_interval).tail(limit)
+                if len(candles) == 0:
+                    candles = None
             else:
-                candlesticks = self.client.get_klines(
-                    symbol=symbol,
-                    interval=binance_interval,
-                    limit=limit
-                )
+                # 저장소가 warm-up 이후에는 마지막 캔들 이후분만 증분 조회
+                candles = await self.candle_store.get(symbol, binance_interval, limit)
             
-            if not candlesticks:
+            if candles is None:
                 logger.warning(f"{symbol} {interval} 캔들스틱 데이터가 없습니다.")
                 return None
-                
-            # DataFrame으로 변환 (Binance 표준 형식)
-            data = []
-            for candle in candlesticks:
-                data.append({
-                    'timestamp': int(candle[0]) // 1000,  # milliseconds to seconds
-                    'open': float(candle[1]),
-                    'high': float(candle[2]),
-                    'low': float(candle[3]),
-                    'close': float(candle[4]),
-                    'volume': float(candle[5])
-                })
             
-            df = pd.DataFrame(data)
-            df['datetime'] = pd.to_datetime(df['timestamp'], unit='s', utc=True)
-            df = df.sort_values('timestamp').reset_index(drop=True)
+            logger.debug(f"{symbol} {interval} 데이터 {len(candles)}개 로드 완료")
+            return candles
             
-            logger.debug(f"{symbol} {interval} 데이터 {len(df)}개 로드 완료")
-            return df
-            
-        except (BinanceAPIException, BinanceRequestException) as e:
+        except MarketDataError as e:
             logger.error(f"{symbol} {interval} 캔들스틱 데이터 조회 오류: {e}")
             return None
         except Exception as e:
             logger.error(f"{symbol} {interval} 데이터 처리 오류: {e}")
             return None
     
-    def calculate_rsi(self, df: pd.DataFrame, periods: List[int]) -> Dict[str, float]:
-        """여러 기간의 RSI를 계산합니다."""
+    @staticmethod
+    def series_marker(interval: str, candles: CandleArrays, now: Optional[float] = None,
+                      forming: str = 'ohlcv') -> Optional[Tuple]:
+        """감지기 입력 캔들의 표식: ((마지막 마감 캔들 시작 시간, 종가), 마지막 캔들 시작 시간, 진행 중인 캔들 값)
+
+        forming은 감지기가 진행 중인 캔들에서 읽는 값('ohlcv' 중 일부)입니다. RSI peek이나 즉시 다이버전스는
+        종가만('c'), 볼린저/VWAP 같은 지표 조건은 전부 읽으므로 그 값이 바뀌면 표식이 달라져 다시 분석합니다.
+        마감된 캔들만 읽는 감지기(피벗/lookback 다이버전스)는 ''로 두면 새 캔들이 마감될 때만 다시 분석합니다.
+        """
+        if len(candles) == 0:
+            return None
+        closed = closed_count(candles.timestamp, interval, now)
+        last_closed = (int(candles.timestamp[closed - 1]), float(candles.close[closed - 1])) if closed else None
+        if not forming:
+            return (last_closed,)
+        return (last_closed, int(candles.timestamp[-1]),
+                tuple(float(candles.values['ohlcv'.index(field), -1]) for field in forming))
+
+    def _cached_result(self, key: Tuple, marker: Optional[Tuple]) -> Optional[List]:
+        """캔들 표식(marker)이 지난 분석과 같으면 저장된 결과를 반환합니다."""
+        if marker is None:
+            return None
+        cached = self._analysis_results.get(key)
+        if cached is None or cached[0] != marker:
+            return None
+        self.analysis_reused += 1
+        return cached[1]
+
+    def _store_result(self, key: Tuple, marker: Optional[Tuple], results: List):
+        """감지기 결과를 저장합니다 (발생 시각이 들어가는 메시지는 저장하지 않고 결과로 저장해 출력할 때 만듦)."""
+        self.analysis_computed += 1
+        if marker is not None:
+            self._analysis_results[key] = (marker, list(results))
+
+    def reset_analysis_cache(self, symbol: Optional[str] = None):
+        """저장된 감지기 결과를 지웁니다 (symbol이 없으면 전체). 다음 분석은 감지기를 다시 실행합니다."""
+        if symbol is None:
+            self._analysis_results.clear()
+        else:
+            for key in [key for key in self._analysis_results if key[1] == symbol]:
+                del self._analysis_results[key]
+
+    def retain_analysis_cache(self, symbols: Iterable[str]) -> int:
+        """모니터링 대상에서 빠진 종목의 감지기 결과를 지우고, 지운 개수를 반환합니다."""
+        symbols = set(symbols)
+        stale = [key for key in self._analysis_results if key[1] not in symbols]
+        for key in stale:
+            del self._analysis_results[key]
+        return len(stale)
+
+    def calculate_rsi(self, df: 'pd.DataFrame', periods: List[int]) -> Dict[str, float]:
+        """여러 기간의 RSI를 계산합니다 (캔들 전체를 다시 계산하는 배치 경로, ta와 같은 값)."""
         rsi_values = {}
         
         if df is None or len(df) < max(periods) + 10:
@@ -86,19 +333,15 @@ class TechnicalAnalyzer:
             return rsi_values
         
         try:
+            close = np.asarray(df['close'], dtype=np.float64)
             for period in periods:
                 if len(df) >= period + 10:  # RSI 계산에 충분한 데이터가 있는지 확인
-                    rsi_indicator = RSIIndicator(df['close'], window=period)
-                    rsi_series = rsi_indicator.rsi()
+                    values = rsi_series(close, period)
                     
                     # 최신 RSI 값 (NaN이 아닌 마지막 값)
-                    latest_rsi = None
-                    for i in range(len(rsi_series) - 1, -1, -1):
-                        if not pd.isna(rsi_series.iloc[i]):
-                            latest_rsi = rsi_series.iloc[i]
-                            break
-                    
-                    if latest_rsi is not None:
+                    valid = np.flatnonzero(~np.isnan(values))
+                    if len(valid):
+                        latest_rsi = values[valid[-1]]
                         rsi_values[f'rsi_{period}'] = round(latest_rsi, 2)
                         logger.debug(f"RSI({period}): {latest_rsi:.2f}")
                 else:
@@ -109,73 +352,275 @@ class TechnicalAnalyzer:
             
         return rsi_values
     
-    def analyze_rsi_conditions(self, symbol: str, timeframes: List[str], periods: List[int], 
+    def latest_rsi(self, symbol: str, timeframe: str, candles: CandleArrays,
+                   periods: List[int]) -> Dict[str, float]:
+        """마지막 캔들 기준 RSI를 계산합니다 (calculate_rsi와 같은 형식, _latest_rsi_many 참고)."""
+        rsi_values = {}
+        
+        if candles is None or len(candles) < max(periods) + 10:
+            logger.warning(f"RSI 계산을 위한 데이터가 부족합니다. (필요: {max(periods) + 10}개, 실제: {len(candles) if candles is not None else 0}개)")
+            return rsi_values
+        
+        try:
+            latest = self._latest_rsi_many([symbol], timeframe, [candles], periods)[0]
+            for period in periods:
+                value = latest.get(period)
+                if value is not None and not np.isnan(value):
+                    rsi_values[f'rsi_{period}'] = round(float(value), 2)
+                    logger.debug(f"RSI({period}): {value:.2f}")
+        except Exception as e:
+            logger.error(f"RSI 계산 오류: {e}")
+            
+        return rsi_values
+    
+    def _latest_rsi_many(self, symbols: List[str], timeframe: str, candles_list: List[CandleArrays],
+                         periods: List[int]) -> List[Dict[int, float]]:
+        """마지막 캔들 기준 기간별 RSI (주기 중에는 지표 그래프, 주기 밖에서는 증분 RSI 엔진)
+
+        주기 중에는 다이버전스 감지기와 같은 지표 그래프의 RSI 배열을 읽으므로, 같은 캔들에 대한
+        과매도/과매수 알림과 다이버전스 알림의 RSI 값이 같습니다.
+        """
+        if self._indicator_graph is not None:
+            return self._indicator_graph.latest_rsi_many(symbols, timeframe, candles_list, periods)
+        return self.rsi_engine.latest_many(symbols, timeframe, candles_list, periods)
+    
+    async def _rsi_candles(self, symbol: str, timeframe: str, periods: List[int]) -> Optional[CandleArrays]:
+        """RSI 조건에 쓸 캔들 (주기 중에는 지표 그래프와 같은 주기 캔들 전체, 밖에서는 필요한 만큼)"""
+        if self._indicator_graph is not None:
+            return await self._get_cached_candles(symbol, timeframe, self.rsi_window(periods))
+        return await self.get_candles(symbol, timeframe, limit=self.rsi_window(periods))
+    
+    def _rsi_alert_messages(self, symbol: str, timeframe: str, rsi_values: Dict[str, float],
+                            periods: List[int], oversold: float, overbought: float) -> List[str]:
+        """한 timeframe의 RSI 값으로 과매도/과매수 알림 메시지를 만듭니다."""
+        # RSI 조건 확인
+        timeframe_alerts = []
+        oversold_signals = []
+        overbought_signals = []
+        
+        for period in periods:
+            rsi_key = f'rsi_{period}'
+            if rsi_key in rsi_values:
+                rsi_value = rsi_values[rsi_key]
+                
+                if rsi_value <= oversold:
+                    oversold_signals.append(f"RSI({period}): {rsi_value}")
+                elif rsi_value >= overbought:
+                    overbought_signals.append(f"RSI({period}): {rsi_value}")
+        
+        # 알림 메시지 생성
+        if oversold_signals:
+            alert_msg = f"📉 {timeframe} 과매도 신호: {', '.join(oversold_signals)}"
+            timeframe_alerts.append(alert_msg)
+            
+        if overbought_signals:
+            alert_msg = f"📈 {timeframe} 과매수 신호: {', '.join(overbought_signals)}"
+            timeframe_alerts.append(alert_msg)
+        
+        # RSI 정보 표시 (조건에 맞지 않더라도 현재 값 표시)
+        if rsi_values and not timeframe_alerts:
+            rsi_info = []
+            for period in sorted(periods):
+                rsi_key = f'rsi_{period}'
+                if rsi_key in rsi_values:
+                    rsi_info.append(f"RSI({period}): {rsi_values[rsi_key]}")
+            
+            if rsi_info:
+                info_msg = f"📊 {timeframe} RSI: {', '.join(rsi_info)}"
+                # 디버그 정보로 로깅 (알림으로는 보내지 않음)
+                logger.debug(f"{symbol} - {info_msg}")
+        
+        return timeframe_alerts
+    
+    async def analyze_rsi_conditions(self, symbol: str, timeframes: List[str], periods: List[int], 
                              oversold: float, overbought: float) -> List[str]:
         """RSI 조건을 분석하고 알림 메시지를 생성합니다."""
         alerts = []
         
         try:
             for timeframe in timeframes:
-                # 캔들스틱 데이터 가져오기
-                df = self.get_candlestick_data(symbol, timeframe, limit=max(periods) + 50)
+                # 캔들스틱 데이터 가져오기 (DataFrame 변환 없이 배열로)
+                candles = await self._rsi_candles(symbol, timeframe, periods)
                 
-                if df is None:
+                if candles is None:
                     continue
                 
-                # RSI 계산
-                rsi_values = self.calculate_rsi(df, periods)
-                
-                if not rsi_values:
+                # 지난 분석 이후 캔들이 바뀌지 않았으면 이전 결과 재사용
+                key = ('rsi', symbol, timeframe, tuple(periods), oversold, overbought)
+                marker = self.series_marker(timeframe, candles, forming='c')
+                cached = self._cached_result(key, marker)
+                if cached is not None:
+                    alerts.extend(cached)
                     continue
                 
-                # 현재가 정보
-                current_price = df['close'].iloc[-1]
-                
-                # RSI 조건 확인
-                timeframe_alerts = []
-                oversold_signals = []
-                overbought_signals = []
+                # RSI 계산 (새로 마감된 캔들만 반영)
+                rsi_values = self.latest_rsi(symbol, timeframe, candles, periods)
                 
-                for period in periods:
-                    rsi_key = f'rsi_{period}'
-                    if rsi_key in rsi_values:
-                        rsi_value = rsi_values[rsi_key]
-                        
-                        if rsi_value <= oversold:
-                            oversold_signals.append(f"RSI({period}): {rsi_value}")
-                        elif rsi_value >= overbought:
-                            overbought_signals.append(f"RSI({period}): {rsi_value}")
-                
-                # 알림 메시지 생성
-                if oversold_signals:
-                    alert_msg = f"📉 {timeframe} 과매도 신호: {', '.join(oversold_signals)}"
-                    timeframe_alerts.append(alert_msg)
-                    
-                if overbought_signals:
-                    alert_msg = f"📈 {timeframe} 과매수 신호: {', '.join(overbought_signals)}"
-                    timeframe_alerts.append(alert_msg)
-                
-                # RSI 정보 표시 (조건에 맞지 않더라도 현재 값 표시)
-                if rsi_values and not timeframe_alerts:
-                    rsi_info = []
-                    for period in sorted(periods):
-                        rsi_key = f'rsi_{period}'
-                        if rsi_key in rsi_values:
-                            rsi_info.append(f"RSI({period}): {rsi_values[rsi_key]}")
-                    
-                    if rsi_info:
-                        info_msg = f"📊 {timeframe} RSI: {', '.join(rsi_info)}"
-                        # 디버그 정보로 로깅 (알림으로는 보내지 않음)
-                        logger.debug(f"{symbol} - {info_msg}")
+                if not rsi_values:
+                    continue
                 
-                alerts.extend(timeframe_alerts)
+                messages = self._rsi_alert_messages(symbol, timeframe, rsi_values, periods, oversold, overbought)
+                self._store_result(key, marker, messages)
+                alerts.extend(messages)
                 
         except Exception as e:
             logger.error(f"{symbol} RSI 분석 오류: {e}")
             
         return alerts
     
-    def get_rsi_summary(self, symbol: str, timeframes: List[str], periods: List[int]) -> Dict:
+    async def analyze_rsi_conditions_batch(self, symbols: List[str], timeframes: List[str],
+                                           periods: List[int], oversold: float,
+                                           overbought: float) -> Dict[str, List[str]]:
+        """여러 종목의 RSI 조건을 한 번에 분석합니다 (analyze_rsi_conditions와 같은 메시지).
+
+        timeframe마다 전 종목의 캔들을 모아 RSI 엔진(주기 중에는 지표 그래프)에 한 번에 넘기므로, 처음 보는 종목들도
+        (기간 × 종목) 벡터화 커널 한 번으로 계산됩니다. 지난 분석 이후 캔들(진행 중인 캔들 포함)이
+        바뀌지 않은 종목은 계산하지 않고 이전 결과를 사용합니다.
+        """
+        alerts = {symbol: [] for symbol in symbols}
+        required = max(periods) + 10
+        
+        for timeframe in timeframes:
+            try:
+                fetched = await asyncio.gather(
+                    *(self._rsi_candles(symbol, timeframe, periods) for symbol in symbols),
+                    return_exceptions=True
+                )
+                ready = [(symbol, candles) for symbol, candles in zip(symbols, fetched)
+                         if isinstance(candles, CandleArrays) and len(candles) >= required]
+                if len(ready) < len(symbols):
+                    logger.warning(f"{timeframe} RSI 계산을 위한 데이터가 부족한 종목: {len(symbols) - len(ready)}개 (필요: {required}개)")
+                dirty = []
+                for symbol, candles in ready:
+                    key = ('rsi', symbol, timeframe, tuple(periods), oversold, overbought)
+                    marker = self.series_marker(timeframe, candles, forming='c')
+                    cached = self._cached_result(key, marker)
+                    if cached is None:
+                        dirty.append((symbol, candles, key, marker))
+                    else:
+                        alerts[symbol].extend(cached)
+                if not dirty:
+                    continue
+                
+                latest = self._latest_rsi_many([d[0] for d in dirty], timeframe,
+                                               [d[1] for d in dirty], periods)
+                for (symbol, _, key, marker), values in zip(dirty, latest):
+                    rsi_values = {f'rsi_{period}': round(float(values[period]), 2)
+                                  for period in periods if not np.isnan(values[period])}
+                    if rsi_values:
+                        messages = self._rsi_alert_messages(symbol, timeframe, rsi_values, periods,
+                                                            oversold, overbought)
+                        self._store_result(key, marker, messages)
+                        alerts[symbol].extend(messages)
+            except Exception as e:
+                logger.error(f"{timeframe} RSI 일괄 분석 오류: {e}")
+        
+        return alerts
+    
+    def latest_indicators(self, symbol: str, timeframe: str, candles: CandleArrays,
+                          specs: List[IndicatorSpec]) -> Dict[IndicatorSpec, object]:
+        """증분 지표 엔진으로 마지막 캔들 기준 지표 값을 계산합니다 (새로 마감된 캔들만 반영)."""
+        try:
+            return self.indicator_engine.latest(symbol, timeframe, candles, specs)
+        except Exception as e:
+            logger.error(f"{symbol} 지표 계산 오류: {e}")
+            return {}
+
+    def _indicator_alert_messages(self, symbol: str, timeframe: str, values: Dict[IndicatorSpec, object],
+                                  close: float, conditions: Dict) -> List[str]:
+        """한 timeframe의 지표 값으로 교차/돌파/변동성/이격 알림 메시지를 만듭니다."""
+        alerts = []
+        for (name, params), value in values.items():
+            if name == 'macd':
+                if value['cross'] > 0:
+                    alerts.append(f"🟢 {timeframe} MACD 골든크로스: MACD {value['macd']:.6g}, 시그널 {value['signal']:.6g}")
+                elif value['cross'] < 0:
+                    alerts.append(f"🔴 {timeframe} MACD 데드크로스: MACD {value['macd']:.6g}, 시그널 {value['signal']:.6g}")
+            elif name == 'ema_cross':
+                fast, slow = params
+                if value['cross'] > 0:
+                    alerts.append(f"🟢 {timeframe} EMA 골든크로스: EMA({fast}) {value['fast']:.6g} > EMA({slow}) {value['slow']:.6g}")
+                elif value['cross'] < 0:
+                    alerts.append(f"🔴 {timeframe} EMA 데드크로스: EMA({fast}) {value['fast']:.6g} < EMA({slow}) {value['slow']:.6g}")
+            elif name == 'bollinger':
+                if close > value['upper']:
+                    alerts.append(f"📈 {timeframe} 볼린저 상단 돌파: 종가 {close:.6g} > 상단 {value['upper']:.6g}")
+                elif close < value['lower']:
+                    alerts.append(f"📉 {timeframe} 볼린저 하단 이탈: 종가 {close:.6g} < 하단 {value['lower']:.6g}")
+            elif name == 'atr':
+                expansion = conditions['atr'].get('expansion', 1.5)
+                if value['atr'] > 0 and value['true_range'] >= expansion * value['atr']:
+                    ratio = value['true_range'] / value['atr']
+                    alerts.append(f"⚡ {timeframe} 변동성 확장: 진폭 {value['true_range']:.6g} "
+                                  f"(ATR({params[0]}) {value['atr']:.6g}의 {ratio:.1f}배)")
+            elif name == 'vwap':
+                threshold = conditions['vwap'].get('deviation_percent', 2.0)
+                if not np.isnan(value):
+                    deviation = (close - value) / value * 100
+                    if deviation >= threshold:
+                        alerts.append(f"📈 {timeframe} VWAP 상방 이격: {deviation:+.2f}% (VWAP {value:.6g})")
+                    elif deviation <= -threshold:
+                        alerts.append(f"📉 {timeframe} VWAP 하방 이격: {deviation:+.2f}% (VWAP {value:.6g})")
+        if alerts:
+            logger.debug(f"{symbol} {timeframe} 지표 신호 {len(alerts)}개")
+        return alerts
+
+    async def analyze_indicator_conditions(self, symbol: str, timeframes: List[str],
+                                           conditions: Dict) -> List[str]:
+        """MACD/EMA 교차/볼린저/ATR/VWAP 조건을 분석하고 알림 메시지를 생성합니다."""
+        alerts = await self.analyze_indicator_conditions_batch([symbol], timeframes, conditions)
+        return alerts[symbol]
+
+    async def analyze_indicator_conditions_batch(self, symbols: List[str], timeframes: List[str],
+                                                 conditions: Dict) -> Dict[str, List[str]]:
+        """여러 종목의 지표 조건을 한 번에 분석합니다.
+
+        지표 상태는 (symbol, interval)마다 유지되어 이후 주기에는 새로 마감된 캔들만 O(1)로 반영하며,
+        캔들(진행 중인 캔들 포함)이 바뀌지 않은 종목은 계산하지 않고 이전 결과를 사용합니다.
+        """
+        alerts = {symbol: [] for symbol in symbols}
+        specs = self.indicator_specs(conditions)
+        if not specs:
+            return alerts
+        window = self.indicator_window(specs)
+        required = max(indicator_lookback(spec) for spec in specs)
+        
+        for timeframe in timeframes:
+            try:
+                fetched = await asyncio.gather(
+                    *(self.get_candles(symbol, timeframe, limit=window) for symbol in symbols),
+                    return_exceptions=True
+                )
+                ready = [(symbol, candles) for symbol, candles in zip(symbols, fetched)
+                         if isinstance(candles, CandleArrays) and len(candles) >= required]
+                if len(ready) < len(symbols):
+                    logger.warning(f"{timeframe} 지표 계산을 위한 데이터가 부족한 종목: {len(symbols) - len(ready)}개 (필요: {required}개)")
+                dirty = []
+                for symbol, candles in ready:
+                    key = ('indicator', symbol, timeframe, repr(conditions))
+                    marker = self.series_marker(timeframe, candles)
+                    cached = self._cached_result(key, marker)
+                    if cached is None:
+                        dirty.append((symbol, candles, key, marker))
+                    else:
+                        alerts[symbol].extend(cached)
+                if not dirty:
+                    continue
+                
+                latest = self.indicator_engine.latest_many([d[0] for d in dirty], timeframe,
+                                                           [d[1] for d in dirty], specs)
+                for (symbol, candles, key, marker), values in zip(dirty, latest):
+                    messages = self._indicator_alert_messages(
+                        symbol, timeframe, values, float(candles.close[-1]), conditions
+                    )
+                    self._store_result(key, marker, messages)
+                    alerts[symbol].extend(messages)
+            except Exception as e:
+                logger.error(f"{timeframe} 지표 일괄 분석 오류: {e}")
+        
+        return alerts
+    
+    async def get_rsi_summary(self, symbol: str, timeframes: List[str], periods: List[int]) -> Dict:
         """RSI 요약 정보를 반환합니다 (알림용)."""
         summary = {
             'symbol': symbol,
@@ -184,18 +629,19 @@ class TechnicalAnalyzer:
         
         try:
             for timeframe in timeframes:
-                df = self.get_candlestick_data(symbol, timeframe, limit=max(periods) + 50)
+                candles = await self._rsi_candles(symbol, timeframe, periods)
                 
-                if df is None:
+                if candles is None:
                     continue
                     
-                rsi_values = self.calculate_rsi(df, periods)
+                rsi_values = self.latest_rsi(symbol, timeframe, candles, periods)
                 
                 if rsi_values:
+                    last_time = datetime.fromtimestamp(candles.last_timestamp, tz=pytz.UTC)
                     summary['timeframes'][timeframe] = {
-                        'current_price': round(df['close'].iloc[-1], 6),
+                        'current_price': round(float(candles.close[-1]), 6),
                         'rsi_values': rsi_values,
-                        'timestamp': df['datetime'].iloc[-1].strftime('%Y-%m-%d %H:%M:%S')
+                        'timestamp': last_time.strftime('%Y-%m-%d %H:%M:%S')
                     }
                     
         except Exception as e:
@@ -203,179 +649,66 @@ class TechnicalAnalyzer:
             
         return summary
 
-    def find_pivots(self, data: pd.Series, left_bars: int, right_bars: int) -> Tuple[List[int], List[int]]:
+    def find_pivots(self, data, left_bars: int, right_bars: int):
         """
         피벗 하이/로우를 찾습니다. (TradingView Pine Script의 ta.pivotlow/ta.pivothigh와 유사한 로직)
         - 피벗 로우: 특정 지점의 값이 왼쪽(lbL)과 오른쪽(lbR)의 모든 값보다 '작은' 지점.
         - 피벗 하이: 특정 지점의 값이 왼쪽(lbL)과 오른쪽(lbR)의 모든 값보다 '큰' 지점.
-        """
-        pivot_lows = []
-        pivot_highs = []
-
-        if len(data) < left_bars + right_bars + 1:
-            return [], []
 
-        for i in range(left_bars, len(data) - right_bars):
-            pivot_val = data.iloc[i]
-            
-            # .iloc를 사용하여 슬라이싱
-            left_window = data.iloc[i - left_bars : i]
-            right_window = data.iloc[i + 1 : i + right_bars + 1]
-            
-            # 피벗 로우: pivot_val이 주변 모든 값보다 작아야 함
-            if (left_window > pivot_val).all() and (right_window > pivot_val).all():
-                pivot_lows.append(i)
+        data가 (series, bars) 2차원 배열이면 시리즈별 인덱스 리스트의 리스트를 반환합니다.
+        """
+        values = np.asarray(data, dtype=np.float64)
+        lows, highs = pivot_masks(values, left_bars, right_bars)
 
-            # 피벗 하이: pivot_val이 주변 모든 값보다 커야 함
-            if (left_window < pivot_val).all() and (right_window < pivot_val).all():
-                pivot_highs.append(i)
-                
-        return pivot_lows, pivot_highs
+        if values.ndim == 1:
+            return np.flatnonzero(lows).tolist(), np.flatnonzero(highs).tolist()
+        return ([np.flatnonzero(row).tolist() for row in lows],
+                [np.flatnonzero(row).tolist() for row in highs])
 
-    def detect_immediate_rsi_divergence(self, symbol: str, timeframe: str = "5m", 
+    async def detect_immediate_rsi_divergence(self, symbol: str, timeframe: str = "5m", 
                                        rsi_period: int = 14, lookback_periods: int = 10) -> List[str]:
         """가장 최근 RSI와 가격을 비교하여 즉시 다이버전스를 감지합니다."""
-        divergence_signals = []
         try:
-            kst = pytz.timezone('Asia/Seoul')
-            current_time = datetime.now(kst)
-            
-            # 데이터 로드
-            df = self.get_candlestick_data(symbol, timeframe, limit=lookback_periods + rsi_period + 5)
-            if df is None or len(df) < rsi_period + 5:
+            # 데이터 로드 (RSI는 주기 지표 그래프에서 공유)
+            loaded = await self.get_indicator(
+                symbol, timeframe, 'rsi', (rsi_period,),
+                limit=self.immediate_divergence_window(rsi_period, lookback_periods)
+            )
+            if loaded is None or len(loaded[0]) < rsi_period + 5:
                 logger.warning(f"{symbol} 데이터 부족으로 즉시 다이버전스 분석 중단")
                 return []
+            candles, rsi = loaded
 
-            # RSI 계산
-            df['rsi'] = RSIIndicator(df['close'], window=rsi_period).rsi()
-            df = df.dropna().reset_index(drop=True)
-            if len(df) < 10:
-                return []
-
-            # 현재와 이전 데이터
-            current_close = df['close'].iloc[-1]
-            current_rsi = df['rsi'].iloc[-1]
-            prev_close = df['close'].iloc[-2]
-            prev_rsi = df['rsi'].iloc[-2]
-            
-            current_time_str = current_time.strftime('%Y-%m-%d %H:%M')
-            
             # 즉시 다이버전스 체크 (현재 vs 바로 이전)
-            price_change_pct = ((current_close - prev_close) / prev_close) * 100
-            rsi_change = current_rsi - prev_rsi
-            
-            # 의미있는 변화인지 확인 (가격 0.5% 이상, RSI 2포인트 이상)
-            if abs(price_change_pct) >= 0.5 and abs(rsi_change) >= 2:
-                # Bullish Divergence: 가격 하락, RSI 상승
-                if price_change_pct < 0 and rsi_change > 0:
-                    divergence_signals.append(
-                        f"🟢 즉시 Bullish Divergence ({timeframe}) - {current_time_str}\n"
-                        f"가격: {price_change_pct:.2f}% ↓, RSI: +{rsi_change:.1f} ↑"
-                    )
-                    logger.info(f"{symbol} 즉시 Bullish Divergence: 가격 {price_change_pct:.2f}% 하락, RSI +{rsi_change:.1f}")
-                
-                # Bearish Divergence: 가격 상승, RSI 하락
-                elif price_change_pct > 0 and rsi_change < 0:
-                    divergence_signals.append(
-                        f"🔴 즉시 Bearish Divergence ({timeframe}) - {current_time_str}\n"
-                        f"가격: +{price_change_pct:.2f}% ↑, RSI: {rsi_change:.1f} ↓"
-                    )
-                    logger.info(f"{symbol} 즉시 Bearish Divergence: 가격 +{price_change_pct:.2f}% 상승, RSI {rsi_change:.1f}")
+            result = immediate_divergence(candles.close, rsi_period, rsi)
+            return self._immediate_divergence_messages(symbol, timeframe, result)
 
         except Exception as e:
             logger.error(f"{symbol} 즉시 RSI 다이버전스 분석 오류: {e}", exc_info=True)
-        
-        return divergence_signals
+            return []
 
-    def detect_rsi_divergence(self, symbol: str, timeframe: str = "5m", 
+    async def detect_rsi_divergence(self, symbol: str, timeframe: str = "5m", 
                              rsi_period: int = 14, lookback_periods: int = 20) -> List[str]:
-        """RSI 다이버전스를 즉시 감지합니다. 최근 RSI와 비교하여 실시간 알람 생성"""
+        """마지막 마감 캔들을 lookback_periods 범위의 과거 캔들과 비교해 RSI 다이버전스를 감지합니다.
+
+        진행 중인 캔들은 제외하므로 새 캔들이 마감될 때만 결과가 바뀝니다.
+        """
         divergence_signals = []
         try:
-            kst = pytz.timezone('Asia/Seoul')
-            current_time = datetime.now(kst)
-            
-            # 데이터 로드 (충분한 양을 가져와서 RSI 계산)
-            df = self.get_candlestick_data(symbol, timeframe, limit=lookback_periods + rsi_period + 10)
-            if df is None or len(df) < rsi_period + lookback_periods:
+            # 데이터 로드 (RSI는 주기 지표 그래프에서 공유)
+            loaded = await self.get_indicator(
+                symbol, timeframe, 'rsi', (rsi_period,),
+                limit=self.divergence_window(rsi_period, lookback_periods)
+            )
+            if loaded is None or len(loaded[0]) < rsi_period + lookback_periods:
                 logger.warning(f"{symbol} 데이터 부족으로 다이버전스 분석 중단")
                 return []
+            candles, rsi = loaded
 
-            # RSI 계산 및 NaN 값 제거
-            df['rsi'] = RSIIndicator(df['close'], window=rsi_period).rsi()
-            df = df.dropna().reset_index(drop=True)
-            if len(df) < lookback_periods:
-                return []
-
-            # 최근 데이터 (현재 vs 과거 비교용)
-            current_close = df['close'].iloc[-1]
-            current_rsi = df['rsi'].iloc[-1]
-            current_time_str = current_time.strftime('%Y-%m-%d %H:%M')
-            
-            # lookback_periods 범위에서 비교할 과거 지점들을 찾음
-            for i in range(5, min(lookback_periods, len(df) - 1)):  # 최소 5개 이전부터 검사
-                past_close = df['close'].iloc[-(i+1)]
-                past_rsi = df['rsi'].iloc[-(i+1)]
-                
-                # Regular Bullish Divergence: 가격은 낮아졌는데 RSI는 높아진 경우
-                if current_close < past_close and current_rsi > past_rsi:
-                    # RSI 차이가 의미있는 수준인지 확인 (최소 3포인트 차이)
-                    if current_rsi - past_rsi >= 3:
-                        price_change = ((current_close - past_close) / past_close) * 100
-                        rsi_change = current_rsi - past_rsi
-                        divergence_signals.append(
-                            f"🟢 Regular Bullish Divergence ({timeframe}) - {current_time_str}\n"
-                            f"가격: {price_change:.2f}% 하락, RSI: +{rsi_change:.1f} 상승 (최근 {i}캔들 비교)"
-                        )
-                        logger.info(f"{symbol} 즉시 Regular Bullish Divergence 감지: "
-                                   f"가격 {price_change:.2f}% 하락, RSI +{rsi_change:.1f}")
-                        break  # 첫 번째 유효한 다이버전스만 알림
-                
-                # Regular Bearish Divergence: 가격은 높아졌는데 RSI는 낮아진 경우
-                elif current_close > past_close and current_rsi < past_rsi:
-                    # RSI 차이가 의미있는 수준인지 확인 (최소 3포인트 차이)
-                    if past_rsi - current_rsi >= 3:
-                        price_change = ((current_close - past_close) / past_close) * 100
-                        rsi_change = past_rsi - current_rsi
-                        divergence_signals.append(
-                            f"🔴 Regular Bearish Divergence ({timeframe}) - {current_time_str}\n"
-                            f"가격: +{price_change:.2f}% 상승, RSI: -{rsi_change:.1f} 하락 (최근 {i}캔들 비교)"
-                        )
-                        logger.info(f"{symbol} 즉시 Regular Bearish Divergence 감지: "
-                                   f"가격 +{price_change:.2f}% 상승, RSI -{rsi_change:.1f}")
-                        break  # 첫 번째 유효한 다이버전스만 알림
-
-            # Hidden Divergence도 같은 방식으로 검사
-            if not divergence_signals:  # Regular 다이버전스가 없는 경우에만 Hidden 검사
-                for i in range(5, min(lookback_periods, len(df) - 1)):
-                    past_close = df['close'].iloc[-(i+1)]
-                    past_rsi = df['rsi'].iloc[-(i+1)]
-                    
-                    # Hidden Bullish Divergence: 가격은 높아졌는데 RSI는 낮아진 경우 (상승 추세에서)
-                    if current_close > past_close and current_rsi < past_rsi:
-                        if past_rsi - current_rsi >= 2:  # Hidden은 기준을 조금 낮춤
-                            price_change = ((current_close - past_close) / past_close) * 100
-                            rsi_change = past_rsi - current_rsi
-                            divergence_signals.append(
-                                f"🔴 Hidden Bullish Divergence ({timeframe}) - {current_time_str}\n"
-                                f"가격: +{price_change:.2f}% 상승, RSI: -{rsi_change:.1f} 하락"
-                            )
-                            logger.info(f"{symbol} 즉시 Hidden Bullish Divergence 감지: "
-                                       f"가격 +{price_change:.2f}% 상승, RSI -{rsi_change:.1f}")
-                            break
-                    
-                    # Hidden Bearish Divergence: 가격은 낮아졌는데 RSI는 높아진 경우 (하락 추세에서)
-                    elif current_close < past_close and current_rsi > past_rsi:
-                        if current_rsi - past_rsi >= 2:  # Hidden은 기준을 조금 낮춤
-                            price_change = ((current_close - past_close) / past_close) * 100
-                            rsi_change = current_rsi - past_rsi
-                            divergence_signals.append(
-                                f"🟠 Hidden Bearish Divergence ({timeframe}) - {current_time_str}\n"
-                                f"가격: {price_change:.2f}% 하락, RSI: +{rsi_change:.1f} 상승"
-                            )
-                            logger.info(f"{symbol} 즉시 Hidden Bearish Divergence 감지: "
-                                       f"가격 {price_change:.2f}% 하락, RSI +{rsi_change:.1f}")
-                            break
+            # lookback_periods 범위의 과거 지점들과 한 번에 비교 (마감된 캔들만)
+            closed = closed_count(candles.timestamp, timeframe)
+            result = lookback_divergence(candles.close[:closed], rsi_period, lookback_periods, rsi[:closed])
+            divergence_signals = self._lookback_divergence_messages(symbol, timeframe, result)
 
         except Exception as e:
             logger.error(f"{symbol} RSI 다이버전스 분석 오류: {e}", exc_info=True)
@@ -387,3 +720,243 @@ class TechnicalAnalyzer:
             logger.debug(f"{symbol} 즉시 다이버전스 신호 없음")
         
         return divergence_signals
+
+    async def detect_pivot_divergence(self, symbol: str, timeframe: str = "5m", rsi_period: int = 14,
+                                      left_bars: int = 5, right_bars: int = 5,
+                                      lookback_range: Tuple[int, int] = (5, 60), recent_bars: int = 5,
+                                      include_hidden: bool = True) -> List[str]:
+        """RSI 피벗 쌍으로 Regular/Hidden 다이버전스를 감지합니다 (TradingView RSI Divergence 방식).
+
+        마감된 캔들만 사용하며, 최근 recent_bars개 캔들 안에서 확정된 피벗만 알림으로 만듭니다.
+        """
+        try:
+            window = self.pivot_divergence_window(rsi_period, left_bars, right_bars, lookback_range, recent_bars)
+            loaded = await self.get_indicator(symbol, timeframe, 'rsi', (rsi_period,), limit=window)
+            if loaded is None or len(loaded[0]) < rsi_period + left_bars + right_bars + 1:
+                logger.warning(f"{symbol} 데이터 부족으로 피벗 다이버전스 분석 중단")
+                return []
+            candles, rsi = loaded
+
+            divergences = recent_pivot_divergences(
+                candles.timestamp, candles.close, candles.low, candles.high, timeframe, rsi_period,
+                left_bars, right_bars, lookback_range, recent_bars, include_hidden, rsi=rsi
+            )
+            return self._pivot_divergence_messages(symbol, timeframe, divergences)
+
+        except Exception as e:
+            logger.error(f"{symbol} 피벗 다이버전스 분석 오류: {e}", exc_info=True)
+            return []
+
+    async def detect_divergences(self, symbol: str, timeframes: List[str], rsi_period: int = 14,
+                                 immediate_lookback: int = 10, lookback_periods: int = 15,
+                                 left_bars: int = 5, right_bars: int = 5,
+                                 lookback_range: Tuple[int, int] = (5, 60), recent_bars: int = 5,
+                                 include_hidden: bool = True) -> Dict[str, List[str]]:
+        """즉시/lookback/피벗 다이버전스를 timeframe별로 한 번에 감지합니다.
+
+        timeframe마다 가장 큰 창의 캔들을 한 번만 가져오고, analysis_pool이 있으면 종목의 모든
+        timeframe 계산을 워커 프로세스 한 번의 호출로 처리합니다. RSI는 timeframe마다 한 번만 계산해
+        세 감지기가 공유하며, 주기 중에는 지표 그래프의 값을 사용합니다. 결과 메시지는 detect_*
+        메서드를 각각 호출한 것(즉시 + lookback + 피벗 순서)과 같습니다. 감지기가 읽는 캔들 값이 지난
+        분석 이후 바뀌지 않았으면 (피벗/lookback은 새로 마감된 캔들이 없으면, 즉시 다이버전스는 현재가도
+        같으면) 그 감지기는 실행하지 않고 이전 결과로 메시지를 만듭니다.
+        """
+        windows = {
+            'immediate': self.immediate_divergence_window(rsi_period, immediate_lookback),
+            'lookback': self.divergence_window(rsi_period, lookback_periods),
+            'pivot': self.pivot_divergence_window(rsi_period, left_bars, right_bars, lookback_range, recent_bars),
+        }
+        minimum = {
+            'immediate': rsi_period + 5,
+            'lookback': rsi_period + lookback_periods,
+            'pivot': rsi_period + left_bars + right_bars + 1,
+        }
+        warnings = {
+            'immediate': f"{symbol} 데이터 부족으로 즉시 다이버전스 분석 중단",
+            'lookback': f"{symbol} 데이터 부족으로 다이버전스 분석 중단",
+            'pivot': f"{symbol} 데이터 부족으로 피벗 다이버전스 분석 중단",
+        }
+
+        fetched = await asyncio.gather(
+            *(self._divergence_inputs(symbol, timeframe, rsi_period, max(windows.values()))
+              for timeframe in timeframes),
+            return_exceptions=True
+        )
+
+        # 감지기마다 (읽는 파라미터, 진행 중인 캔들에서 읽는 값)으로 결과를 따로 재사용
+        detectors = {
+            'immediate': ((rsi_period, immediate_lookback), 'c'),
+            'lookback': ((rsi_period, lookback_periods), ''),
+            'pivot': ((rsi_period, left_bars, right_bars, tuple(lookback_range), recent_bars, include_hidden), ''),
+        }
+        results = {timeframe: {} for timeframe in timeframes}
+        tasks = []
+        pending = []
+        for timeframe, inputs in zip(timeframes, fetched):
+            if isinstance(inputs, Exception):
+                logger.error(f"{symbol} {timeframe} 다이버전스 분석 오류: {inputs}")
+                continue
+            candles, rsi = inputs
+            task_windows = {}
+            stored = {}
+            for name, window in windows.items():
+                params, forming = detectors[name]
+                key = ('divergence', symbol, timeframe, name, params)
+                marker = self.series_marker(timeframe, candles, forming=forming) if candles is not None else None
+                cached = self._cached_result(key, marker)
+                if cached is not None:
+                    results[timeframe][name] = cached
+                elif candles is None or min(len(candles), window) < minimum[name]:
+                    logger.warning(warnings[name])
+                else:
+                    task_windows[name] = window
+                    stored[name] = (key, marker)
+            if not task_windows:
+                continue
+            tasks.append({
+                'timeframe': timeframe,
+                'windows': task_windows,
+                'timestamp': candles.timestamp,
+                'close': candles.close,
+                'low': candles.low,
+                'high': candles.high,
+                'rsi_period': rsi_period,
+                'lookback_periods': lookback_periods,
+                'left_bars': left_bars,
+                'right_bars': right_bars,
+                'lookback_range': tuple(lookback_range),
+                'recent_bars': recent_bars,
+                'include_hidden': include_hidden,
+                'rsi': rsi,
+            })
+            pending.append(stored)
+
+        if tasks:
+            try:
+                if self.analysis_pool is not None:
+                    outputs = await self.analysis_pool.run(analyze_divergences_many, tasks)
+                else:
+                    outputs = analyze_divergences_many(tasks)
+            except Exception as e:
+                logger.error(f"{symbol} 다이버전스 분석 오류: {e}", exc_info=True)
+                outputs = []
+            for task, stored, output in zip(tasks, pending, outputs):
+                for name, (key, marker) in stored.items():
+                    found = output[name]
+                    # 피벗은 감지 결과 목록, 즉시/lookback은 결과 하나(없으면 None)
+                    detected = found if name == 'pivot' else ([found] if found is not None else [])
+                    self._store_result(key, marker, detected)
+                    results[task['timeframe']][name] = detected
+
+        return {timeframe: self._divergence_messages(symbol, timeframe, results[timeframe])
+                for timeframe in timeframes}
+
+    def _divergence_messages(self, symbol: str, timeframe: str, results: Dict[str, List]) -> List[str]:
+        """감지기별 결과를 즉시 + lookback + 피벗 순서의 알림 메시지로 만듭니다 (발생 시각은 지금)."""
+        messages = []
+        for result in results.get('immediate', []):
+            messages.extend(self._immediate_divergence_messages(symbol, timeframe, result))
+        lookback = [message for result in results.get('lookback', [])
+                    for message in self._lookback_divergence_messages(symbol, timeframe, result)]
+        if lookback:
+            logger.info(f"{symbol} 즉시 다이버전스 신호 {len(lookback)}개 발견")
+        messages.extend(lookback)
+        messages.extend(self._pivot_divergence_messages(symbol, timeframe, results.get('pivot', [])))
+        return messages
+
+    async def _divergence_inputs(self, symbol: str, timeframe: str, rsi_period: int,
+                                 limit: int) -> Tuple[Optional[CandleArrays], Optional[np.ndarray]]:
+        """다이버전스 분석에 넘길 캔들과 RSI 배열
+
+        주기 밖에서는 limit개 캔들만 넘기고 RSI는 분석 함수가 한 번 계산합니다. 주기 중에는 주기 캔들
+        전체를 넘기며, 이벤트 루프에서 실행하면 지표 그래프의 RSI를 쓰고, 프로세스 풀에서 실행하면
+        이미 계산된 RSI가 있을 때만 함께 보냅니다 (없으면 워커에서 계산해 이벤트 루프를 막지 않음).
+        """
+        candles = await self._get_cached_candles(symbol, timeframe, limit)
+        if candles is None or self._indicator_graph is None:
+            return (candles.tail(limit) if candles is not None else None), None
+        if self.analysis_pool is not None:
+            return candles, self._indicator_graph.peek(symbol, timeframe, candles, 'rsi', (rsi_period,))
+        return candles, self._indicator_graph.series(symbol, timeframe, candles, 'rsi', (rsi_period,))
+
+    @staticmethod
+    def _current_time_str() -> str:
+        return datetime.now(pytz.timezone('Asia/Seoul')).strftime('%Y-%m-%d %H:%M')
+
+    def _immediate_divergence_messages(self, symbol: str, timeframe: str,
+                                       result: Optional[Dict]) -> List[str]:
+        """immediate_divergence 결과를 알림 메시지로 만듭니다."""
+        if result is None:
+            return []
+        current_time_str = self._current_time_str()
+        price_change_pct = result['price_change']
+        rsi_change = result['rsi_change']
+        
+        # Bullish Divergence: 가격 하락, RSI 상승
+        if result['kind'] == 'bullish':
+            logger.info(f"{symbol} 즉시 Bullish Divergence: 가격 {price_change_pct:.2f}% 하락, RSI +{rsi_change:.1f}")
+            return [
+                f"🟢 즉시 Bullish Divergence ({timeframe}) - {current_time_str}\n"
+                f"가격: {price_change_pct:.2f}% ↓, RSI: +{rsi_change:.1f} ↑"
+            ]
+        
+        # Bearish Divergence: 가격 상승, RSI 하락
+        logger.info(f"{symbol} 즉시 Bearish Divergence: 가격 +{price_change_pct:.2f}% 상승, RSI {rsi_change:.1f}")
+        return [
+            f"🔴 즉시 Bearish Divergence ({timeframe}) - {current_time_str}\n"
+            f"가격: +{price_change_pct:.2f}% ↑, RSI: {rsi_change:.1f} ↓"
+        ]
+
+    def _lookback_divergence_messages(self, symbol: str, timeframe: str,
+                                      result: Optional[Dict]) -> List[str]:
+        """lookback_divergence 결과를 알림 메시지로 만듭니다."""
+        if result is None:
+            return []
+        current_time_str = self._current_time_str()
+        price_change = result['price_change']
+        rsi_change = result['rsi_change']
+        kind = result['kind']
+        
+        if kind == 'regular_bullish':
+            message = (f"🟢 Regular Bullish Divergence ({timeframe}) - {current_time_str}\n"
+                       f"가격: {price_change:.2f}% 하락, RSI: +{rsi_change:.1f} 상승 (최근 {result['bars']}캔들 비교)")
+            log = f"가격 {price_change:.2f}% 하락, RSI +{rsi_change:.1f}"
+        elif kind == 'regular_bearish':
+            message = (f"🔴 Regular Bearish Divergence ({timeframe}) - {current_time_str}\n"
+                       f"가격: +{price_change:.2f}% 상승, RSI: -{rsi_change:.1f} 하락 (최근 {result['bars']}캔들 비교)")
+            log = f"가격 +{price_change:.2f}% 상승, RSI -{rsi_change:.1f}"
+        # Hidden Bullish Divergence: 가격은 높아졌는데 RSI는 낮아진 경우 (상승 추세에서)
+        elif kind == 'hidden_bullish':
+            message = (f"🔴 Hidden Bullish Divergence ({timeframe}) - {current_time_str}\n"
+                       f"가격: +{price_change:.2f}% 상승, RSI: -{rsi_change:.1f} 하락")
+            log = f"가격 +{price_change:.2f}% 상승, RSI -{rsi_change:.1f}"
+        # Hidden Bearish Divergence: 가격은 낮아졌는데 RSI는 높아진 경우 (하락 추세에서)
+        else:
+            message = (f"🟠 Hidden Bearish Divergence ({timeframe}) - {current_time_str}\n"
+                       f"가격: {price_change:.2f}% 하락, RSI: +{rsi_change:.1f} 상승")
+            log = f"가격 {price_change:.2f}% 하락, RSI +{rsi_change:.1f}"
+        
+        logger.info(f"{symbol} 즉시 {kind.replace('_', ' ').title()} Divergence 감지: {log}")
+        return [message]
+
+    def _pivot_divergence_messages(self, symbol: str, timeframe: str, divergences: List[Dict]) -> List[str]:
+        """recent_pivot_divergences 결과를 알림 메시지로 만듭니다."""
+        kst = pytz.timezone('Asia/Seoul')
+        labels = {
+            'regular_bullish': "🟢 Regular Bullish Divergence",
+            'regular_bearish': "🔴 Regular Bearish Divergence",
+            'hidden_bullish': "🔵 Hidden Bullish Divergence",
+            'hidden_bearish': "🟠 Hidden Bearish Divergence",
+        }
+        messages = []
+        for divergence in divergences:
+            pivot_time = datetime.fromtimestamp(divergence['timestamp'], tz=kst)
+            price_change = (divergence['price'] - divergence['prev_price']) / divergence['prev_price'] * 100
+            gap = divergence['index'] - divergence['prev_index']
+            messages.append(
+                f"{labels[divergence['kind']]} ({timeframe}, 피벗) - {pivot_time.strftime('%Y-%m-%d %H:%M')}\n"
+                f"가격: {price_change:+.2f}%, RSI: {divergence['prev_rsi']:.1f} → {divergence['rsi']:.1f} ({gap}캔들 간격)"
+            )
+            logger.info(f"{symbol} 피벗 {labels[divergence['kind']][2:]} 감지: "
+                        f"가격 {price_change:+.2f}%, RSI {divergence['prev_rsi']:.1f} → {divergence['rsi']:.1f}")
+        return messages
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+분석 테스트용 공통 헬퍼
+결정적인(seed 고정) 캔들 시리즈와, 네트워크 대신 주어진 캔들을 돌려주는 TechnicalAnalyzer를 만듭니다.
+"""
+import re
+import time
+from typing import Dict, List, Tuple, Union
+
+import numpy as np
+
+from candles import CandleArrays
+from technical_analysis import TechnicalAnalyzer
+
+STEP = {"1m": 60, "5m": 300, "15m": 900, "1h": 3600}
+TIME_PATTERN = re.compile(r" - \d{4}-\d{2}-\d{2} \d{2}:\d{2}$", re.MULTILINE)
+
+# {(symbol, interval): 캔들} 또는 모든 조회에 같은 캔들
+CandleData = Union[CandleArrays, Dict[Tuple[str, str], CandleArrays]]
+
+
+def make_candles(n: int, seed: int, interval: str = "5m", random_volume: bool = False) -> CandleArrays:
+    """마지막 캔들이 진행 중인 n개 캔들 (이전 캔들은 모두 마감, 종가는 seed별 랜덤 워크)"""
+    rng = np.random.default_rng(seed)
+    close = np.round(100 * np.exp(np.cumsum(rng.normal(0, 0.01, n))), 4)
+    volume = rng.uniform(1, 10, n) if random_volume else np.ones(n)
+    values = np.vstack([close, close * 1.002, close * 0.998, close, volume])
+    step = STEP[interval]
+    last_open = int(time.time()) // step * step
+    return CandleArrays(last_open - (n - 1) * step + np.arange(n, dtype=np.int64) * step, values)
+
+
+def _lookup(data: CandleData, symbol: str, interval: str) -> CandleArrays:
+    return data if isinstance(data, CandleArrays) else data[(symbol, interval)]
+
+
+def stub_analyzer(data: CandleData, pool=None) -> TechnicalAnalyzer:
+    """주기 캐시 대신 data의 캔들을 그대로 돌려주는 분석기"""
+    analyzer = TechnicalAnalyzer(market_data=None, market_type='futures', analysis_pool=pool)
+
+    async def cached(symbol, interval, limit):
+        return _lookup(data, symbol, interval)
+    analyzer._get_cached_candles = cached
+    return analyzer
+
+
+def fetching_analyzer(data: CandleData, pool=None) -> Tuple[TechnicalAnalyzer, List[Tuple[str, str, int]]]:
+    """조회 횟수를 세는 _fetch_candles로 실제 주기 캐시를 거치는 분석기와 조회 기록"""
+    analyzer = TechnicalAnalyzer(market_data=None, market_type='futures', analysis_pool=pool)
+    fetches = []
+
+    async def fetch(symbol, interval, limit):
+        fetches.append((symbol, interval, limit))
+        return _lookup(data, symbol, interval).tail(limit)
+    analyzer._fetch_candles = fetch
+    return analyzer, fetches
+
+
+def strip_times(alerts):
+    """알림 메시지 끝의 발생 시각을 " - TIME"으로 바꿉니다 (호출 시점마다 다를 수 있음).
+
+    피벗 메시지의 시각은 피벗 캔들 시각이므로 그대로 둡니다. dict/list/tuple은 안쪽까지 바꿉니다.
+    """
+    if isinstance(alerts, str):
+        return alerts if "피벗" in alerts else TIME_PATTERN.sub(" - TIME", alerts)
+    if isinstance(alerts, dict):
+        return {key: strip_times(value) for key, value in alerts.items()}
+    if isinstance(alerts, (list, tuple)):
+        return type(alerts)(strip_times(value) for value in alerts)
+    return alerts
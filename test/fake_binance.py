@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+오프라인 테스트용 가짜 Binance REST 서버
+실제 API 대신 로컬 aiohttp 서버가 결정적인(deterministic) 캔들/티커 데이터를 응답합니다.
+"""
+import asyncio
+import math
+import time
+from typing import Dict, List, Optional
+
+from aiohttp import web
+
+INTERVAL_MS = {
+    "1m": 60_000,
+    "5m": 300_000,
+    "15m": 900_000,
+    "1h": 3_600_000,
+    "4h": 14_400_000,
+    "1d": 86_400_000,
+}
+
+
+def make_klines(symbol: str, interval: str, end_time_ms: int, count: int) -> List[list]:
+    """심볼마다 다른 가격 흐름을 가진 Binance 형식 kline 목록을 생성합니다."""
+    step = INTERVAL_MS[interval]
+    last_open = (end_time_ms // step) * step
+    seed = sum(ord(c) for c in symbol)
+    rows = []
+    for i in range(count):
+        open_time = last_open - (count - 1 - i) * step
+        n = open_time // step
+        base = 100 + seed % 50
+        close = base + 10 * math.sin(n / 7.0 + seed) + 3 * math.cos(n / 3.0)
+        open_ = base + 10 * math.sin((n - 1) / 7.0 + seed) + 3 * math.cos((n - 1) / 3.0)
+        high = max(open_, close) + 0.5
+        low = min(open_, close) - 0.5
+        volume = 1000 + (n * 37 + seed) % 500
+        rows.append([
+            open_time, f"{open_:.4f}", f"{high:.4f}", f"{low:.4f}", f"{close:.4f}",
+            f"{volume:.2f}", open_time + step - 1, "0", 100, "0", "0", "0"
+        ])
+    return rows
+
+
+def kline_stream_message(symbol: str, interval: str, row: list, is_closed: bool) -> Dict:
+    """REST kline 행을 Binance combined 스트림 메시지 형식으로 변환합니다."""
+    return {
+        'stream': f"{symbol.lower()}@kline_{interval}",
+        'data': {
+            'e': 'kline', 's': symbol,
+            'k': {
+                't': row[0], 'T': row[6], 's': symbol, 'i': interval,
+                'o': row[1], 'h': row[2], 'l': row[3], 'c': row[4], 'v': row[5],
+                'n': row[8], 'x': is_closed, 'q': row[7], 'V': row[9], 'Q': row[10],
+            },
+        },
+    }
+
+
+def make_ticker(symbol: str, quote_volume: float) -> Dict[str, str]:
+    return {
+        'symbol': symbol,
+        'lastPrice': '100.0',
+        'priceChangePercent': '1.5',
+        'highPrice': '110.0',
+        'lowPrice': '90.0',
+        'quoteVolume': str(quote_volume),
+    }
+
+
+class FakeBinanceServer:
+    """요청 기록과 응답 지연을 지원하는 가짜 Binance 서버"""
+
+    def __init__(self, symbols: Optional[List[str]] = None, delay: float = 0.0):
+        self.symbols = symbols or ["BTCUSDT", "ETHUSDT", "SOLUSDT"]
+        self.delay = delay
+        # 서버 시계를 실제 시간보다 앞당겨 새 캔들이 생긴 상황을 흉내낼 때 사용
+        self.time_offset_ms = 0
+        self.requests: List[Dict] = []
+        # WebSocket 연결 시 순서대로 재생할 스트림 메시지와 메시지 간격 (초)
+        self.stream_messages: List[Dict] = []
+        self.stream_interval = 0.0
+        self.stream_paths: List[str] = []
+        # X-MBX-USED-WEIGHT-1M 헤더로 돌려줄 사용량 (None이면 헤더 없음)
+        self.used_weight: Optional[int] = None
+        # 다음 REST 요청들에 순서대로 돌려줄 한도 초과 응답 [(status, retry_after), ...]
+        self.rate_limit_responses: List[tuple] = []
+        self._runner: Optional[web.AppRunner] = None
+        self.base_url = ""
+
+    @property
+    def now_ms(self) -> int:
+        return int(time.time() * 1000) + self.time_offset_ms
+
+    @web.middleware
+    async def _rate_limit_middleware(self, request: web.Request, handler):
+        if request.path == '/stream':
+            return await handler(request)
+        if self.rate_limit_responses:
+            self.requests.append({'path': request.path, 'rejected': True, **dict(request.query)})
+            status, retry_after = self.rate_limit_responses.pop(0)
+            return web.json_response(
+                {'code': -1003, 'msg': 'Too many requests.'}, status=status,
+                headers={'Retry-After': str(retry_after)}
+            )
+        response = await handler(request)
+        if self.used_weight is not None:
+            response.headers['X-MBX-USED-WEIGHT-1M'] = str(self.used_weight)
+        return response
+
+    async def _klines(self, request: web.Request) -> web.Response:
+        params = dict(request.query)
+        self.requests.append({'path': request.path, **params})
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        interval = params['interval']
+        limit = int(params.get('limit', 500))
+        end_time = int(params.get('endTime', self.now_ms))
+        end_time = min(end_time, self.now_ms)
+        if 'startTime' in params:
+            step = INTERVAL_MS[interval]
+            first_open = -(-int(params['startTime']) // step) * step
+            available = max(0, (end_time - first_open) // step + 1)
+            count = min(limit, available)
+            rows = make_klines(params['symbol'], interval, first_open + (count - 1) * step, count)
+        else:
+            rows = make_klines(params['symbol'], interval, end_time, limit)
+        return web.json_response(rows)
+
+    async def _ticker(self, request: web.Request) -> web.Response:
+        params = dict(request.query)
+        self.requests.append({'path': request.path, **params})
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        tickers = [make_ticker(s, 1_000_000 * (len(self.symbols) - i))
+                   for i, s in enumerate(self.symbols)]
+        if 'symbol' in params:
+            matched = [t for t in tickers if t['symbol'] == params['symbol']]
+            if not matched:
+                return web.json_response({'code': -1121, 'msg': 'Invalid symbol.'}, status=400)
+            return web.json_response(matched[0])
+        return web.json_response(tickers)
+
+    async def _stream(self, request: web.Request) -> web.WebSocketResponse:
+        self.stream_paths.append(request.path_qs)
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        for message in self.stream_messages:
+            if self.stream_interval:
+                await asyncio.sleep(self.stream_interval)
+            message['sent_at'] = time.perf_counter()
+            await ws.send_json({k: v for k, v in message.items() if k != 'sent_at'})
+        # 클라이언트가 끊을 때까지 연결 유지
+        async for _ in ws:
+            pass
+        return ws
+
+    async def start(self) -> str:
+        app = web.Application(middlewares=[self._rate_limit_middleware])
+        app.router.add_get('/stream', self._stream)
+        for prefix in ('/api/v3', '/fapi/v1'):
+            app.router.add_get(f'{prefix}/klines', self._klines)
+            app.router.add_get(f'{prefix}/ticker/24hr', self._ticker)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, '127.0.0.1', 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://127.0.0.1:{port}"
+        return self.base_url
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    def count(self, path_suffix: str) -> int:
+        return sum(1 for r in self.requests
+                   if r['path'].endswith(path_suffix) and not r.get('rejected'))
+
+
+def use_fake_market_data(monitor, base_url: str):
+    """CryptoMonitor가 가짜 서버를 사용하도록 시세 클라이언트를 교체합니다."""
+    from market_data import AsyncMarketDataClient
+
+    client = AsyncMarketDataClient(market_type=monitor.market_type, base_url=base_url)
+    monitor.market_data = client
+    monitor.technical_analyzer.market_data = client
+    monitor.technical_analyzer.candle_store.market_data = client
+    # 테스트가 logs/candles에 캔들을 기록하지 않도록 디스크 캐시 비활성화
+    monitor.technical_analyzer.candle_store.archive = None
+    return client
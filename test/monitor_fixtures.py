@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+모니터링 주기 테스트용 공통 헬퍼
+티커 스냅샷과 가짜 캔들 조회로, 실제 Binance API 요청 없이 동작하는 CryptoMonitor를 만듭니다.
+"""
+from typing import Awaitable, Callable, Iterable, Optional
+
+from crypto_monitor import CryptoMonitor
+
+FetchCandles = Callable[[str, str, int], Awaitable[object]]
+
+
+def ticker(symbol: str, change: float = -10.0) -> dict:
+    """Binance 24시간 티커 형식의 고정 값"""
+    return {'symbol': symbol, 'lastPrice': '100', 'priceChangePercent': str(change), 'highPrice': '110',
+            'lowPrice': '90', 'quoteVolume': '1000000', 'volume': '10000'}
+
+
+async def _no_candles(symbol, interval, limit):
+    return None
+
+
+def stub_monitor(symbols: Iterable[str], change: float = -10.0,
+                 fetch_candles: Optional[FetchCandles] = None) -> CryptoMonitor:
+    """티커 스냅샷이 채워지고 RSI/지표 일괄 계산은 알림 없음, 캔들 조회는 fetch_candles(기본: 없음)인 모니터
+
+    실제 API로 나가는 요청은 monitor.network_requests에 경로를 남기고 실패합니다.
+    """
+    monitor = CryptoMonitor()
+    monitor.ticker_snapshot = {symbol: ticker(symbol, change) for symbol in symbols}
+
+    async def no_batch(batch):
+        return {symbol: [] for symbol in batch}
+    monitor._evaluate_rsi = no_batch
+    monitor._evaluate_indicators = no_batch
+    monitor.technical_analyzer._fetch_candles = fetch_candles or _no_candles
+
+    monitor.network_requests = []
+
+    async def no_network(path, params=None, *args, **kwargs):
+        monitor.network_requests.append(path)
+        raise AssertionError(f"테스트 중 실제 API 요청: {path}")
+    monitor.market_data._request = no_network
+    return monitor
@@ -96,7 +96,7 @@ async def test_conditions():
             print(monitor.format_ticker_info(btc_ticker))
             
             # 조건 확인
-            alerts = monitor.check_conditions(btc_ticker, "BTC_USDT")
+            alerts = await monitor.check_conditions(btc_ticker, "BTC_USDT")
             
             if alerts:
                 print(f"\n🚨 조건 충족 알림 {len(alerts)}개:")
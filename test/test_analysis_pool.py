@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+다이버전스 분석 프로세스 풀 테스트 (이벤트 루프 실행 결과와 비교)
+"""
+import sys
+import os
+# 상위 디렉터리(프로젝트 루트)를 Python path에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+# 테스트 헬퍼(analysis_fixtures) 경로
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import asyncio
+import time
+from concurrent.futures.process import BrokenProcessPool
+
+from analysis_fixtures import make_candles, strip_times, stub_analyzer
+from analysis_pool import AnalysisPool
+
+INTERVALS = ["5m", "15m"]
+PARAMS = dict(rsi_period=14, left_bars=5, right_bars=5, lookback_range=(5, 60), recent_bars=5, include_hidden=True)
+
+
+def _universe(symbols: int):
+    data = {}
+    for i in range(symbols):
+        for interval in INTERVALS:
+            data[(f"SYM{i}USDT", interval)] = make_candles(120 if i % 7 else 25, i * 3 + len(interval), interval)
+    return data
+
+
+async def _detect_all(analyzer, symbols):
+    return await asyncio.gather(*(
+        analyzer.detect_divergences(symbol, INTERVALS, immediate_lookback=10, lookback_periods=15, **PARAMS)
+        for symbol in symbols
+    ))
+
+
+def test_combined_matches_individual_detectors():
+    data = _universe(60)
+    analyzer = stub_analyzer(data)
+
+    async def run():
+        # 주기 중에는 개별 감지기도 지표 그래프에서 같은 RSI를 읽음
+        analyzer.begin_cycle({interval: 120 for interval in INTERVALS})
+        signals = 0
+        for i in range(60):
+            symbol = f"SYM{i}USDT"
+            combined = await analyzer.detect_divergences(symbol, INTERVALS, immediate_lookback=10,
+                                                         lookback_periods=15, **PARAMS)
+            expected = {}
+            for tf in INTERVALS:
+                expected[tf] = (
+                    await analyzer.detect_immediate_rsi_divergence(symbol, tf, 14, 10)
+                    + await analyzer.detect_rsi_divergence(symbol, tf, 14, 15)
+                    + await analyzer.detect_pivot_divergence(symbol, tf, **PARAMS)
+                )
+            assert strip_times(combined) == strip_times(expected), symbol
+            signals += sum(map(len, combined.values()))
+        analyzer.end_cycle()
+        return signals
+
+    signals = asyncio.run(run())
+    assert signals > 0
+    print(f"✅ detect_divergences가 개별 감지기 결과와 동일 ({signals}개 신호)")
+
+
+def test_pool_matches_inline():
+    data = _universe(40)
+    symbols = [f"SYM{i}USDT" for i in range(40)]
+    pool = AnalysisPool(max_workers=2)
+    try:
+        inline = asyncio.run(_detect_all(stub_analyzer(data), symbols))
+        pooled = asyncio.run(_detect_all(stub_analyzer(data, pool), symbols))
+    finally:
+        pool.close()
+    assert [strip_times(a) for a in pooled] == [strip_times(a) for a in inline]
+    print("✅ 프로세스 풀 결과가 이벤트 루프 실행 결과와 동일")
+
+
+def test_pool_throughput():
+    data = _universe(200)
+    symbols = [f"SYM{i}USDT" for i in range(200)]
+
+    started = time.perf_counter()
+    asyncio.run(_detect_all(stub_analyzer(data), symbols))
+    inline_elapsed = time.perf_counter() - started
+
+    pool = AnalysisPool()
+    try:
+        asyncio.run(_detect_all(stub_analyzer(data, pool), symbols[:pool.max_workers]))   # 워커 시작
+        started = time.perf_counter()
+        asyncio.run(_detect_all(stub_analyzer(data, pool), symbols))
+        pooled_elapsed = time.perf_counter() - started
+    finally:
+        pool.close()
+    print(f"✅ 200종목 × 2 timeframe: 이벤트 루프 {inline_elapsed * 1000:.0f}ms, "
+          f"프로세스 풀(워커 {pool.max_workers}개) {pooled_elapsed * 1000:.0f}ms")
+
+
+def test_broken_pool_restarts():
+    pool = AnalysisPool(max_workers=1)
+
+    async def run():
+        try:
+            await pool.run(os._exit, 1)   # 워커 비정상 종료
+        except BrokenProcessPool:
+            pass
+        else:
+            raise AssertionError("BrokenProcessPool이 발생해야 합니다")
+        assert pool._executor is None
+        return await pool.run(sum, [1, 2, 3])
+
+    try:
+        assert asyncio.run(run()) == 6
+    finally:
+        pool.close()
+    print("✅ 워커 비정상 종료 후 풀을 닫고 다음 호출에서 다시 시작")
+
+
+if __name__ == "__main__":
+    print("🧪 분석 프로세스 풀 테스트")
+    print("=" * 50)
+    test_combined_matches_individual_detectors()
+    test_pool_matches_inline()
+    test_pool_throughput()
+    test_broken_pool_restarts()
+    print("\n🎉 모든 테스트 통과!")
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+과거 캔들 백필 테스트 (로컬 가짜 Binance 서버 사용)
+"""
+import sys
+import os
+# 상위 디렉터리(프로젝트 루트)를 Python path에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+# 테스트 헬퍼(fake_binance) 경로
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import asyncio
+import tempfile
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+
+from backfill import CandleBackfiller
+from candle_archive import CandleArchive
+from candles import decode_klines
+from fake_binance import FakeBinanceServer, INTERVAL_MS, make_klines
+from market_data import AsyncMarketDataClient
+from technical_analysis import TechnicalAnalyzer
+
+STEP = INTERVAL_MS["5m"]
+
+
+def _closed_end_ms() -> int:
+    return int(time.time() * 1000) // STEP * STEP
+
+
+def _assert_contiguous(candles, start_ms: int, end_ms: int):
+    expected = np.arange(-(-start_ms // STEP) * STEP, end_ms, STEP) // 1000
+    np.testing.assert_array_equal(candles.timestamp, expected)
+    reference = decode_klines(make_klines("BTCUSDT", "5m", end_ms - STEP, len(expected)))
+    np.testing.assert_array_equal(candles.values, reference.values)
+
+
+async def _run(root: str, steps):
+    server = FakeBinanceServer(symbols=["BTCUSDT"])
+    base_url = await server.start()
+    client = AsyncMarketDataClient(market_type='futures', base_url=base_url)
+    archive = CandleArchive(root, 'futures')
+    backfiller = CandleBackfiller(client, archive, concurrency=3, page_size=200)
+    try:
+        results = []
+        for step in steps:
+            server.requests.clear()
+            written = await step(backfiller, archive)
+            results.append((written, list(server.requests)))
+    finally:
+        await client.close()
+        await server.stop()
+    return archive, results
+
+
+def test_paginated_backfill_and_resume():
+    end_ms = _closed_end_ms()
+    start_ms = end_ms - 3 * 86_400_000   # 3일 = 864개
+    middle_ms = end_ms - 86_400_000
+
+    async def first_part(backfiller, archive):
+        return await backfiller.backfill("BTCUSDT", "5m", start_ms, middle_ms)
+
+    async def resume(backfiller, archive):
+        return await backfiller.backfill("BTCUSDT", "5m", start_ms, end_ms)
+
+    with tempfile.TemporaryDirectory() as root:
+        archive, results = asyncio.run(_run(root, [first_part, resume]))
+        (first_written, first_requests), (resumed_written, resumed_requests) = results
+
+        assert first_written == 576 and len(first_requests) == 3
+        # 재실행은 저장된 마지막 캔들 이후 구간만 요청
+        assert resumed_written == 288
+        assert all(int(r['startTime']) >= middle_ms for r in resumed_requests)
+        assert len(resumed_requests) == 2
+        _assert_contiguous(archive.load("BTCUSDT", "5m"), start_ms, end_ms)
+    print(f"✅ 구간 {len(first_requests)}+{len(resumed_requests)}회로 864개 캔들 백필 (중단 후 이어받기)")
+
+
+def test_backfill_before_existing_data_is_merged():
+    """모니터가 기록한 최근 캔들보다 과거 구간은 병합되어야 합니다."""
+    end_ms = _closed_end_ms()
+    start_ms = end_ms - 2 * 86_400_000
+
+    async def monitor_wrote_recent(backfiller, archive):
+        recent = decode_klines(make_klines("BTCUSDT", "5m", end_ms - STEP, 100))
+        return archive.append("BTCUSDT", "5m", recent)
+
+    async def backfill_history(backfiller, archive):
+        return await backfiller.backfill("BTCUSDT", "5m", start_ms)
+
+    with tempfile.TemporaryDirectory() as root:
+        archive, results = asyncio.run(_run(root, [monitor_wrote_recent, backfill_history]))
+        assert results[1][0] == 576 - 100
+        _assert_contiguous(archive.load("BTCUSDT", "5m"), start_ms, end_ms)
+        assert not os.path.exists(os.path.join(root, '.backfill', 'futures', 'BTCUSDT_5m'))
+    print("✅ 기존 데이터보다 과거 구간 병합")
+
+
+def test_backfill_many_runs_series_concurrently():
+    end_ms = _closed_end_ms()
+    start_ms = end_ms - 100 * STEP
+    symbols = ["BTCUSDT", "ETHUSDT", "SOLUSDT"]
+
+    async def run(root):
+        server = FakeBinanceServer(symbols=symbols, delay=0.2)
+        base_url = await server.start()
+        client = AsyncMarketDataClient(market_type='futures', base_url=base_url)
+        archive = CandleArchive(root, 'futures', max_rows=None)
+        try:
+            started = time.perf_counter()
+            written = await CandleBackfiller(client, archive, page_size=200,
+                                             series_concurrency=3).backfill_many(symbols, ["5m"], start_ms)
+            return archive, written, time.perf_counter() - started
+        finally:
+            await client.close()
+            await server.stop()
+
+    with tempfile.TemporaryDirectory() as root:
+        archive, written, elapsed = asyncio.run(run(root))
+        assert written == 300 and all(archive.length(symbol, "5m") == 100 for symbol in symbols)
+    # 시리즈마다 요청 1회(0.2초) → 차례로 채우면 0.6초 이상
+    assert elapsed < 0.5, elapsed
+    print(f"✅ 3개 종목 시리즈를 동시에 백필 ({elapsed * 1000:.0f}ms)")
+
+
+def test_merge_over_max_rows_keeps_newest():
+    candles = decode_klines(make_klines("BTCUSDT", "5m", _closed_end_ms() - STEP, 150))
+    with tempfile.TemporaryDirectory() as root:
+        archive = CandleArchive(root, 'futures', max_rows=100)
+        archive.append("BTCUSDT", "5m", candles[100:])
+        archive.merge("BTCUSDT", "5m", candles[:100])
+        loaded = archive.load("BTCUSDT", "5m")
+        # 제한을 넘는 오래된 캔들은 경고와 함께 버려지고, 제한이 없으면 모두 보관
+        np.testing.assert_array_equal(loaded.timestamp, candles.timestamp[50:])
+        unlimited = CandleArchive(os.path.join(root, 'all'), 'futures', max_rows=None)
+        unlimited.append("BTCUSDT", "5m", candles[100:])
+        unlimited.merge("BTCUSDT", "5m", candles[:100])
+        assert unlimited.length("BTCUSDT", "5m") == 150
+    print("✅ 최대 캔들 수를 넘는 병합은 최근 캔들만 유지 (제한 없는 아카이브는 전체 보관)")
+
+
+def test_analyzer_reads_history_range():
+    end_ms = _closed_end_ms()
+    candles = decode_klines(make_klines("BTCUSDT", "5m", end_ms - STEP, 2000))
+    with tempfile.TemporaryDirectory() as root:
+        archive = CandleArchive(root, 'futures')
+        archive.append("BTCUSDT", "5m", candles)
+        analyzer = TechnicalAnalyzer(market_data=None, market_type='futures', candle_archive=archive)
+
+        start = datetime.fromtimestamp(int(candles.timestamp[500]), tz=timezone.utc)
+        end = datetime.fromtimestamp(int(candles.timestamp[1500]), tz=timezone.utc)
+        history = analyzer.load_history("BTCUSDT", "5m", start, end)
+        assert len(history) == 1000
+        np.testing.assert_array_equal(history.close, candles.close[500:1500])
+        assert len(analyzer.load_history("BTCUSDT", "5m")) == 2000
+    print("✅ TechnicalAnalyzer.load_history 구간 조회")
+
+
+if __name__ == "__main__":
+    print("🧪 과거 캔들 백필 테스트")
+    print("=" * 50)
+    test_paginated_backfill_and_resume()
+    test_backfill_before_existing_data_is_merged()
+    test_backfill_many_runs_series_concurrently()
+    test_merge_over_max_rows_keeps_newest()
+    test_analyzer_reads_history_range()
+    print("\n🎉 모든 테스트 통과!")
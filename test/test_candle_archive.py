@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+디스크 캔들 아카이브(재시작 후 이어서 조회) 테스트 (로컬 가짜 Binance 서버 사용)
+"""
+import sys
+import os
+# 상위 디렉터리(프로젝트 루트)를 Python path에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+# 테스트 헬퍼(fake_binance) 경로
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import asyncio
+import tempfile
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+
+import candle_store
+from candle_archive import CandleArchive
+from candle_store import CandleStore
+from candles import decode_klines
+from fake_binance import FakeBinanceServer, INTERVAL_MS, make_klines
+from market_data import AsyncMarketDataClient
+
+
+def test_append_and_load_round_trip():
+    rows = make_klines("BTCUSDT", "5m", 1_700_000_000_000, 200)
+    candles = decode_klines(rows)
+    with tempfile.TemporaryDirectory() as root:
+        archive = CandleArchive(root, 'futures')
+        assert archive.load("BTCUSDT", "5m") is None
+        assert archive.append("BTCUSDT", "5m", candles[:150]) == 150
+        # 이미 저장된 구간과 겹치는 캔들은 다시 쓰지 않음
+        assert archive.append("BTCUSDT", "5m", candles[100:]) == 50
+
+        reopened = CandleArchive(root, 'futures')
+        loaded = reopened.load("BTCUSDT", "5m")
+        assert reopened.last_timestamp("BTCUSDT", "5m") == candles.last_timestamp
+        np.testing.assert_array_equal(loaded.timestamp, candles.timestamp)
+        np.testing.assert_array_equal(loaded.values, candles.values)
+        assert len(reopened.load("BTCUSDT", "5m", limit=30)) == 30
+        assert os.path.isdir(os.path.join(root, 'futures', 'BTCUSDT_5m'))
+    print("✅ 컬럼 파일 기록/메모리 매핑 복원")
+
+
+def test_partial_write_is_repaired():
+    """가격 컬럼만 기록되고 timestamp가 없는 행은 버려야 합니다."""
+    candles = decode_klines(make_klines("BTCUSDT", "5m", 1_700_000_000_000, 10))
+    with tempfile.TemporaryDirectory() as root:
+        CandleArchive(root, 'spot').append("BTCUSDT", "5m", candles)
+        series_dir = os.path.join(root, 'spot', 'BTCUSDT_5m')
+        with open(os.path.join(series_dir, 'close.bin'), 'ab') as f:
+            f.write(np.float64(1.0).tobytes())
+
+        archive = CandleArchive(root, 'spot')
+        assert archive.length("BTCUSDT", "5m") == 10
+        more = decode_klines(make_klines("BTCUSDT", "5m", 1_700_000_000_000 + 3 * 300_000, 3))
+        assert archive.append("BTCUSDT", "5m", more) == 3
+        loaded = archive.load("BTCUSDT", "5m")
+        assert len(loaded) == 13
+        np.testing.assert_array_equal(loaded.close[-3:], more.close)
+    print("✅ 불완전 기록 복구")
+
+
+async def _restart_with_archive(root: str):
+    server = FakeBinanceServer(symbols=["BTCUSDT"])
+    base_url = await server.start()
+    client = AsyncMarketDataClient(market_type='futures', base_url=base_url)
+    try:
+        # 첫 실행: 전체 조회 후 마감 캔들 기록
+        first_run = CandleStore(client, archive=CandleArchive(root, 'futures'))
+        await first_run.get("BTCUSDT", "5m", 100)
+
+        # 재시작: 그 사이 캔들 3개가 새로 마감됨
+        server.time_offset_ms = 3 * INTERVAL_MS["5m"]
+        server.requests.clear()
+        restarted = CandleStore(client, archive=CandleArchive(root, 'futures'))
+        candles = await restarted.get("BTCUSDT", "5m", 100)
+        restart_requests = list(server.requests)
+
+        fresh = await CandleStore(client).get("BTCUSDT", "5m", 100)
+    finally:
+        await client.close()
+        await server.stop()
+    return candles, restart_requests, fresh
+
+
+def test_restart_fetches_only_the_gap():
+    with tempfile.TemporaryDirectory() as root:
+        candles, requests, fresh = asyncio.run(_restart_with_archive(root))
+    assert requests and all('startTime' in r for r in requests), requests
+    assert sum(int(r['limit']) for r in requests) < 10
+    pd.testing.assert_frame_equal(candles.df, fresh.df)
+    print(f"✅ 재시작 후 증분 조회 {len(requests)}회로 복원 (limit 합계 {sum(int(r['limit']) for r in requests)})")
+
+
+async def _restart_after_long_downtime(root: str):
+    server = FakeBinanceServer(symbols=["BTCUSDT"])
+    base_url = await server.start()
+    client = AsyncMarketDataClient(market_type='futures', base_url=base_url)
+    try:
+        await CandleStore(client, archive=CandleArchive(root, 'futures')).get("BTCUSDT", "5m", 100)
+
+        # 분석 창(100개)보다 긴 200개 캔들 동안 종료된 뒤 재시작 (로컬 시계도 함께 이동)
+        server.time_offset_ms = 200 * INTERVAL_MS["5m"]
+        candle_store.time = SimpleNamespace(time=lambda: time.time() + server.time_offset_ms / 1000)
+        restarted = await CandleStore(client, archive=CandleArchive(root, 'futures')).get("BTCUSDT", "5m", 100)
+        # 다음 재시작은 디스크에서 복원
+        server.requests.clear()
+        restored = await CandleStore(client, archive=CandleArchive(root, 'futures')).get("BTCUSDT", "5m", 150)
+        restore_requests = list(server.requests)
+    finally:
+        candle_store.time = time
+        await client.close()
+        await server.stop()
+    return restarted, restored, restore_requests
+
+
+def test_restart_after_downtime_longer_than_window():
+    with tempfile.TemporaryDirectory() as root:
+        restarted, restored, requests = asyncio.run(_restart_after_long_downtime(root))
+        archived = CandleArchive(root, 'futures').load("BTCUSDT", "5m")
+    step = INTERVAL_MS["5m"] // 1000
+    # 아카이브와 복원된 시리즈 모두 공백 없이 연속
+    assert set(np.diff(archived.timestamp)) == {step}
+    assert archived.last_timestamp >= restarted.timestamp[-2]
+    assert len(restored) == 150 and set(np.diff(restored.timestamp)) == {step}
+    print(f"✅ 분석 창보다 긴 종료 후 재시작: 공백 없는 아카이브 {len(archived)}개 (조회 {len(requests)}회)")
+
+
+def test_restore_skips_existing_gap():
+    """공백이 남은 기존 아카이브는 마지막 공백 이후의 연속 구간만 복원해야 합니다."""
+    rows = make_klines("BTCUSDT", "5m", int(time.time() * 1000), 300)
+    candles = decode_klines(rows)
+    with tempfile.TemporaryDirectory() as root:
+        archive = CandleArchive(root, 'futures')
+        archive.append("BTCUSDT", "5m", candles[:100])
+        archive.append("BTCUSDT", "5m", candles[250:-1])
+        store = CandleStore(None, archive=CandleArchive(root, 'futures'))
+        restored = store._load_archive("BTCUSDT", "5m", 150)
+    np.testing.assert_array_equal(restored.timestamp, candles.timestamp[250:-1])
+    print("✅ 공백이 있는 기존 아카이브는 최근 연속 구간만 복원")
+
+
+if __name__ == "__main__":
+    print("🧪 디스크 캔들 아카이브 테스트")
+    print("=" * 50)
+    test_append_and_load_round_trip()
+    test_partial_write_is_repaired()
+    test_restart_fetches_only_the_gap()
+    test_restart_after_downtime_longer_than_window()
+    test_restore_skips_existing_gap()
+    print("\n🎉 모든 테스트 통과!")
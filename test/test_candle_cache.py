@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+주기(cycle) 캔들 캐시 테스트 (로컬 가짜 Binance 서버 사용)
+"""
+import sys
+import os
+# 상위 디렉터리(프로젝트 루트)를 Python path에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+# 테스트 헬퍼(fake_binance) 경로
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import asyncio
+
+from fake_binance import FakeBinanceServer
+from market_data import AsyncMarketDataClient
+from technical_analysis import TechnicalAnalyzer
+
+SYMBOLS = ["BTCUSDT", "ETHUSDT", "SOLUSDT"]
+TIMEFRAMES = ["5m", "15m"]
+PERIODS = [7, 14, 21]
+
+
+async def _run_all_detectors(analyzer: TechnicalAnalyzer):
+    results = []
+    for symbol in SYMBOLS:
+        results.append(await analyzer.analyze_rsi_conditions(symbol, TIMEFRAMES, PERIODS, 30, 70))
+        for tf in TIMEFRAMES:
+            results.append(await analyzer.detect_immediate_rsi_divergence(symbol, tf, 14, 10))
+            results.append(await analyzer.detect_rsi_divergence(symbol, tf, 14, 15))
+    return results
+
+
+async def _compare_with_and_without_cache():
+    server = FakeBinanceServer(symbols=SYMBOLS)
+    base_url = await server.start()
+    client = AsyncMarketDataClient(market_type='futures', base_url=base_url)
+    analyzer = TechnicalAnalyzer(market_data=client, market_type='futures')
+    try:
+        uncached = await _run_all_detectors(analyzer)
+        uncached_requests = server.count('/klines')
+
+        server.requests.clear()
+        window = max(analyzer.rsi_window(PERIODS),
+                     analyzer.immediate_divergence_window(14, 10),
+                     analyzer.divergence_window(14, 15))
+        analyzer.begin_cycle({tf: window for tf in TIMEFRAMES})
+        try:
+            cached = await _run_all_detectors(analyzer)
+        finally:
+            analyzer.end_cycle()
+        cached_requests = server.count('/klines')
+    finally:
+        await client.close()
+        await server.stop()
+    return uncached, cached, uncached_requests, cached_requests
+
+
+def test_cycle_cache_fetches_once_per_series():
+    uncached, cached, uncached_requests, cached_requests = asyncio.run(_compare_with_and_without_cache())
+    # 시간 문자열을 제외하면 캐시 사용 여부와 관계없이 결과가 같아야 함
+    strip = lambda alerts: [a.split(' - ')[0] for a in alerts]
+    assert [strip(r) for r in uncached] == [strip(r) for r in cached]
+    assert uncached_requests == len(SYMBOLS) * len(TIMEFRAMES) * 3
+    assert cached_requests == len(SYMBOLS) * len(TIMEFRAMES)
+    print(f"✅ 캔들 요청 수: 캐시 없음 {uncached_requests}회 → 주기 캐시 {cached_requests}회")
+
+
+if __name__ == "__main__":
+    test_cycle_cache_fetches_once_per_series()
+    print("\n✨ 주기 캔들 캐시 테스트 완료!")
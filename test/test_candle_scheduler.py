@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+timeframe별 봉 마감 스케줄러 테스트 (UTC 봉 경계, 마감된 timeframe의 조건만 확인)
+"""
+import sys
+import os
+# 상위 디렉터리(프로젝트 루트)를 Python path에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+# 테스트 헬퍼(monitor_fixtures) 경로
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import asyncio
+from datetime import datetime, timezone
+
+import crypto_monitor
+from crypto_monitor import CryptoMonitor
+from monitor_fixtures import ticker
+from scheduler import TICKER_TIMER, CandleCloseScheduler
+
+HOUR = 1_700_000_000 // 3600 * 3600
+PERIODS = {'1h': 3600, '5m': 300, TICKER_TIMER: 900, '15m': 900}
+
+
+def test_next_close_and_due():
+    scheduler = CandleCloseScheduler(PERIODS)
+    assert scheduler.next_close(HOUR + 7 * 60 + 30) == (HOUR + 600, ['5m'])
+    assert scheduler.next_close(HOUR + 12 * 60) == (HOUR + 900, ['5m', TICKER_TIMER, '15m'])
+    assert scheduler.next_close(HOUR + 3599.5) == (HOUR + 3600, ['5m', TICKER_TIMER, '15m', '1h'])
+    # 정확히 경계 시각이면 그 다음 경계
+    assert scheduler.next_close(HOUR + 600)[0] == HOUR + 900
+    assert scheduler.due_at([HOUR + 300]) == ['5m']
+    assert scheduler.due_at([HOUR + 300, HOUR + 3600]) == ['5m', TICKER_TIMER, '15m', '1h']
+
+    # 1d 봉은 UTC 자정에 마감
+    close_at, due = CandleCloseScheduler({'1d': 86400, '4h': 14400}).next_close(HOUR + 1)
+    assert datetime.fromtimestamp(close_at, timezone.utc).hour % 4 == 0 and close_at % 14400 == 0
+    close_at, due = CandleCloseScheduler({'1d': 86400}).next_close(HOUR + 1)
+    assert datetime.fromtimestamp(close_at, timezone.utc).strftime('%H:%M') == '00:00' and due == ['1d']
+
+    # 한 시간 동안 타이머별 실행 횟수
+    counts = {name: 0 for name in PERIODS}
+    now = HOUR
+    while True:
+        now, due = scheduler.next_close(now)
+        if now > HOUR + 3600:
+            break
+        for name in due:
+            counts[name] += 1
+    assert counts == {'5m': 12, '15m': 4, '1h': 1, TICKER_TIMER: 4}
+    print(f"✅ UTC 봉 경계 기준 다음 마감/마감 timeframe 계산 (1시간 실행 횟수: {counts})")
+
+
+def test_only_due_conditions_run():
+    symbols = ["BTCUSDT", "ETHUSDT"]
+    monitor = CryptoMonitor()
+    monitor.ticker_snapshot = {symbol: ticker(symbol) for symbol in symbols}
+    calls = {'fetch': set(), 'rsi': [], 'divergence': []}
+
+    async def fetch_candles(symbol, interval, limit):
+        calls['fetch'].add(interval)
+        return None
+    monitor.technical_analyzer._fetch_candles = fetch_candles
+
+    async def rsi_batch(batch, timeframes, *args):
+        calls['rsi'].append(list(timeframes))
+        return {symbol: [] for symbol in batch}
+    monitor.technical_analyzer.analyze_rsi_conditions_batch = rsi_batch
+
+    async def detect_divergences(symbol, timeframes, **kwargs):
+        calls['divergence'].append(list(timeframes))
+        return {}
+    monitor.technical_analyzer.detect_divergences = detect_divergences
+
+    conditions = crypto_monitor.MONITOR_CONDITIONS
+    conditions['price_change_24h_percent'] = {'min': -5}
+    cooldown = dict(crypto_monitor.ALERT_COOLDOWN)
+    crypto_monitor.ALERT_COOLDOWN.update({'enabled': False})
+
+    async def run():
+        try:
+            results = []
+            for due in (['5m'], ['5m', TICKER_TIMER, '15m'], None):
+                for key in calls:
+                    calls[key] = set() if key == 'fetch' else []
+                monitor.previous_data.clear()
+                messages = await monitor._evaluate_symbols(symbols, due=due)
+                results.append((dict(calls), len(messages), set(monitor.previous_data)))
+            return results
+        finally:
+            await monitor.close()
+
+    try:
+        (five, five_messages, five_previous), (quarter, quarter_messages, quarter_previous), \
+            (full, full_messages, full_previous) = asyncio.run(run())
+    finally:
+        del conditions['price_change_24h_percent']
+        crypto_monitor.ALERT_COOLDOWN.clear()
+        crypto_monitor.ALERT_COOLDOWN.update(cooldown)
+
+    # 5m 마감: 5m 조건만, 티커 조건/previous_data 갱신 없음, 15m 캔들은 조회하지 않음
+    assert five['rsi'] == [['5m']] and five['divergence'] == [['5m'], ['5m']]
+    assert five['fetch'] == {'5m'}
+    assert five_messages == 0 and five_previous == set()
+    # 15분 경계: 5m/15m 조건과 티커 조건
+    assert quarter['rsi'] == [['5m', '15m']] and quarter['divergence'] == [['5m', '15m']] * 2
+    assert quarter_messages == 2 and quarter_previous == set(symbols)
+    # 주기 밖(due 없음)에서는 모든 조건
+    assert full['rsi'] == [['5m', '15m']] and full_messages == 2 and full_previous == set(symbols)
+    print("✅ 봉이 마감된 timeframe의 조건만 확인 (5m 마감에는 15m 계산/조회와 티커 조건 생략)")
+
+
+if __name__ == "__main__":
+    print("🧪 봉 마감 스케줄러 테스트")
+    print("=" * 50)
+    test_next_close_and_due()
+    test_only_due_conditions_run()
+    print("\n🎉 모든 테스트 통과!")
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+롤링 캔들 저장소(증분 조회) 테스트 (로컬 가짜 Binance 서버 사용)
+"""
+import sys
+import os
+# 상위 디렉터리(프로젝트 루트)를 Python path에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+# 테스트 헬퍼(fake_binance) 경로
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import asyncio
+
+import numpy as np
+import pandas as pd
+
+from candle_store import CandleStore
+from candles import decode_klines
+from fake_binance import FakeBinanceServer, INTERVAL_MS, make_klines
+from market_data import AsyncMarketDataClient
+
+
+async def _warm_up_then_delta():
+    server = FakeBinanceServer(symbols=["BTCUSDT"])
+    base_url = await server.start()
+    client = AsyncMarketDataClient(market_type='futures', base_url=base_url)
+    store = CandleStore(client)
+    try:
+        first = await store.get("BTCUSDT", "5m", 100)
+        warm_up_request = dict(server.requests[-1])
+
+        # 캔들 2개가 새로 마감된 상황
+        server.time_offset_ms = 2 * INTERVAL_MS["5m"]
+        server.requests.clear()
+        second = await store.get("BTCUSDT", "5m", 100)
+        delta_requests = list(server.requests)
+
+        # 비교용: 같은 시점에 저장소 없이 전체 조회한 결과
+        fresh = await CandleStore(client).get("BTCUSDT", "5m", 100)
+    finally:
+        await client.close()
+        await server.stop()
+    return first, warm_up_request, second, delta_requests, fresh
+
+
+def test_delta_fetch_matches_full_fetch():
+    first, warm_up_request, second, delta_requests, fresh = asyncio.run(_warm_up_then_delta())
+    assert len(first) == 100 and 'startTime' not in warm_up_request
+
+    # 증분 조회는 마지막 저장 캔들(진행 중이던 캔들)부터 요청해야 함
+    assert delta_requests and all('startTime' in r for r in delta_requests)
+    assert int(delta_requests[0]['startTime']) == int(first.timestamp[-1]) * 1000
+    assert sum(int(r['limit']) for r in delta_requests) < 10
+
+    assert int(second.timestamp[-1]) - int(first.timestamp[-1]) == 2 * 300
+    pd.testing.assert_frame_equal(second.df, fresh.df)
+    print(f"✅ 증분 조회 {len(delta_requests)}회로 전체 조회와 같은 결과")
+
+
+
+def test_decode_klines_matches_row_parsing():
+    """NumPy 컬럼 디코딩 결과가 행 단위 float() 변환과 같아야 합니다."""
+    rows = make_klines("BTCUSDT", "5m", 1_700_000_000_000, 300)
+    candles = decode_klines(rows)
+
+    expected = pd.DataFrame([{
+        'timestamp': int(r[0]) // 1000,
+        'open': float(r[1]), 'high': float(r[2]), 'low': float(r[3]),
+        'close': float(r[4]), 'volume': float(r[5]),
+    } for r in rows])
+    expected['datetime'] = pd.to_datetime(expected['timestamp'], unit='s', utc=True)
+
+    assert candles.values.dtype == 'float64' and candles.timestamp.dtype == 'int64'
+    assert candles.close.flags['C_CONTIGUOUS']
+    pd.testing.assert_frame_equal(candles.df, expected)
+
+    # 슬라이스는 복사 없이 원본 배열을 공유하고 DataFrame은 한 번만 생성
+    tail = candles.tail(50)
+    assert np.shares_memory(tail.close, candles.values)
+    assert tail.df is tail.df
+    print("✅ NumPy 컬럼 디코딩 결과 일치")
+
+
+if __name__ == "__main__":
+    test_delta_fetch_matches_full_fetch()
+    test_decode_klines_matches_row_parsing()
+    print("\n✨ 롤링 캔들 저장소 테스트 완료!")
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+종목별 조건 확인 동시 실행 테스트 (동시 실행 수 제한, 종목당 제한 시간, 알림 캐시 일관성)
+"""
+import sys
+import os
+# 상위 디렉터리(프로젝트 루트)를 Python path에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+# 테스트 헬퍼(monitor_fixtures) 경로
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import asyncio
+import time
+
+import crypto_monitor
+from monitor_fixtures import stub_monitor
+from scheduler import CycleBudget
+
+
+def test_fan_out_is_bounded():
+    symbols = [f"SYM{i}USDT" for i in range(10)]
+    monitor = stub_monitor(symbols)
+    monitor.max_concurrent_symbols = 3
+    running = {'now': 0, 'max': 0}
+
+    async def check(ticker, symbol, rsi_alerts=None, indicator_alerts=None):
+        running['now'] += 1
+        running['max'] = max(running['max'], running['now'])
+        await asyncio.sleep(0.05)
+        running['now'] -= 1
+        return [f"{symbol} 알림"]
+    monitor.check_conditions = check
+
+    async def run():
+        try:
+            started = time.perf_counter()
+            messages = await monitor._evaluate_symbols(symbols)
+            return messages, time.perf_counter() - started
+        finally:
+            await monitor.close()
+
+    messages, elapsed = asyncio.run(run())
+    assert not monitor.network_requests, monitor.network_requests
+    assert len(messages) == 10
+    assert running['max'] == 3
+    # 10종목 / 동시 3개 = 4번에 나눠 실행 (순차 실행이면 0.5초)
+    assert elapsed < 0.4, elapsed
+    print(f"✅ 10종목을 최대 3개씩 동시에 확인 ({elapsed * 1000:.0f}ms)")
+
+
+def test_slow_symbol_times_out_without_side_effects():
+    symbols = ["FASTUSDT", "SLOWUSDT", "OTHERUSDT"]
+    monitor = stub_monitor(symbols)
+    monitor.symbol_timeout_seconds = 0.2
+    delays = {"SLOWUSDT": 5.0}
+
+    async def detect_divergences(symbol, timeframes, **kwargs):
+        await asyncio.sleep(delays.get(symbol, 0))
+        return {}
+    monitor.technical_analyzer.detect_divergences = detect_divergences
+
+    conditions = crypto_monitor.MONITOR_CONDITIONS
+    conditions['price_change_24h_percent'] = {'min': -5}
+    cooldown = dict(crypto_monitor.ALERT_COOLDOWN)
+    crypto_monitor.ALERT_COOLDOWN.update({'enabled': True, 'per_condition_type': True})
+
+    budget = CycleBudget(deadline=time.monotonic() + 10)
+
+    async def run():
+        try:
+            started = time.perf_counter()
+            first = await monitor._evaluate_symbols(symbols, budget=budget)
+            elapsed = time.perf_counter() - started
+            state = (set(monitor.alert_cache), set(monitor.previous_data))
+            # 다음 주기에는 느린 종목도 제시간에 끝남
+            delays.clear()
+            second = await monitor._evaluate_symbols(symbols)
+            return first, elapsed, state, second
+        finally:
+            await monitor.close()
+
+    try:
+        first, elapsed, (cache_keys, previous), second = asyncio.run(run())
+    finally:
+        del conditions['price_change_24h_percent']
+        crypto_monitor.ALERT_COOLDOWN.clear()
+        crypto_monitor.ALERT_COOLDOWN.update(cooldown)
+
+    assert not monitor.network_requests, monitor.network_requests
+    assert elapsed < 1.0, elapsed
+    # 주기 마감 시한 전에 종목당 제한 시간으로 제외된 종목은 확인한 종목으로 세지 않음
+    assert (budget.checked, budget.timed_out, budget.skipped) == (2, 1, 0), budget.summary()
+    assert sorted(m.split('</b>')[0] for m in first) == ["🚨 <b>알림: FASTUSDT", "🚨 <b>알림: OTHERUSDT"]
+    # 시간 초과된 종목은 알림 캐시와 previous_data에 흔적이 없음
+    assert cache_keys == {"FASTUSDT_price_drop_-5", "OTHERUSDT_price_drop_-5"}
+    assert previous == {"FASTUSDT", "OTHERUSDT"}
+    # 보내지 못한 알림이 쿨다운에 걸리지 않고 다음 주기에 발송됨
+    assert [m.split('</b>')[0] for m in second] == ["🚨 <b>알림: SLOWUSDT"]
+    print(f"✅ 느린 종목은 {elapsed * 1000:.0f}ms에 제외되고 다음 주기에 알림 발송 (캐시/previous_data 일관)")
+
+
+if __name__ == "__main__":
+    print("🧪 종목별 동시 확인 테스트")
+    print("=" * 50)
+    test_fan_out_is_bounded()
+    test_slow_symbol_times_out_without_side_effects()
+    print("\n🎉 모든 테스트 통과!")
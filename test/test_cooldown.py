@@ -63,7 +63,7 @@ async def test_cooldown():
                 cooldown_minutes = div_config.get('cooldown_minutes', 30)
                 
                 for timeframe in div_timeframes:
-                    divergence_alerts = monitor.technical_analyzer.detect_rsi_divergence(
+                    divergence_alerts = await monitor.technical_analyzer.detect_rsi_divergence(
                         symbol, timeframe, rsi_period, lookback_range, recent_bars_only
                     )
                     
@@ -123,7 +123,7 @@ async def test_cooldown():
     print("🔍 두 번째 검사 (쿨다운 중이어야 함)...")
     second_results = {}
     for ticker, symbol in test_tickers:
-        alerts = monitor.check_conditions(ticker, symbol)
+        alerts = await monitor.check_conditions(ticker, symbol)
         second_results[symbol] = alerts
         if alerts:
             print(f"❌ 쿨다운 실패: {symbol}에서 {len(alerts)}개 알림 발견")
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+주기 마감 시한 테스트 (부분 결과 기록, 시한 초과 종목 건너뛰기, 밀린 주기 건너뛰기)
+"""
+import sys
+import os
+# 상위 디렉터리(프로젝트 루트)를 Python path에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+# 테스트 헬퍼(monitor_fixtures) 경로
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import asyncio
+import time
+
+import crypto_monitor
+from monitor_fixtures import stub_monitor
+from scheduler import CycleBudget
+
+
+def test_budget_accounting():
+    now = {'t': 100.0}
+    budget = CycleBudget(deadline=160.0, clock=lambda: now['t'])
+    assert budget.budget_seconds == 60 and budget.remaining() == 60 and not budget.expired()
+    now['t'] = 130.0
+    budget.total, budget.checked = 10, 10
+    budget.finish()
+    assert budget.summary() == "30.0초/60.0초 (50%, 확인 10/10종목, 알림 0개)"
+    # 시한 전 종목당 제한 시간 초과는 timed_out, 시한이 지난 뒤에는 skipped
+    budget.record_timeout()
+    assert budget.summary() == "30.0초/60.0초 (50%, 확인 10/10종목, 알림 0개, 종목당 제한 시간 초과 1종목)"
+    now['t'] = 170.0
+    assert budget.expired() and budget.remaining() == 0 and budget.elapsed == 30
+    budget.record_timeout(2)
+    assert (budget.timed_out, budget.skipped) == (1, 2) and budget.partial
+
+    budget = CycleBudget.until(time.time() + 30, margin_seconds=5)
+    assert 24 < budget.budget_seconds <= 25
+    print("✅ 예산 계산 (남은 시간, 사용률, 봉 마감 시각 → 마감 시한)")
+
+
+def test_deadline_keeps_partial_results():
+    symbols = [f"SYM{i}USDT" for i in range(12)]
+    monitor = stub_monitor(symbols)
+    monitor.max_concurrent_symbols = 2
+    monitor.analysis_batch_size = 2
+    # 알림 캐시 일관성을 확인하기 위해 가격 조건 사용
+    conditions = crypto_monitor.MONITOR_CONDITIONS
+    conditions['price_change_24h_percent'] = {'min': -5}
+    cooldown = dict(crypto_monitor.ALERT_COOLDOWN)
+    crypto_monitor.ALERT_COOLDOWN.update({'enabled': True, 'per_condition_type': True})
+
+    async def detect_divergences(symbol, timeframes, **kwargs):
+        await asyncio.sleep(0.1)
+        return {}
+    monitor.technical_analyzer.detect_divergences = detect_divergences
+
+    async def run():
+        try:
+            budget = CycleBudget(deadline=time.monotonic() + 0.25)
+            messages = await monitor._evaluate_symbols(symbols, budget=budget)
+            budget.finish()
+            return budget, messages
+        finally:
+            await monitor.close()
+
+    try:
+        budget, messages = asyncio.run(run())
+    finally:
+        del conditions['price_change_24h_percent']
+        crypto_monitor.ALERT_COOLDOWN.clear()
+        crypto_monitor.ALERT_COOLDOWN.update(cooldown)
+
+    # 동시 2종목 × 0.1초 → 시한(0.25초) 안에 4~6종목만 확인
+    assert budget.total == 12 and budget.partial
+    assert budget.checked + budget.skipped == 12
+    assert 4 <= budget.checked <= 6, budget.checked
+    assert budget.checked == len(messages)
+    assert budget.elapsed < 0.5, budget.elapsed
+    # 시한 전에 끝난 종목만 결과/알림 캐시에 남고, 건너뛰거나 중단된 종목은 흔적이 없음
+    alerted = {message.split('</b>')[0].split(': ')[1] for message in messages}
+    assert budget.alerts == len(messages) and len(messages) >= 4
+    assert {key.split('_')[0] for key in monitor.alert_cache} == alerted
+    assert set(monitor.previous_data) == alerted
+    print(f"✅ 시한 도달 시 부분 결과 기록: {budget.summary()}")
+
+
+def test_scheduled_cycle_logs_budget_and_skips_overrun():
+    monitor = stub_monitor([])
+    monitor.cycle_deadline_margin_seconds = 0
+    close_at = time.time() + 0.2
+    monitor.candle_scheduler.next_close = lambda now=None: (close_at, ['5m'])
+    calls = []
+
+    async def slow_markets(budget=None, due=None):
+        # 마감 시한을 넘겨 끝나는 주기
+        calls.append(due)
+        await asyncio.sleep(0.3)
+    monitor.monitor_markets = slow_markets
+
+    async def run():
+        try:
+            return await monitor.run_scheduled_cycle(['5m'])
+        finally:
+            await monitor.close()
+
+    budget = asyncio.run(run())
+    assert calls == [['5m']]
+    assert monitor.last_cycle_budget is budget and budget.finished is not None
+    assert budget.elapsed > budget.budget_seconds
+    print(f"✅ 주기 예산 기록 및 시한 초과 주기 경고 ({budget.summary()})")
+
+
+if __name__ == "__main__":
+    print("🧪 주기 마감 시한 테스트")
+    print("=" * 50)
+    test_budget_accounting()
+    test_deadline_keeps_partial_results()
+    test_scheduled_cycle_logs_budget_and_skips_overrun()
+    print("\n🎉 모든 테스트 통과!")
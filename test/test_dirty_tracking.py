@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+감지기 결과 재사용 테스트 (캔들이 바뀌지 않았으면 감지기를 다시 실행하지 않음)
+"""
+import sys
+import os
+# 상위 디렉터리(프로젝트 루트)를 Python path에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+# 테스트 헬퍼(analysis_fixtures) 경로
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import asyncio
+import time
+
+import technical_analysis
+from analysis_fixtures import make_candles, strip_times, stub_analyzer
+from candles import CandleArrays
+
+PARAMS = dict(rsi_period=14, immediate_lookback=10, lookback_periods=15, left_bars=5, right_bars=5,
+              lookback_range=(5, 60), recent_bars=5, include_hidden=True)
+INDICATORS = {'macd': {'fast': 12, 'slow': 26, 'signal': 9}, 'bollinger': {'period': 20, 'deviations': 2.0},
+              'vwap': {'period': 14, 'deviation_percent': 0.05}}
+# 종목마다 RSI 조건, 지표 조건, 다이버전스 감지기 3개(즉시/lookback/피벗)
+DETECTORS = 5
+
+
+def _universe(count: int, n: int = 200):
+    return {(f"SYM{i}USDT", "5m"): make_candles(n, i, random_volume=True) for i in range(count)}
+
+
+def _replace_forming(data, key, row, factor):
+    """진행 중인 캔들의 한 값(row: o/h/l/c/v 순서)만 바꿉니다."""
+    values = data[key].values.copy()
+    values[row, -1] *= factor
+    data[key] = CandleArrays(data[key].timestamp, values)
+
+
+class _Counter:
+    def __init__(self, function):
+        self.function = function
+        self.symbols = []
+
+    def __call__(self, symbols, *args, **kwargs):
+        self.symbols.append(list(symbols))
+        return self.function(symbols, *args, **kwargs)
+
+
+def test_detectors_skip_unchanged_series():
+    data = _universe(6)
+    symbols = [symbol for symbol, _ in data]
+    # SYM1은 나중에 새 캔들이 추가됨
+    appended = data[("SYM1USDT", "5m")]
+    data[("SYM1USDT", "5m")] = appended[:-1]
+    analyzer = stub_analyzer(data)
+    rsi_calls = analyzer.rsi_engine.latest_many = _Counter(analyzer.rsi_engine.latest_many)
+    indicator_calls = analyzer.indicator_engine.latest_many = _Counter(analyzer.indicator_engine.latest_many)
+    divergence_calls = technical_analysis.analyze_divergences_many = _Counter(
+        technical_analysis.analyze_divergences_many)
+
+    async def analyze(other=None):
+        target = other or analyzer
+        rsi = await target.analyze_rsi_conditions_batch(symbols, ["5m"], [7, 14], 45, 55)
+        indicators = await target.analyze_indicator_conditions_batch(symbols, ["5m"], INDICATORS)
+        divergences = await asyncio.gather(*(target.detect_divergences(s, ["5m"], **PARAMS) for s in symbols))
+        return rsi, indicators, divergences
+
+    async def fresh():
+        # 캐시 없이 같은 캔들을 처음 분석한 결과
+        return await analyze(stub_analyzer(data))
+
+    try:
+        _check_reuse(analyzer, data, appended, analyze, fresh, rsi_calls, indicator_calls, divergence_calls,
+                     len(symbols))
+    finally:
+        technical_analysis.analyze_divergences_many = divergence_calls.function
+    print("✅ 감지기가 읽는 캔들 값이 바뀌지 않은 (종목, timeframe)은 감지기를 건너뛰고 이전 결과 재사용")
+
+
+def _check_reuse(analyzer, data, appended, analyze, fresh, rsi_calls, indicator_calls, divergence_calls, count):
+    first = asyncio.run(analyze())
+    computed = analyzer.analysis_computed
+    assert computed == DETECTORS * count
+
+    # 같은 캔들로 다시 실행 (수동/재시도 실행): 감지기를 실행하지 않고 같은 결과
+    second = asyncio.run(analyze())
+    assert strip_times(second) == strip_times(first)
+    assert analyzer.analysis_computed == computed and analyzer.analysis_reused == DETECTORS * count
+    assert len(rsi_calls.symbols) == len(indicator_calls.symbols) == 1
+    assert len(divergence_calls.symbols) == count
+
+    # 진행 중인 캔들의 종가가 바뀌면 현재가를 읽는 감지기(RSI/지표/즉시 다이버전스)만 다시 계산
+    _replace_forming(data, ("SYM0USDT", "5m"), 3, 0.9)
+    reused = analyzer.analysis_reused
+    rerun = asyncio.run(analyze())
+    assert rsi_calls.symbols[-1] == ["SYM0USDT"] and indicator_calls.symbols[-1] == ["SYM0USDT"]
+    assert len(divergence_calls.symbols) == count + 1
+    # 마감 캔들만 읽는 lookback/피벗 다이버전스는 재사용
+    assert analyzer.analysis_reused - reused == DETECTORS * count - 3
+    assert strip_times(rerun) == strip_times(asyncio.run(fresh()))
+    calls = len(divergence_calls.symbols)
+
+    # 새 캔들이 생긴 종목도 그 종목만 다시 계산
+    data[("SYM1USDT", "5m")] = appended
+    rerun = asyncio.run(analyze())
+    assert rsi_calls.symbols[-1] == ["SYM1USDT"] and indicator_calls.symbols[-1] == ["SYM1USDT"]
+    assert len(divergence_calls.symbols) == calls + 1
+    # RSI/지표 엔진은 이전 이력을 이어 쓰므로 새로 만든 분석기와는 다이버전스 결과만 비교
+    assert strip_times(rerun[2]) == strip_times(asyncio.run(fresh())[2])
+
+    # 캐시를 지우면 다시 계산
+    analyzer.reset_analysis_cache("SYM2USDT")
+    asyncio.run(analyze())
+    assert rsi_calls.symbols[-1] == ["SYM2USDT"]
+
+    # 모니터링 대상에서 빠진 종목의 결과는 정리
+    assert analyzer.retain_analysis_cache([f"SYM{i}USDT" for i in range(1, count)]) == DETECTORS
+    assert not any(key[1] == "SYM0USDT" for key in analyzer._analysis_results)
+
+
+def test_live_price_polls_reuse_closed_candle_detectors():
+    data = _universe(8)
+    symbols = [symbol for symbol, _ in data]
+    analyzer = stub_analyzer(data)
+
+    async def poll():
+        # 폴링 주기 하나: 주기 캐시/지표 그래프 안에서 모든 감지기 실행
+        analyzer.begin_cycle({"5m": 200})
+        await analyzer.analyze_rsi_conditions_batch(symbols, ["5m"], [7, 14], 30, 70)
+        await analyzer.analyze_indicator_conditions_batch(symbols, ["5m"], INDICATORS)
+        await asyncio.gather(*(analyzer.detect_divergences(s, ["5m"], **PARAMS) for s in symbols))
+        counts = (analyzer.analysis_computed, analyzer.analysis_reused)
+        analyzer.end_cycle()
+        return counts
+
+    assert asyncio.run(poll()) == (DETECTORS * len(symbols), 0)
+    # 다음 폴링까지 진행 중인 캔들의 현재가(종가/고가)와 거래량만 움직임
+    for key in data:
+        _replace_forming(data, key, 3, 1.001)
+        _replace_forming(data, key, 1, 1.001)
+        _replace_forming(data, key, 4, 1.5)
+    computed, reused = asyncio.run(poll())
+    # RSI/지표/즉시 다이버전스만 다시 계산하고 lookback/피벗 다이버전스는 재사용
+    assert (computed, reused) == (3 * len(symbols), 2 * len(symbols)), (computed, reused)
+    # 거래량만 바뀌면 거래량을 읽는 지표 조건만 다시 계산
+    for key in data:
+        _replace_forming(data, key, 4, 1.5)
+    computed, reused = asyncio.run(poll())
+    assert (computed, reused) == (len(symbols), (DETECTORS - 1) * len(symbols)), (computed, reused)
+    print(f"✅ 현재가만 움직인 폴링: {len(symbols)}종목 × 감지기 {DETECTORS}개 중 {reused}개 재사용 (거래량만 변경 시)")
+
+
+def test_reused_results_get_current_time():
+    data = _universe(40, n=120)
+    symbols = [symbol for symbol, _ in data]
+    analyzer = stub_analyzer(data)
+
+    async def detect():
+        return await asyncio.gather(*(analyzer.detect_divergences(s, ["5m"], **PARAMS) for s in symbols))
+
+    analyzer._current_time_str = lambda: "2000-01-01 00:00"
+    first = asyncio.run(detect())
+    # 현재 시각이 들어가는 즉시/lookback 메시지가 있는 종목
+    timed = [i for i, alerts in enumerate(first) if " - 2000-01-01 00:00" in "".join(alerts["5m"])]
+    assert timed
+    # 저장된 결과에는 발생 시각이 없고, 재사용할 때 메시지를 만들며 현재 시각을 넣음
+    assert not any(isinstance(result, str) for _, results in analyzer._analysis_results.values()
+                   for result in results)
+    analyzer._current_time_str = lambda: "2000-01-01 00:05"
+    computed = analyzer.analysis_computed
+    second = asyncio.run(detect())
+    assert analyzer.analysis_computed == computed
+    for i in timed:
+        assert second[i]["5m"] == [message.replace(" - 2000-01-01 00:00", " - 2000-01-01 00:05")
+                                   for message in first[i]["5m"]]
+    print(f"✅ 재사용한 다이버전스 결과로 만든 메시지에는 현재 시각 표시 ({len(timed)}종목)")
+
+
+def test_repeat_run_cost():
+    data = _universe(300)
+    symbols = [symbol for symbol, _ in data]
+    analyzer = stub_analyzer(data)
+
+    async def analyze():
+        await analyzer.analyze_rsi_conditions_batch(symbols, ["5m"], [7, 14, 21], 30, 70)
+        await analyzer.analyze_indicator_conditions_batch(symbols, ["5m"], INDICATORS)
+        await asyncio.gather(*(analyzer.detect_divergences(s, ["5m"], **PARAMS) for s in symbols))
+
+    started = time.perf_counter()
+    asyncio.run(analyze())
+    first = time.perf_counter() - started
+    started = time.perf_counter()
+    asyncio.run(analyze())
+    repeat = time.perf_counter() - started
+    assert repeat < first
+    print(f"✅ 300종목 재실행: 첫 분석 {first * 1000:.0f}ms → 변경 없는 재실행 {repeat * 1000:.0f}ms")
+
+
+if __name__ == "__main__":
+    print("🧪 감지기 결과 재사용 테스트")
+    print("=" * 50)
+    test_detectors_skip_unchanged_series()
+    test_live_price_polls_reuse_closed_candle_detectors()
+    test_reused_results_get_current_time()
+    test_repeat_run_cost()
+    print("\n🎉 모든 테스트 통과!")
@@ -51,7 +51,7 @@ async def test_divergence():
             
             for timeframe in timeframes:
                 try:
-                    divergences = analyzer.detect_rsi_divergence(
+                    divergences = await analyzer.detect_rsi_divergence(
                         symbol=symbol,
                         timeframe=timeframe,
                         rsi_period=14,
@@ -36,7 +36,7 @@ async def test_divergence_alert():
         return
 
     # 다이버전스 조건 체크
-    alerts = monitor.check_conditions(ticker, symbol)
+    alerts = await monitor.check_conditions(ticker, symbol)
     print(f"다이버전스 알림 결과: {alerts if alerts else '❌ 알림 없음'}")
 
     # 실제로 알림 메시지 전송 테스트 (텔레그램 설정 필요)
@@ -54,7 +54,7 @@ async def test_futures_monitor():
                 print(f"  {i}. {symbol} 조건 확인 중...")
                 
                 # 개별 ticker에 대해 조건 확인
-                alerts = monitor.check_conditions(ticker_data, symbol)
+                alerts = await monitor.check_conditions(ticker_data, symbol)
                 
                 if alerts:
                     print(f"    🚨 {len(alerts)}개 알림:")
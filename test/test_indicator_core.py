@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+pandas 없는 NumPy 지표 모듈 테스트 (ta 라이브러리 결과와 비트 단위 비교)
+"""
+import sys
+import os
+# 상위 디렉터리(프로젝트 루트)를 Python path에 추가
+PROJECT_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.append(PROJECT_ROOT)
+
+import subprocess
+
+import numpy as np
+import pandas as pd
+from ta.momentum import RSIIndicator
+from ta.trend import EMAIndicator, SMAIndicator
+
+from indicators import ema, rsi_series, sma
+
+
+def _series(seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    n = int(rng.integers(1, 500))
+    values = np.round(100 + np.cumsum(rng.normal(0, 1, n)), int(rng.integers(0, 6)))
+    if seed % 4 == 0:
+        values -= 100           # 음수/0을 지나는 값
+    if n > 30:
+        values[10:25] = values[10]   # 같은 값이 이어지는 구간
+    return values
+
+
+def test_matches_ta_bit_for_bit():
+    checked = 0
+    for seed in range(40):
+        values = _series(seed)
+        series = pd.Series(values)
+        for period in (1, 2, 5, 9, 12, 14, 20, 26, 50, 200):
+            assert np.array_equal(ema(values, period),
+                                  EMAIndicator(series, window=period).ema_indicator().to_numpy(),
+                                  equal_nan=True), ("ema", seed, period)
+            assert np.array_equal(sma(values, period),
+                                  SMAIndicator(series, window=period).sma_indicator().to_numpy(),
+                                  equal_nan=True), ("sma", seed, period)
+            if period > 1:
+                assert np.array_equal(rsi_series(values, period),
+                                      RSIIndicator(series, window=period).rsi().to_numpy(),
+                                      equal_nan=True), ("rsi", seed, period)
+            checked += 1
+    print(f"✅ EMA/SMA/RSI {checked}개 조합이 ta 결과와 비트 단위 일치")
+
+
+def test_hot_path_does_not_import_pandas():
+    code = (
+        "import sys\n"
+        "import technical_analysis, analysis_pool, candle_store, kline_stream, backfill\n"
+        "print(','.join(m for m in ('pandas', 'ta') if m in sys.modules))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=PROJECT_ROOT,
+                            capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "", result.stdout
+    print("✅ 분석 경로 모듈을 가져와도 pandas/ta를 불러오지 않음")
+
+
+if __name__ == "__main__":
+    print("🧪 NumPy 지표 모듈 테스트")
+    print("=" * 50)
+    test_matches_ta_bit_for_bit()
+    test_hot_path_does_not_import_pandas()
+    print("\n🎉 모든 테스트 통과!")
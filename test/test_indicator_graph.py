@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+주기 단위 지표 그래프 테스트 (지표는 (symbol, interval, 지표, 파라미터)마다 한 번만 계산)
+"""
+import sys
+import os
+# 상위 디렉터리(프로젝트 루트)를 Python path에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+# 테스트 헬퍼(analysis_fixtures) 경로
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import asyncio
+
+import numpy as np
+
+from analysis_fixtures import fetching_analyzer, make_candles, strip_times
+from analysis_pool import AnalysisPool
+from indicators import IndicatorGraph, rsi_series
+
+INTERVALS = ["5m", "15m"]
+PARAMS = dict(rsi_period=14, left_bars=5, right_bars=5, lookback_range=(5, 60), recent_bars=5, include_hidden=True)
+
+
+def test_graph_computes_once_per_key():
+    graph = IndicatorGraph()
+    candles = make_candles(300, 1, "5m")
+    first = graph.series("BTCUSDT", "5m", candles, 'rsi', (14,))
+    again = graph.series("BTCUSDT", "5m", candles, 'rsi', (14,))
+    assert again is first
+    assert np.array_equal(first, rsi_series(candles.close, 14), equal_nan=True)
+    graph.series("BTCUSDT", "5m", candles, 'rsi', (7,))
+    graph.series("BTCUSDT", "5m", candles, 'ema', (20,))
+    graph.series("ETHUSDT", "5m", candles, 'rsi', (14,))
+    assert (graph.computed, graph.reused) == (4, 1)
+    # 주기 중 더 큰 창으로 다시 조회된 캔들이면 새로 계산
+    assert graph.peek("BTCUSDT", "5m", make_candles(400, 1, "5m"), 'rsi', (14,)) is None
+    print("✅ (symbol, interval, 지표, 파라미터)마다 한 번만 계산")
+
+
+def test_detectors_share_one_rsi_per_cycle():
+    data = {("BTCUSDT", interval): make_candles(400, 7, interval) for interval in INTERVALS}
+    analyzer, fetches = fetching_analyzer(data)
+
+    async def run():
+        analyzer.begin_cycle({interval: 300 for interval in INTERVALS})
+        graph = analyzer._indicator_graph
+        for tf in INTERVALS:
+            await analyzer.detect_immediate_rsi_divergence("BTCUSDT", tf, 14, 10)
+            await analyzer.detect_rsi_divergence("BTCUSDT", tf, 14, 15)
+            await analyzer.detect_pivot_divergence("BTCUSDT", tf, **PARAMS)
+        computed = graph.computed
+        # 같은 RSI를 읽는 조건을 더 추가해도 계산은 늘지 않음
+        await analyzer.detect_divergences("BTCUSDT", INTERVALS, immediate_lookback=10,
+                                          lookback_periods=15, **PARAMS)
+        loaded = await analyzer.get_indicator("BTCUSDT", "5m", 'rsi', (14,), limit=50)
+        stats = (computed, graph.computed, graph.reused)
+        analyzer.end_cycle()
+        return stats, loaded
+
+    (computed, total, reused), (candles, rsi) = asyncio.run(run())
+    assert computed == total == len(INTERVALS), (computed, total)
+    assert reused == 2 * len(INTERVALS) + len(INTERVALS) + 1, reused
+    assert len(fetches) == len(INTERVALS)
+    # 주기 캔들 전체(300개)로 계산한 RSI의 마지막 50개
+    full = data[("BTCUSDT", "5m")].tail(300)
+    assert len(candles) == len(rsi) == 50
+    assert np.array_equal(rsi, rsi_series(full.close, 14)[-50:])
+    print(f"✅ 감지기 {3 * len(INTERVALS) + 1}회 호출에 RSI 계산 {total}회 (timeframe당 1회), 재사용 {reused}회")
+
+
+def test_rsi_alerts_read_graph_rsi():
+    symbols = [f"SYM{i}USDT" for i in range(5)]
+    data = {(symbol, "5m"): make_candles(300, i, "5m") for i, symbol in enumerate(symbols)}
+    analyzer, _ = fetching_analyzer(data)
+
+    async def run():
+        analyzer.begin_cycle({"5m": 300})
+        graph = analyzer._indicator_graph
+        # oversold=100이면 모든 값이 과매도 알림에 RSI 값과 함께 나옴
+        alerts = await analyzer.analyze_rsi_conditions_batch(symbols, ["5m"], [7, 14], 100, 0)
+        computed = graph.computed
+        rsi = [(await analyzer.get_indicator(symbol, "5m", 'rsi', (14,), limit=1))[1][-1] for symbol in symbols]
+        await asyncio.gather(*(analyzer.detect_divergences(symbol, ["5m"], immediate_lookback=10,
+                                                           lookback_periods=15, **PARAMS) for symbol in symbols))
+        stats = (computed, graph.computed)
+        analyzer.end_cycle()
+        return alerts, rsi, stats
+
+    alerts, rsi, (computed, total) = asyncio.run(run())
+    # RSI(7), RSI(14)를 종목마다 한 번씩만 계산하고 다이버전스 감지기는 같은 배열을 재사용
+    assert computed == total == 2 * len(symbols), (computed, total)
+    for symbol, value in zip(symbols, rsi):
+        assert f"RSI(14): {round(float(value), 2)}" in alerts[symbol][0], alerts[symbol]
+    print("✅ 주기 중 과매도/과매수 알림과 다이버전스 감지기가 같은 RSI 배열을 읽음")
+
+
+def test_pool_matches_inline_in_cycle():
+    data = {(f"SYM{i}USDT", interval): make_candles(150, i * 3 + len(interval), interval)
+            for i in range(20) for interval in INTERVALS}
+    symbols = [f"SYM{i}USDT" for i in range(20)]
+
+    async def detect_all(analyzer):
+        analyzer.begin_cycle({interval: 150 for interval in INTERVALS})
+        results = await asyncio.gather(*(
+            analyzer.detect_divergences(symbol, INTERVALS, immediate_lookback=10, lookback_periods=15, **PARAMS)
+            for symbol in symbols
+        ))
+        analyzer.end_cycle()
+        return results
+
+    pool = AnalysisPool(max_workers=2)
+    try:
+        inline = asyncio.run(detect_all(fetching_analyzer(data)[0]))
+        pooled = asyncio.run(detect_all(fetching_analyzer(data, pool)[0]))
+    finally:
+        pool.close()
+    assert strip_times(pooled) == strip_times(inline)
+    print("✅ 주기 중 프로세스 풀 결과가 지표 그래프를 쓰는 이벤트 루프 실행 결과와 동일")
+
+
+if __name__ == "__main__":
+    print("🧪 지표 그래프 테스트")
+    print("=" * 50)
+    test_graph_computes_once_per_key()
+    test_detectors_share_one_rsi_per_cycle()
+    test_rsi_alerts_read_graph_rsi()
+    test_pool_matches_inline_in_cycle()
+    print("\n🎉 모든 테스트 통과!")
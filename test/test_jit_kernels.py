@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+numba JIT 커널 테스트 및 벤치마크 (같은 입력에서 NumPy 구현과 결과/속도 비교)
+"""
+import sys
+import os
+# 상위 디렉터리(프로젝트 루트)를 Python path에 추가
+PROJECT_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.append(PROJECT_ROOT)
+
+import subprocess
+import time
+from contextlib import contextmanager
+
+import numpy as np
+
+import indicators
+import jit_kernels
+from indicators import (
+    find_divergences, immediate_divergence, lookback_divergence, pivot_masks, rsi_matrix, rsi_series
+)
+
+
+@contextmanager
+def _backend(name: str):
+    previous = indicators.set_backend(name)
+    try:
+        yield
+    finally:
+        indicators.set_backend(previous)
+
+
+def _both(function, *args):
+    """같은 입력으로 NumPy/numba 백엔드 결과를 함께 반환합니다."""
+    with _backend('numpy'):
+        expected = function(*args)
+    with _backend('numba'):
+        result = function(*args)
+    return expected, result
+
+
+def _closes(n: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    close = np.round(100 + np.cumsum(rng.normal(0, 1, n)), int(rng.integers(0, 3)))
+    if n > 40:
+        close[n // 3:n // 3 + 10] = close[n // 3]   # 횡보 구간
+    return close
+
+
+def test_backends_match():
+    if not jit_kernels.AVAILABLE:
+        print("⏭️ numba가 설치되어 있지 않아 백엔드 비교를 건너뜀")
+        return
+    checked = 0
+    for seed in range(30):
+        for n in (0, 1, 5, 30, 257):
+            close = _closes(n, seed)
+            for period in (2, 7, 14, 21):
+                expected, result = _both(rsi_series, close, period)
+                assert np.array_equal(expected, result, equal_nan=True), ("rsi", seed, n, period)
+            checked += 1
+            if n < 30:
+                continue
+
+            # 짧은 종목은 앞을 NaN으로 채운 행렬
+            matrix = np.vstack([close, np.concatenate([np.full(n // 2, np.nan), close[n // 2:]])])
+            expected, result = _both(rsi_matrix, matrix, [7, 14, 21])
+            assert np.array_equal(expected, result, equal_nan=True), ("rsi_matrix", seed, n)
+            expected, result = _both(indicators._wilder_rsi_kernel, matrix, np.array([7, 14], dtype=np.int64))
+            for a, b in zip(expected, result):
+                assert np.array_equal(a, b, equal_nan=True), ("kernel", seed, n)
+
+            # 정수 RSI로 동률을 만들고 NaN도 섞음
+            rsi = np.round(rsi_series(close, 14))
+            rsi[n // 2] = np.nan
+            for left_bars, right_bars in [(5, 5), (3, 1), (0, 3), (0, 0), (8, 2)]:
+                expected, result = _both(pivot_masks, rsi, left_bars, right_bars)
+                assert all(np.array_equal(a, b) for a, b in zip(expected, result)), ("pivots", seed, left_bars)
+                expected, result = _both(pivot_masks, np.vstack([rsi, rsi[::-1]]), left_bars, right_bars)
+                assert all(np.array_equal(a, b) for a, b in zip(expected, result)), ("pivots 2d", seed, left_bars)
+
+            rsi = rsi_series(close, 14)
+            low, high = close - 0.5, close + 0.5
+            for lookback_range in ((5, 60), (2, 30)):
+                for include_hidden in (True, False):
+                    expected, result = _both(find_divergences, rsi, low, high, 3, 2, lookback_range, include_hidden)
+                    assert expected == result, ("divergence", seed, lookback_range)
+            for end in range(30, n + 1, 7):
+                for lookback_periods in (6, 15, 20):
+                    expected, result = _both(lookback_divergence, close[:end], 14, lookback_periods)
+                    assert expected == result, ("lookback", seed, end, lookback_periods)
+                expected, result = _both(immediate_divergence, close[:end], 14)
+                assert expected == result, ("immediate", seed, end)
+    print(f"✅ {checked}개 입력에서 numba 커널 결과가 NumPy 구현과 비트 단위 일치")
+
+
+def test_falls_back_to_numpy_without_numba():
+    code = (
+        "import sys\n"
+        "sys.modules['numba'] = None\n"   # numba가 없는 환경처럼 import 실패
+        "import indicators, jit_kernels\n"
+        "assert not jit_kernels.AVAILABLE and indicators.backend() == 'numpy'\n"
+        "print(round(float(indicators.rsi_series([1.0, 2.0, 1.5, 3.0, 2.5], 3)[-1]), 4))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=PROJECT_ROOT,
+                            capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == str(round(float(rsi_series([1.0, 2.0, 1.5, 3.0, 2.5], 3)[-1]), 4))
+    print("✅ numba가 없으면 NumPy 구현으로 동작")
+
+
+def test_numba_imported_on_first_kernel_call():
+    """technical_analysis/indicators import만으로는 numba를 불러오지 않아야 합니다 (분석 워커 시작 시간)."""
+    code = (
+        "import sys\n"
+        "import technical_analysis, indicators\n"
+        "assert 'numba' not in sys.modules and 'jit_kernels' not in sys.modules\n"
+        "indicators.rsi_series([1.0, 2.0, 1.5, 3.0, 2.5], 3)\n"
+        "print(indicators.backend(), 'numba' in sys.modules)\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=PROJECT_ROOT,
+                            capture_output=True, text=True, check=True)
+    expected = "numba True" if jit_kernels.AVAILABLE else "numpy False"
+    assert result.stdout.strip() == expected, result.stdout
+    print("✅ numba는 첫 커널 호출 때 import (모듈 import 시간에 포함되지 않음)")
+
+
+def _timed(function, *args, repeat: int = 3) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function(*args)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def test_benchmark():
+    """같은 입력(300종목 × 500캔들)에서 두 백엔드의 실행 시간을 비교합니다."""
+    if not jit_kernels.AVAILABLE:
+        print("⏭️ numba가 설치되어 있지 않아 벤치마크를 건너뜀")
+        return
+    closes = [_closes(500, seed) for seed in range(300)]
+    rsis = [rsi_series(close, 14) for close in closes]
+    matrix = np.vstack(closes)
+
+    cases = {
+        "RSI (종목별 rsi_series)": lambda: [rsi_series(close, 14) for close in closes],
+        "RSI 행렬 (3기간)": lambda: rsi_matrix(matrix, [7, 14, 21]),
+        "피벗 (5, 5)": lambda: pivot_masks(np.vstack(rsis), 5, 5),
+        "피벗 다이버전스": lambda: [find_divergences(rsi, close, close, 5, 5, (5, 60))
+                              for rsi, close in zip(rsis, closes)],
+        "lookback 다이버전스": lambda: [lookback_divergence(close, 14, 15, rsi)
+                                   for rsi, close in zip(rsis, closes)],
+    }
+    with _backend('numba'):
+        for case in cases.values():
+            case()   # 컴파일(또는 캐시 로드)은 측정에서 제외
+
+    print("   백엔드 비교 (300종목 × 500캔들, 3회 중 최소)")
+    for name, case in cases.items():
+        with _backend('numpy'):
+            numpy_elapsed = _timed(case)
+        with _backend('numba'):
+            numba_elapsed = _timed(case)
+        print(f"   {name}: NumPy {numpy_elapsed * 1000:.1f}ms, numba {numba_elapsed * 1000:.1f}ms "
+              f"({numpy_elapsed / numba_elapsed:.1f}배)")
+    print("✅ 백엔드 벤치마크 완료")
+
+
+if __name__ == "__main__":
+    print("🧪 numba JIT 커널 테스트")
+    print("=" * 50)
+    test_backends_match()
+    test_falls_back_to_numpy_without_numba()
+    test_numba_imported_on_first_kernel_call()
+    test_benchmark()
+    print("\n🎉 모든 테스트 통과!")
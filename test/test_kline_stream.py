@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+WebSocket kline 스트리밍 테스트
+로컬 가짜 WebSocket 서버가 기록된 캔들 메시지를 재생합니다.
+"""
+import sys
+import os
+# 상위 디렉터리(프로젝트 루트)를 Python path에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+# 테스트 헬퍼(fake_binance) 경로
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import asyncio
+import time
+
+from candle_store import CandleStore
+from fake_binance import FakeBinanceServer, INTERVAL_MS, kline_stream_message, make_klines
+from kline_stream import KlineStream
+from market_data import AsyncMarketDataClient
+
+
+def _recorded_session(now_ms: int):
+    """진행 중 캔들 갱신 → 마감 → 다음 캔들 시작 순서의 기록된 메시지"""
+    step = INTERVAL_MS["5m"]
+    forming, following = make_klines("BTCUSDT", "5m", now_ms + step, 2)
+    updated = list(forming)
+    updated[4] = "123.4567"
+    return [
+        kline_stream_message("BTCUSDT", "5m", forming, False),
+        kline_stream_message("BTCUSDT", "5m", updated, False),
+        kline_stream_message("BTCUSDT", "5m", updated, True),
+        kline_stream_message("BTCUSDT", "5m", following, False),
+    ]
+
+
+async def _replay():
+    server = FakeBinanceServer(symbols=["BTCUSDT"])
+    base_url = await server.start()
+    client = AsyncMarketDataClient(market_type='futures', base_url=base_url)
+    store = CandleStore(client)
+    closed_events = []
+    connected = asyncio.Event()
+
+    def on_kline(symbol, interval, row, is_closed):
+        store.apply_kline(symbol, interval, row, is_closed)
+        if is_closed:
+            closed_events.append((symbol, interval, int(row[0]), time.perf_counter()))
+
+    def on_connect(keys):
+        store.set_live(keys, True)
+        connected.set()
+
+    try:
+        # REST warm-up
+        warm = await store.get("BTCUSDT", "5m", 50)
+        server.stream_messages = _recorded_session(server.now_ms)
+        server.stream_interval = 0.05
+
+        stream = KlineStream('futures', ["BTCUSDT"], ["5m"], on_kline=on_kline,
+                             on_connect=on_connect,
+                             on_disconnect=lambda keys: store.set_live(keys, False),
+                             base_url=base_url.replace("http", "ws"))
+        stream_task = asyncio.ensure_future(stream.run())
+        await asyncio.wait_for(connected.wait(), timeout=5)
+        await asyncio.sleep(0.5)
+
+        server.requests.clear()
+        first = await store.get("BTCUSDT", "5m", 50)    # 연결 직후 1회 증분 확인
+        second = await store.get("BTCUSDT", "5m", 50)   # 이후에는 REST 없이 스트림 데이터 사용
+        rest_requests = server.count('/klines')
+        await stream.stop()
+        await stream_task
+    finally:
+        await client.close()
+        await server.stop()
+    return server, warm, first, second, closed_events, rest_requests
+
+
+def test_stream_feeds_closed_candles_into_store():
+    server, warm, first, second, closed_events, rest_requests = asyncio.run(_replay())
+
+    assert server.stream_paths == ["/stream?streams=btcusdt@kline_5m"]
+    assert len(closed_events) == 1
+    symbol, interval, open_ms, received_at = closed_events[0]
+    closed_message = server.stream_messages[2]
+    assert (symbol, interval, open_ms) == ("BTCUSDT", "5m", closed_message['data']['k']['t'])
+    # 봉 마감 메시지 수신 후 1초 이내에 콜백 호출
+    assert received_at - closed_message['sent_at'] < 1.0
+
+    # warm-up 때 진행 중이던 캔들은 마감 값으로 교체되고, 다음 캔들이 진행 중 캔들로 추가됨
+    last_warm = int(warm.timestamp[-1])
+    assert int(second.timestamp[-2]) == last_warm
+    assert second.close[-2] == 123.4567
+    assert int(second.timestamp[-1]) == last_warm + 300
+    assert rest_requests <= 1
+    assert first.df.equals(second.df)
+    print(f"✅ 스트림 마감 캔들 반영 (REST 추가 요청 {rest_requests}회)")
+
+
+def test_gap_marks_series_stale():
+    async def run():
+        server = FakeBinanceServer(symbols=["BTCUSDT"])
+        base_url = await server.start()
+        client = AsyncMarketDataClient(market_type='futures', base_url=base_url)
+        store = CandleStore(client)
+        try:
+            warm = await store.get("BTCUSDT", "5m", 50)
+            store.set_live([("BTCUSDT", "5m")], True)
+            await store.get("BTCUSDT", "5m", 50)
+            # 캔들 하나를 건너뛴 메시지
+            skipped = make_klines("BTCUSDT", "5m", server.now_ms + 2 * INTERVAL_MS["5m"], 1)[0]
+            store.apply_kline("BTCUSDT", "5m", skipped, True)
+            server.requests.clear()
+            await store.get("BTCUSDT", "5m", 50)
+            return server.count('/klines'), warm
+        finally:
+            await client.close()
+            await server.stop()
+
+    rest_requests, _ = asyncio.run(run())
+    assert rest_requests == 1
+    print("✅ 스트림 캔들 누락 시 REST 증분 조회로 복구")
+
+
+def test_parse_message_ignores_other_events():
+    assert KlineStream.parse_message({'stream': 'x', 'data': {'e': 'trade'}}) is None
+    row = make_klines("ETHUSDT", "15m", 1_700_000_000_000, 1)[0]
+    symbol, interval, parsed, is_closed = KlineStream.parse_message(
+        kline_stream_message("ETHUSDT", "15m", row, True))
+    assert (symbol, interval, is_closed) == ("ETHUSDT", "15m", True)
+    assert parsed[:7] == row[:7]
+
+
+if __name__ == "__main__":
+    test_stream_feeds_closed_candles_into_store()
+    test_gap_marks_series_stale()
+    test_parse_message_ignores_other_events()
+    print("\n✨ kline 스트리밍 테스트 완료!")
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+비동기 시세 클라이언트 테스트 (로컬 가짜 Binance 서버 사용)
+"""
+import sys
+import os
+# 상위 디렉터리(프로젝트 루트)를 Python path에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+# 테스트 헬퍼(fake_binance) 경로
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import asyncio
+import time
+
+from fake_binance import FakeBinanceServer
+from market_data import AsyncMarketDataClient, MarketDataError
+from technical_analysis import TechnicalAnalyzer
+
+
+async def _concurrent_fetch():
+    server = FakeBinanceServer(symbols=[f"SYM{i}USDT" for i in range(20)], delay=0.2)
+    base_url = await server.start()
+    client = AsyncMarketDataClient(market_type='futures', base_url=base_url,
+                                   max_concurrent_requests=20)
+    analyzer = TechnicalAnalyzer(market_data=client, market_type='futures')
+    try:
+        started = time.perf_counter()
+        frames = await asyncio.gather(*[
+            analyzer.get_candlestick_data(symbol, "5m", limit=50)
+            for symbol in server.symbols
+        ])
+        elapsed = time.perf_counter() - started
+    finally:
+        await client.close()
+        await server.stop()
+    return frames, elapsed
+
+
+def test_concurrent_klines_follow_slowest_request():
+    """20개 요청(각 0.2초)이 순차 합(4초)이 아니라 가장 느린 요청 수준으로 끝나야 합니다."""
+    frames, elapsed = asyncio.run(_concurrent_fetch())
+    assert all(df is not None and len(df) == 50 for df in frames)
+    assert elapsed < 1.5, f"병렬 조회가 너무 느립니다: {elapsed:.2f}초"
+    print(f"✅ 20개 종목 병렬 조회: {elapsed:.2f}초")
+
+
+async def _ticker_and_error():
+    server = FakeBinanceServer()
+    base_url = await server.start()
+    client = AsyncMarketDataClient(market_type='spot', base_url=base_url)
+    try:
+        tickers = await client.get_ticker()
+        single = await client.get_ticker(symbol="ETHUSDT")
+        try:
+            await client.get_ticker(symbol="NOPEUSDT")
+            error = None
+        except MarketDataError as e:
+            error = e
+    finally:
+        await client.close()
+        await server.stop()
+    return tickers, single, error
+
+
+def test_ticker_and_api_error():
+    tickers, single, error = asyncio.run(_ticker_and_error())
+    assert [t['symbol'] for t in tickers] == ["BTCUSDT", "ETHUSDT", "SOLUSDT"]
+    assert single['symbol'] == "ETHUSDT"
+    assert error is not None and error.status == 400 and error.code == -1121
+    print("✅ 티커 조회 및 API 오류 처리")
+
+
+if __name__ == "__main__":
+    test_concurrent_klines_follow_slowest_request()
+    test_ticker_and_api_error()
+    print("\n✨ 시세 클라이언트 테스트 완료!")
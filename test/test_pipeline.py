@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+수집 → 분석 → 알림 파이프라인 테스트 (단계 겹침, 대기열 제한, 단계별 통계)
+"""
+import sys
+import os
+# 상위 디렉터리(프로젝트 루트)를 Python path에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+# 테스트 헬퍼(monitor_fixtures) 경로
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import asyncio
+import time
+
+from monitor_fixtures import stub_monitor
+from pipeline import DONE, StageStats, run_stage
+from scheduler import CycleBudget
+
+
+def test_run_stage_batches_and_survives_errors():
+    async def run():
+        source: asyncio.Queue = asyncio.Queue()
+        for i in range(10):
+            source.put_nowait(i)
+        source.put_nowait(DONE)
+        middle: asyncio.Queue = asyncio.Queue(2)
+        sink: asyncio.Queue = asyncio.Queue()
+        first = StageStats("first", source)
+        second = StageStats("second", middle)
+        batches = []
+
+        async def double(batch):
+            if 3 in batch:
+                raise ValueError("bad item")
+            return [item * 2 for item in batch]
+
+        async def collect(batch):
+            batches.append(batch)
+            await asyncio.sleep(0.01)
+            return batch
+
+        await asyncio.gather(run_stage(first, double, middle, batch_size=4),
+                             run_stage(second, collect, sink, batch_size=3))
+        results = []
+        while True:
+            item = sink.get_nowait()
+            if item is DONE:
+                break
+            results.append(item)
+        return first, second, batches, results
+
+    first, second, batches, results = asyncio.run(run())
+    # 첫 배치 [0, 1, 2, 3]은 오류로 버려지고 나머지는 계속 처리
+    assert results == [8, 10, 12, 14, 16, 18]
+    assert first.processed == 10 and first.batches == 3
+    assert second.processed == 6 and max(map(len, batches)) <= 3
+    assert second.max_depth <= 2
+    print(f"✅ 배치 처리/오류 격리/종료 전달 ({first.summary()}; {second.summary()})")
+
+
+def test_stages_overlap():
+    symbols = [f"SYM{i}USDT" for i in range(40)]
+    events = []
+
+    async def fetch_candles(symbol, interval, limit):
+        await asyncio.sleep(0.02)
+        events.append(('fetch', symbol, time.perf_counter()))
+        return None
+    monitor = stub_monitor(symbols, change=0, fetch_candles=fetch_candles)
+    monitor.max_concurrent_symbols = 4
+    monitor.pipeline_queue_size = 4
+    monitor.analysis_batch_size = 8
+
+    async def check(ticker, symbol, rsi_alerts=None, indicator_alerts=None):
+        await asyncio.sleep(0.01)
+        events.append(('analyze', symbol, time.perf_counter()))
+        return ["조건 충족"] if symbol in ("SYM0USDT", "SYM1USDT") else []
+    monitor.check_conditions = check
+
+    async def send_telegram_message(message):
+        events.append(('send', message, time.perf_counter()))
+        return True
+    monitor.send_telegram_message = send_telegram_message
+
+    async def run():
+        try:
+            return await monitor._evaluate_symbols(symbols, deliver=True)
+        finally:
+            await monitor.close()
+
+    messages = asyncio.run(run())
+    last_fetch = max(t for kind, _, t in events if kind == 'fetch')
+    first_analysis = min(t for kind, _, t in events if kind == 'analyze')
+    first_send = min(t for kind, _, t in events if kind == 'send')
+    assert len(messages) == 2
+    # 앞 종목의 분석과 알림 발송이 뒤 종목의 수집이 끝나기 전에 시작됨
+    assert first_analysis < last_fetch
+    assert first_send < last_fetch
+
+    fetch_stats, analysis_stats, alert_stats = monitor.pipeline_stats
+    assert fetch_stats.processed == 40 and analysis_stats.processed == 40 and alert_stats.processed == 2
+    assert analysis_stats.max_depth <= 4 and alert_stats.max_depth <= 4
+    assert analysis_stats.batches < 40
+    for stats in monitor.pipeline_stats:
+        print(f"   {stats.summary()}")
+    print("✅ 수집/분석/알림 단계가 겹쳐서 진행되고 단계별 통계를 기록")
+
+
+def test_slow_fetch_is_bounded():
+    symbols = ["FASTUSDT", "SLOWUSDT", "OTHERUSDT"]
+
+    async def fetch_candles(symbol, interval, limit):
+        # 느린 거래소 응답 또는 요청 한도 대기
+        await asyncio.sleep(5.0 if symbol == "SLOWUSDT" else 0)
+        return None
+    monitor = stub_monitor(symbols, change=0, fetch_candles=fetch_candles)
+
+    async def check(ticker, symbol, rsi_alerts=None, indicator_alerts=None):
+        return [f"{symbol} 조건 충족"]
+    monitor.check_conditions = check
+
+    async def run(budget):
+        started = time.perf_counter()
+        messages = await monitor._evaluate_symbols(symbols, budget=budget)
+        return messages, time.perf_counter() - started, budget
+
+    async def both():
+        try:
+            # 종목당 제한 시간으로 중단
+            monitor.symbol_timeout_seconds = 0.2
+            limited = await run(CycleBudget(deadline=time.monotonic() + 10))
+            # 제한 시간이 없어도 주기 마감 시한에서 중단
+            monitor.symbol_timeout_seconds = None
+            deadline = await run(CycleBudget(deadline=time.monotonic() + 0.2))
+            return limited, deadline
+        finally:
+            await monitor.close()
+
+    results = asyncio.run(both())
+    # 종목당 제한 시간으로 제외된 종목과 주기 마감 시한으로 건너뛴 종목은 따로 기록
+    limited, deadline = (budget for _, _, budget in results)
+    assert (limited.checked, limited.timed_out, limited.skipped) == (2, 1, 0)
+    assert (deadline.checked, deadline.timed_out, deadline.skipped) == (2, 0, 1)
+    for messages, elapsed, budget in results:
+        assert elapsed < 1.0, elapsed
+        assert len(messages) == 2 and not any("SLOWUSDT" in message for message in messages)
+    assert monitor.pipeline_stats[1].processed == 2
+    print("✅ 느린 캔들 조회도 종목당 제한 시간/주기 마감 시한에서 중단하고 건너뜀")
+
+
+if __name__ == "__main__":
+    print("🧪 파이프라인 테스트")
+    print("=" * 50)
+    test_run_stage_batches_and_survives_errors()
+    test_stages_overlap()
+    test_slow_fetch_is_bounded()
+    print("\n🎉 모든 테스트 통과!")
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+RSI 피벗 쌍 기반 다이버전스(Pine Script 방식) 테스트
+"""
+import sys
+import os
+# 상위 디렉터리(프로젝트 루트)를 Python path에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import asyncio
+import time
+
+import numpy as np
+
+from candles import CandleArrays
+from indicators import find_divergences, rsi_series
+from technical_analysis import TechnicalAnalyzer
+
+STEP = 300
+
+
+def _reference(rsi, low, high, left_bars, right_bars, lookback_range, include_hidden=True):
+    """캔들마다 피벗을 확인하며 직전 피벗과 비교하는 단순 구현"""
+    found = []
+    last_low = last_high = None
+    for i in range(left_bars, len(rsi) - right_bars):
+        window = np.concatenate([rsi[i - left_bars:i], rsi[i + 1:i + right_bars + 1]])
+        is_low = all(rsi[i] < v for v in window)
+        is_high = all(rsi[i] > v for v in window)
+        if is_low:
+            if last_low is not None and lookback_range[0] <= i - last_low <= lookback_range[1]:
+                if rsi[i] > rsi[last_low] and low[i] < low[last_low]:
+                    found.append(('regular_bullish', i, last_low))
+                if include_hidden and rsi[i] < rsi[last_low] and low[i] > low[last_low]:
+                    found.append(('hidden_bullish', i, last_low))
+            last_low = i
+        if is_high:
+            if last_high is not None and lookback_range[0] <= i - last_high <= lookback_range[1]:
+                if rsi[i] < rsi[last_high] and high[i] > high[last_high]:
+                    found.append(('regular_bearish', i, last_high))
+                if include_hidden and rsi[i] > rsi[last_high] and high[i] < high[last_high]:
+                    found.append(('hidden_bearish', i, last_high))
+            last_high = i
+    return sorted(found, key=lambda d: d[1])
+
+
+def _candles(n: int, seed: int, forming: bool = True) -> CandleArrays:
+    rng = np.random.default_rng(seed)
+    close = np.round(100 + np.cumsum(rng.normal(0, 1, n)), 2)
+    values = np.vstack([close, close + rng.uniform(0, 1, n), close - rng.uniform(0, 1, n), close, np.ones(n)])
+    # 마지막 캔들이 진행 중(forming=True)이거나 마감된 상태
+    last_open = int(time.time()) // STEP * STEP - (0 if forming else STEP)
+    return CandleArrays(last_open - (n - 1) * STEP + np.arange(n, dtype=np.int64) * STEP, values)
+
+
+def test_matches_bar_by_bar_reference():
+    total = 0
+    for seed in range(25):
+        candles = _candles(400, seed)
+        rsi = rsi_series(candles.close, 14)
+        for left_bars, right_bars, lookback_range in [(5, 5, (5, 60)), (3, 1, (2, 30)), (8, 2, (10, 40))]:
+            for include_hidden in (True, False):
+                result = find_divergences(rsi, candles.low, candles.high, left_bars, right_bars,
+                                          lookback_range, include_hidden)
+                got = [(d['kind'], d['index'], d['prev_index']) for d in result]
+                assert got == _reference(rsi, candles.low, candles.high, left_bars, right_bars,
+                                         lookback_range, include_hidden)
+                total += len(got)
+    assert total > 0
+    print(f"✅ 벡터화 피벗 다이버전스가 캔들별 단순 구현과 동일 ({total}개 신호)")
+
+
+def test_regular_bullish_example():
+    # RSI 저점은 높아지고(30 → 40) 가격 저점은 낮아짐(100 → 95)
+    rsi = np.full(40, 50.0)
+    rsi[10], rsi[30] = 30.0, 40.0
+    low = np.full(40, 110.0)
+    low[10], low[30] = 100.0, 95.0
+    high = low + 5
+
+    result = find_divergences(rsi, low, high, 5, 5, (5, 60))
+    assert [(d['kind'], d['prev_index'], d['index']) for d in result] == [('regular_bullish', 10, 30)]
+    # 피벗 간격(20)이 범위를 벗어나면 무시
+    assert find_divergences(rsi, low, high, 5, 5, (5, 15)) == []
+    print("✅ Regular Bullish 예시 및 lookback_range 적용")
+
+
+def test_detector_reports_only_recent_confirmed_pivots():
+    analyzer = TechnicalAnalyzer(market_data=None, market_type='futures')
+    window = analyzer.pivot_divergence_window(14, 5, 5, (5, 60), 5)
+
+    for seed in range(40):
+        candles = _candles(window, seed)
+
+        async def cached(symbol, interval, limit, candles=candles):
+            return candles
+        analyzer._get_cached_candles = cached
+
+        alerts = asyncio.run(analyzer.detect_pivot_divergence("BTCUSDT", "5m", recent_bars=5))
+
+        # 진행 중인 마지막 캔들은 제외하고 계산
+        closed = candles[:-1]
+        expected = [d for d in find_divergences(rsi_series(closed.close, 14), closed.low, closed.high,
+                                                5, 5, (5, 60))
+                    if d['index'] + 5 >= len(closed) - 5]
+        assert len(alerts) == len(expected), seed
+        for alert, divergence in zip(alerts, expected):
+            assert "(5m, 피벗)" in alert
+            assert f"{divergence['prev_rsi']:.1f} → {divergence['rsi']:.1f}" in alert
+        if expected:
+            print(f"✅ seed {seed}: 최근 확정 피벗 신호 {len(alerts)}개 - {alerts[0].splitlines()[0]}")
+            return
+    raise AssertionError("최근 확정된 피벗 다이버전스 예시를 찾지 못했습니다")
+
+
+if __name__ == "__main__":
+    print("🧪 피벗 다이버전스 테스트")
+    print("=" * 50)
+    test_matches_bar_by_bar_reference()
+    test_regular_bullish_example()
+    test_detector_reports_only_recent_confirmed_pivots()
+    print("\n🎉 모든 테스트 통과!")
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+선형 시간 피벗 탐지 테스트 (기존 iloc 반복 구현과 비교)
+"""
+import sys
+import os
+# 상위 디렉터리(프로젝트 루트)를 Python path에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from indicators import pivot_masks
+from technical_analysis import TechnicalAnalyzer
+
+
+def _reference_pivots(data: pd.Series, left_bars: int, right_bars: int):
+    """이전 find_pivots 구현 (캔들마다 iloc 슬라이스 비교)"""
+    pivot_lows, pivot_highs = [], []
+    if len(data) < left_bars + right_bars + 1:
+        return [], []
+    for i in range(left_bars, len(data) - right_bars):
+        pivot_val = data.iloc[i]
+        left_window = data.iloc[i - left_bars:i]
+        right_window = data.iloc[i + 1:i + right_bars + 1]
+        if (left_window > pivot_val).all() and (right_window > pivot_val).all():
+            pivot_lows.append(i)
+        if (left_window < pivot_val).all() and (right_window < pivot_val).all():
+            pivot_highs.append(i)
+    return pivot_lows, pivot_highs
+
+
+def _series(n: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    # 정수로 반올림해 같은 값(동률)이 자주 나오게 하고, 앞쪽 NaN(RSI 워밍업)과 중간 NaN도 섞음
+    values = np.round(50 + np.cumsum(rng.normal(0, 2, n)))
+    values[:seed % 15] = np.nan
+    if n > 40:
+        values[n // 2] = np.nan
+    return values
+
+
+def test_matches_reference_with_ties_and_nan():
+    analyzer = TechnicalAnalyzer(market_data=None)
+    checked = 0
+    for seed in range(30):
+        for n in (0, 1, 5, 11, 60, 257):
+            values = _series(n, seed)
+            for left_bars, right_bars in [(5, 5), (5, 1), (1, 5), (3, 0), (0, 3), (0, 0), (7, 7), (10, 3)]:
+                expected = _reference_pivots(pd.Series(values, index=np.arange(n) + 1000), left_bars, right_bars)
+                assert analyzer.find_pivots(pd.Series(values), left_bars, right_bars) == expected, \
+                    (seed, n, left_bars, right_bars)
+                checked += 1
+    print(f"✅ {checked}개 조합에서 기존 구현과 피벗 결과 동일 (동률/NaN 포함)")
+
+
+def test_batch_rows_match_single_series():
+    analyzer = TechnicalAnalyzer(market_data=None)
+    batch = np.vstack([_series(120, seed) for seed in range(25)])
+    lows, highs = analyzer.find_pivots(batch, 5, 5)
+    low_mask, high_mask = pivot_masks(batch, 5, 5)
+    assert low_mask.shape == batch.shape
+    for row, values in enumerate(batch):
+        assert (lows[row], highs[row]) == analyzer.find_pivots(values, 5, 5)
+        assert np.flatnonzero(low_mask[row]).tolist() == lows[row]
+    print("✅ 2차원 배치 결과가 시리즈별 결과와 동일")
+
+
+def test_linear_time_is_faster():
+    values = _series(1000, 3)
+    analyzer = TechnicalAnalyzer(market_data=None)
+
+    started = time.perf_counter()
+    reference = _reference_pivots(pd.Series(values), 5, 5)
+    reference_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    result = analyzer.find_pivots(pd.Series(values), 5, 5)
+    elapsed = time.perf_counter() - started
+
+    assert result == reference
+    assert elapsed < reference_elapsed
+    print(f"✅ 1000캔들 피벗: 기존 {reference_elapsed * 1000:.1f}ms → {elapsed * 1000:.2f}ms")
+
+
+if __name__ == "__main__":
+    print("🧪 피벗 탐지 테스트")
+    print("=" * 50)
+    test_matches_reference_with_ties_and_nan()
+    test_batch_rows_match_single_series()
+    test_linear_time_is_faster()
+    print("\n🎉 모든 테스트 통과!")
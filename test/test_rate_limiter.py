@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+요청 가중치 리미터 테스트 (로컬 가짜 Binance 서버 사용)
+"""
+import sys
+import os
+# 상위 디렉터리(프로젝트 루트)를 Python path에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+# 테스트 헬퍼(fake_binance) 경로
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import asyncio
+import time
+
+from fake_binance import FakeBinanceServer
+from market_data import AsyncMarketDataClient, MarketDataError
+from rate_limiter import RequestWeightLimiter
+
+
+class RecordingLimiter(RequestWeightLimiter):
+    """acquire()에 전달된 가중치를 기록하는 리미터"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.charged = []
+
+    async def acquire(self, weight: int):
+        self.charged.append(weight)
+        await super().acquire(weight)
+
+
+def test_limiter_paces_when_budget_exhausted():
+    """예산을 다 쓰면 요청이 실패하지 않고 토큰이 찰 때까지 기다려야 합니다."""
+    async def run():
+        # 분당 120 = 초당 2 토큰
+        limiter = RequestWeightLimiter(120, safety_margin=0)
+        started = time.perf_counter()
+        await limiter.acquire(120)
+        burst = time.perf_counter() - started
+        await limiter.acquire(1)
+        return burst, time.perf_counter() - started
+
+    burst, elapsed = asyncio.run(run())
+    assert burst < 0.1, f"예산 안의 요청이 지연되었습니다: {burst:.2f}초"
+    assert 0.4 <= elapsed < 1.0, f"예산 초과 요청의 대기 시간이 예상과 다릅니다: {elapsed:.2f}초"
+    print(f"✅ 예산 소진 후 대기: {elapsed:.2f}초")
+
+
+def test_used_weight_header_reduces_headroom():
+    limiter = RequestWeightLimiter(2400, safety_margin=0.1)
+    assert limiter.capacity == 2160
+    assert limiter.headroom == 2160
+
+    limiter.update_from_headers({'X-MBX-USED-WEIGHT-1M': '2000'})
+    assert limiter.used_weight == 2000
+    assert limiter.headroom == 160
+    print("✅ X-MBX-USED-WEIGHT-1M 헤더로 남은 예산 보정")
+
+
+def test_client_charges_endpoint_weights():
+    async def run():
+        server = FakeBinanceServer()
+        base_url = await server.start()
+        futures = AsyncMarketDataClient(market_type='futures', base_url=base_url,
+                                        limiter=RecordingLimiter(2400))
+        spot = AsyncMarketDataClient(market_type='spot', base_url=base_url,
+                                     limiter=RecordingLimiter(6000))
+        try:
+            for limit in (50, 200, 1000):
+                await futures.get_klines("BTCUSDT", "5m", limit=limit)
+            await futures.get_ticker()
+            await futures.get_ticker(symbol="BTCUSDT")
+            await spot.get_klines("BTCUSDT", "5m", limit=1000)
+            await spot.get_ticker()
+            await spot.get_ticker(symbol="BTCUSDT")
+        finally:
+            await futures.close()
+            await spot.close()
+            await server.stop()
+        return futures.limiter.charged, spot.limiter.charged
+
+    futures_weights, spot_weights = asyncio.run(run())
+    assert futures_weights == [1, 2, 5, 40, 1], futures_weights
+    assert spot_weights == [2, 80, 2], spot_weights
+    print(f"✅ 엔드포인트 가중치: futures {futures_weights}, spot {spot_weights}")
+
+
+def test_server_used_weight_is_tracked():
+    async def run():
+        server = FakeBinanceServer()
+        server.used_weight = 2000
+        base_url = await server.start()
+        client = AsyncMarketDataClient(market_type='futures', base_url=base_url)
+        try:
+            await client.get_klines("BTCUSDT", "5m", limit=50)
+        finally:
+            await client.close()
+            await server.stop()
+        return client.limiter
+
+    limiter = asyncio.run(run())
+    assert limiter.server_used_weight == 2000
+    assert limiter.headroom == limiter.capacity - 2000
+    print(f"✅ 서버 사용량 반영: 여유 {limiter.headroom}")
+
+
+def test_rate_limited_request_is_retried():
+    """429 응답은 Retry-After만큼 기다린 뒤 재시도되어야 합니다."""
+    async def run():
+        server = FakeBinanceServer()
+        server.rate_limit_responses = [(429, 1)]
+        base_url = await server.start()
+        client = AsyncMarketDataClient(market_type='futures', base_url=base_url)
+        try:
+            started = time.perf_counter()
+            rows = await client.get_klines("BTCUSDT", "5m", limit=50)
+            elapsed = time.perf_counter() - started
+        finally:
+            await client.close()
+            await server.stop()
+        return server, rows, elapsed
+
+    server, rows, elapsed = asyncio.run(run())
+    assert len(rows) == 50
+    assert len(server.requests) == 2
+    assert server.requests[0].get('rejected')
+    assert elapsed >= 0.9, f"Retry-After를 지키지 않았습니다: {elapsed:.2f}초"
+    print(f"✅ 429 응답 후 재시도: {elapsed:.2f}초")
+
+
+def test_long_ban_is_not_waited_out():
+    """Retry-After가 너무 긴 418(IP 차단)은 기다리지 않고 오류로 반환해야 합니다."""
+    async def run():
+        server = FakeBinanceServer()
+        server.rate_limit_responses = [(418, 600)]
+        base_url = await server.start()
+        client = AsyncMarketDataClient(market_type='futures', base_url=base_url)
+        try:
+            await client.get_klines("BTCUSDT", "5m", limit=50)
+            return None
+        except MarketDataError as e:
+            return e
+        finally:
+            await client.close()
+            await server.stop()
+
+    error = asyncio.run(run())
+    assert error is not None and error.status == 418
+    assert error.retry_after == 600
+    print("✅ 장시간 IP 차단은 오류로 반환")
+
+
+if __name__ == "__main__":
+    print("🧪 요청 가중치 리미터 테스트")
+    print("=" * 50)
+    test_limiter_paces_when_budget_exhausted()
+    test_used_weight_header_reduces_headroom()
+    test_client_charges_endpoint_weights()
+    test_server_used_weight_is_tracked()
+    test_rate_limited_request_is_retried()
+    test_long_ban_is_not_waited_out()
+    print("\n🎉 모든 테스트 통과!")
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+멀티 타임프레임 리샘플링 테스트 (로컬 가짜 Binance 서버 사용)
+"""
+import sys
+import os
+# 상위 디렉터리(프로젝트 루트)를 Python path에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+# 테스트 헬퍼(fake_binance) 경로
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import asyncio
+
+from candles import decode_klines
+from fake_binance import FakeBinanceServer, make_klines
+from market_data import AsyncMarketDataClient
+from resampler import resample_candles, resample_ratio, source_window
+from technical_analysis import TechnicalAnalyzer
+
+FIVE_MIN = 300
+QUARTER = 900
+
+
+def _five_minute_frame(first_open_s: int, count: int):
+    end_ms = (first_open_s + (count - 1) * FIVE_MIN) * 1000
+    return decode_klines(make_klines("BTCUSDT", "5m", end_ms, count))
+
+
+def test_ratio_and_window():
+    assert resample_ratio("5m", "15m") == 3
+    assert resample_ratio("5m", "4h") == 48
+    assert resample_ratio("15m", "5m") is None
+    assert resample_ratio("5m", "5m") is None
+    assert source_window("5m", "1h", 71) == 72 * 12
+    print("✅ 리샘플링 비율/필요 캔들 수")
+
+
+def test_resample_alignment_and_partial_bars():
+    """15m 경계 중간에서 시작/끝나는 5m 캔들로 15m 캔들을 만듭니다."""
+    bucket_start = 1_700_000_100 // QUARTER * QUARTER
+    # 첫 15m 버킷의 두 번째 5m 캔들부터 시작해 마지막 버킷은 5m 하나만 있는 상태
+    candles = _five_minute_frame(bucket_start + FIVE_MIN, 2 + 3 * 4 + 1)
+    src = candles.df
+    out = resample_candles(candles, "5m", "15m").df
+
+    # 앞부분이 잘린 첫 버킷은 버리고, 완성된 4개 + 진행 중 1개
+    assert len(out) == 5
+    assert (out['timestamp'] % QUARTER == 0).all()
+    assert int(out['timestamp'].iloc[0]) == bucket_start + QUARTER
+
+    for i in range(4):
+        rows = src[(src['timestamp'] >= out['timestamp'].iloc[i]) &
+                   (src['timestamp'] < out['timestamp'].iloc[i] + QUARTER)]
+        assert len(rows) == 3
+        assert out['open'].iloc[i] == rows['open'].iloc[0]
+        assert out['high'].iloc[i] == rows['high'].max()
+        assert out['low'].iloc[i] == rows['low'].min()
+        assert out['close'].iloc[i] == rows['close'].iloc[-1]
+        assert abs(out['volume'].iloc[i] - rows['volume'].sum()) < 1e-9
+
+    # 진행 중인 마지막 캔들은 현재까지의 5m 캔들로 구성
+    last = out.iloc[-1]
+    assert last['open'] == src['open'].iloc[-1]
+    assert last['close'] == src['close'].iloc[-1]
+    assert str(out['datetime'].dt.tz) == "UTC"
+    print(f"✅ 15m 정렬 및 부분 캔들 처리: {len(src)}개 → {len(out)}개")
+
+
+async def _fetch_with_resampling():
+    server = FakeBinanceServer(symbols=["BTCUSDT", "ETHUSDT"])
+    base_url = await server.start()
+    client = AsyncMarketDataClient(market_type='futures', base_url=base_url)
+    analyzer = TechnicalAnalyzer(market_data=client, market_type='futures', base_interval="5m")
+    try:
+        windows = {"5m": 71, "15m": 71, "1h": 71, "4h": 71}
+        fetch_windows = analyzer.fetch_window_sizes(windows)
+        analyzer.begin_cycle(windows)
+        try:
+            frames = {}
+            for symbol in server.symbols:
+                for tf in windows:
+                    frames[(symbol, tf)] = await analyzer.get_candlestick_data(symbol, tf, limit=71)
+        finally:
+            analyzer.end_cycle()
+    finally:
+        await client.close()
+        await server.stop()
+    return server, fetch_windows, frames
+
+
+def test_analyzer_downloads_only_base_interval():
+    server, fetch_windows, frames = asyncio.run(_fetch_with_resampling())
+    # 15m, 1h는 5m에서 합성하고, 4h는 5m 1000개로 부족하므로 직접 조회
+    assert fetch_windows == {"5m": 72 * 12, "4h": 71}, fetch_windows
+    intervals = sorted(r['interval'] for r in server.requests)
+    assert intervals == ["4h", "4h", "5m", "5m"], intervals
+    for (symbol, tf), df in frames.items():
+        assert df is not None and len(df) == 71, (symbol, tf)
+    print(f"✅ 캔들 요청 {len(server.requests)}회로 4개 timeframe 분석 데이터 준비")
+
+
+if __name__ == "__main__":
+    print("🧪 멀티 타임프레임 리샘플링 테스트")
+    print("=" * 50)
+    test_ratio_and_window()
+    test_resample_alignment_and_partial_bars()
+    test_analyzer_downloads_only_base_interval()
+    print("\n🎉 모든 테스트 통과!")
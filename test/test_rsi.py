@@ -39,7 +39,7 @@ async def test_rsi_analysis():
                 print(f"\n  {timeframe} 차트:")
                 
                 # 캔들스틱 데이터 가져오기
-                df = analyzer.get_candlestick_data(symbol, timeframe, limit=100)
+                df = await analyzer.get_candlestick_data(symbol, timeframe, limit=100)
                 
                 if df is None:
                     print(f"    ❌ {timeframe} 데이터를 가져올 수 없습니다.")
@@ -71,7 +71,7 @@ async def test_rsi_analysis():
             
             # RSI 조건 확인 테스트
             print(f"\n  🚨 알림 조건 확인:")
-            rsi_alerts = analyzer.analyze_rsi_conditions(
+            rsi_alerts = await analyzer.analyze_rsi_conditions(
                 symbol, timeframes, periods, oversold=30, overbought=70
             )
             
@@ -106,7 +106,7 @@ async def test_full_monitoring():
             print(monitor.format_ticker_info(ticker))
             
             # 모든 조건 확인 (RSI 포함)
-            alerts = monitor.check_conditions(ticker, test_symbol)
+            alerts = await monitor.check_conditions(ticker, test_symbol)
             
             if alerts:
                 print(f"\n🚨 알림 조건 충족 ({len(alerts)}개):")
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+lookback RSI 다이버전스(detect_rsi_divergence) 벡터화 테스트 (기존 반복 구현과 출력 비교)
+"""
+import sys
+import os
+# 상위 디렉터리(프로젝트 루트)를 Python path에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+# 테스트 헬퍼(analysis_fixtures) 경로
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import asyncio
+
+from ta.momentum import RSIIndicator
+
+from analysis_fixtures import make_candles, strip_times, stub_analyzer
+
+
+async def _reference(analyzer, symbol, timeframe, rsi_period, lookback_periods):
+    """이전 detect_rsi_divergence 구현 (캔들마다 iloc 비교)에 마감된 캔들만 넘긴 결과"""
+    divergence_signals = []
+    df = await analyzer.get_candlestick_data(
+        symbol, timeframe, limit=analyzer.divergence_window(rsi_period, lookback_periods)
+    )
+    if df is None or len(df) < rsi_period + lookback_periods:
+        return []
+    # make_candles의 마지막 캔들은 진행 중
+    df = df.iloc[:-1].copy()
+    df['rsi'] = RSIIndicator(df['close'], window=rsi_period).rsi()
+    df = df.dropna().reset_index(drop=True)
+    if len(df) < lookback_periods:
+        return []
+    current_close = df['close'].iloc[-1]
+    current_rsi = df['rsi'].iloc[-1]
+    current_time_str = "TIME"
+    for i in range(5, min(lookback_periods, len(df) - 1)):
+        past_close = df['close'].iloc[-(i+1)]
+        past_rsi = df['rsi'].iloc[-(i+1)]
+        if current_close < past_close and current_rsi > past_rsi:
+            if current_rsi - past_rsi >= 3:
+                price_change = ((current_close - past_close) / past_close) * 100
+                rsi_change = current_rsi - past_rsi
+                divergence_signals.append(
+                    f"🟢 Regular Bullish Divergence ({timeframe}) - {current_time_str}\n"
+                    f"가격: {price_change:.2f}% 하락, RSI: +{rsi_change:.1f} 상승 (최근 {i}캔들 비교)"
+                )
+                break
+        elif current_close > past_close and current_rsi < past_rsi:
+            if past_rsi - current_rsi >= 3:
+                price_change = ((current_close - past_close) / past_close) * 100
+                rsi_change = past_rsi - current_rsi
+                divergence_signals.append(
+                    f"🔴 Regular Bearish Divergence ({timeframe}) - {current_time_str}\n"
+                    f"가격: +{price_change:.2f}% 상승, RSI: -{rsi_change:.1f} 하락 (최근 {i}캔들 비교)"
+                )
+                break
+    if not divergence_signals:
+        for i in range(5, min(lookback_periods, len(df) - 1)):
+            past_close = df['close'].iloc[-(i+1)]
+            past_rsi = df['rsi'].iloc[-(i+1)]
+            if current_close > past_close and current_rsi < past_rsi:
+                if past_rsi - current_rsi >= 2:
+                    price_change = ((current_close - past_close) / past_close) * 100
+                    rsi_change = past_rsi - current_rsi
+                    divergence_signals.append(
+                        f"🔴 Hidden Bullish Divergence ({timeframe}) - {current_time_str}\n"
+                        f"가격: +{price_change:.2f}% 상승, RSI: -{rsi_change:.1f} 하락"
+                    )
+                    break
+            elif current_close < past_close and current_rsi > past_rsi:
+                if current_rsi - past_rsi >= 2:
+                    price_change = ((current_close - past_close) / past_close) * 100
+                    rsi_change = current_rsi - past_rsi
+                    divergence_signals.append(
+                        f"🟠 Hidden Bearish Divergence ({timeframe}) - {current_time_str}\n"
+                        f"가격: {price_change:.2f}% 하락, RSI: +{rsi_change:.1f} 상승"
+                    )
+                    break
+    return divergence_signals
+
+
+def test_matches_previous_loop_output():
+    kinds = {}
+    cases = 0
+    for seed in range(150):
+        for lookback_periods, rsi_period, n in [(15, 14, 200), (20, 14, 44), (10, 7, 30), (15, 21, 40), (6, 14, 60)]:
+            analyzer = stub_analyzer(make_candles(n, seed))
+            result = asyncio.run(analyzer.detect_rsi_divergence("BTCUSDT", "5m", rsi_period, lookback_periods))
+            expected = asyncio.run(_reference(analyzer, "BTCUSDT", "5m", rsi_period, lookback_periods))
+            assert strip_times(result) == expected, (seed, lookback_periods)
+            for message in expected:
+                kind = message.split(" Divergence")[0][2:]
+                kinds[kind] = kinds.get(kind, 0) + 1
+            cases += 1
+    # 네 종류 신호가 모두 검증되었는지 확인
+    assert set(kinds) == {"Regular Bullish", "Regular Bearish", "Hidden Bullish", "Hidden Bearish"}, kinds
+    print(f"✅ {cases}개 경우에서 기존 구현과 출력 동일: {kinds}")
+
+
+def test_short_data_returns_empty():
+    analyzer = stub_analyzer(make_candles(20, 1))
+    assert asyncio.run(analyzer.detect_rsi_divergence("BTCUSDT", "5m", 14, 15)) == []
+    print("✅ 데이터 부족 시 빈 결과")
+
+
+if __name__ == "__main__":
+    print("🧪 lookback RSI 다이버전스 테스트")
+    print("=" * 50)
+    test_matches_previous_loop_output()
+    test_short_data_returns_empty()
+    print("\n🎉 모든 테스트 통과!")
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+증분 Wilder RSI 엔진 테스트 (ta 라이브러리 결과와 비교)
+"""
+import sys
+import os
+# 상위 디렉터리(프로젝트 루트)를 Python path에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import numpy as np
+import pandas as pd
+from ta.momentum import RSIIndicator
+
+from candles import CandleArrays
+from indicators import RSIEngine, WilderRSI, rsi_series
+
+STEP = 300
+PERIODS = [7, 14, 21]
+
+
+def _closes(n: int, seed: int = 7) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    close = np.round(100 + np.cumsum(rng.normal(0, 1, n)), 2)
+    close[n // 3:n // 3 + 12] = close[n // 3]   # 횡보 구간 (상승/하락폭 0)
+    return close
+
+
+def _candles(close: np.ndarray, first_open: int = 1_700_000_100 // STEP * STEP) -> CandleArrays:
+    n = len(close)
+    values = np.vstack([close, close + 1, close - 1, close, np.ones(n)])
+    return CandleArrays(first_open + np.arange(n, dtype=np.int64) * STEP, values)
+
+
+def _ta(close: np.ndarray, period: int) -> np.ndarray:
+    return RSIIndicator(pd.Series(close), window=period).rsi().to_numpy()
+
+
+def test_batch_matches_ta_exactly():
+    for seed in range(20):
+        close = _closes(400, seed)
+        for period in (2, 7, 14, 21, 30):
+            assert np.array_equal(rsi_series(close, period), _ta(close, period), equal_nan=True)
+    print("✅ rsi_series와 ta RSI 비트 단위 일치")
+
+
+def test_incremental_update_and_peek():
+    close = _closes(200)
+    expected = rsi_series(close, 14)
+    state = WilderRSI(14)
+    for i, value in enumerate(close):
+        peeked = state.peek(value)
+        updated = state.update(value)
+        assert np.array_equal([peeked], [updated], equal_nan=True)
+        assert np.array_equal([updated], [expected[i]], equal_nan=True)
+    print("✅ WilderRSI 증분 갱신/peek가 배치 결과와 일치")
+
+
+def test_engine_commits_only_new_closed_candles():
+    close = _closes(300)
+    candles = _candles(close)
+    window = max(PERIODS) + 50
+    engine = RSIEngine()
+
+    seed_end = 100
+    for end in range(seed_end, 300, 3):
+        # 마지막 캔들이 진행 중인 시점에 최근 window개만 받은 상황
+        view = candles[end - window:end]
+        now = int(view.timestamp[-1]) + STEP // 2
+        latest = engine.latest("BTCUSDT", "5m", view, PERIODS, now=now)
+
+        for period in PERIODS:
+            if end == seed_end:
+                # 첫 값은 같은 캔들에 대한 ta 계산과 같음
+                reference = _ta(close[end - window:end], period)[-1]
+            else:
+                # 이후에는 seed 시점부터 이어진 전체 이력 기준 값과 같음
+                reference = rsi_series(close[seed_end - window:end], period)[-1]
+            assert latest[period] == reference, (end, period)
+
+        # 진행 중인 캔들은 반영하지 않고, 마감 캔들은 한 번씩만 반영
+        state = engine._series[("BTCUSDT", "5m")].states[14]
+        assert state.count == end - 1 - (seed_end - window)
+    print("✅ RSIEngine은 새로 마감된 캔들만 반영하고 전체 이력 계산과 일치")
+
+
+def test_engine_reseeds_after_gap():
+    close = _closes(400)
+    candles = _candles(close)
+    engine = RSIEngine()
+    first = candles[0:80]
+    engine.latest("BTCUSDT", "5m", first, PERIODS, now=int(first.timestamp[-1]) + 10)
+
+    # 한참 뒤 구간만 받으면 이어갈 수 없으므로 받은 캔들로 다시 시작
+    later = candles[300:380]
+    latest = engine.latest("BTCUSDT", "5m", later, PERIODS, now=int(later.timestamp[-1]) + 10)
+    for period in PERIODS:
+        assert latest[period] == _ta(close[300:380], period)[-1]
+    print("✅ 캔들 공백 후 재시작 값이 ta와 일치")
+
+
+if __name__ == "__main__":
+    print("🧪 증분 Wilder RSI 엔진 테스트")
+    print("=" * 50)
+    test_batch_matches_ta_exactly()
+    test_incremental_update_and_peek()
+    test_engine_commits_only_new_closed_candles()
+    test_engine_reseeds_after_gap()
+    print("\n🎉 모든 테스트 통과!")
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+(종목 × 캔들) 벡터화 RSI 커널과 전 종목 일괄 RSI 분석 테스트
+"""
+import sys
+import os
+# 상위 디렉터리(프로젝트 루트)를 Python path에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import asyncio
+import time
+
+import numpy as np
+import pandas as pd
+from ta.momentum import RSIIndicator
+
+from candles import CandleArrays
+from indicators import RSIEngine, pad_closes, rsi_matrix, rsi_series
+from technical_analysis import TechnicalAnalyzer
+
+STEP = 300
+PERIODS = [7, 14, 21]
+
+
+def _closes(n: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    close = np.round(100 + np.cumsum(rng.normal(0, 1, n)), 2)
+    close[n // 3:n // 3 + 12] = close[n // 3]   # 횡보 구간 (상승/하락폭 0)
+    return close
+
+
+def _candles(close: np.ndarray) -> CandleArrays:
+    n = len(close)
+    now = int(time.time()) // STEP * STEP
+    values = np.vstack([close, close + 1, close - 1, close, np.ones(n)])
+    return CandleArrays(now - (n - 1) * STEP + np.arange(n, dtype=np.int64) * STEP, values)
+
+
+def test_matrix_matches_series_and_ta():
+    # 길이가 다른 종목은 앞을 NaN으로 채워 한 행렬로 계산
+    series = [_closes(n, seed) for seed, n in enumerate([300, 120, 300, 45, 8])]
+    matrix = pad_closes([_candles(c) for c in series])
+    result = rsi_matrix(matrix, PERIODS + [2])
+    assert result.shape == (4, 5, 300)
+
+    for s, close in enumerate(series):
+        for p, period in enumerate(PERIODS + [2]):
+            row = result[p, s, 300 - len(close):]
+            assert np.array_equal(row, rsi_series(close, period), equal_nan=True), (s, period)
+            expected = RSIIndicator(pd.Series(close), window=period).rsi().to_numpy()
+            assert np.array_equal(row, expected, equal_nan=True), (s, period)
+            assert np.isnan(result[p, s, :300 - len(close)]).all()
+    print("✅ rsi_matrix가 종목·기간별 rsi_series/ta 결과와 비트 단위 일치")
+
+
+def test_latest_many_matches_single_symbol_engine():
+    candles_list = [_candles(_closes(71, seed)) for seed in range(30)]
+    symbols = [f"SYM{i}USDT" for i in range(30)]
+
+    batch = RSIEngine().latest_many(symbols, "5m", candles_list, PERIODS)
+    for symbol, candles, values in zip(symbols, candles_list, batch):
+        single = RSIEngine().latest(symbol, "5m", candles, PERIODS)
+        assert values == single
+    print("✅ RSIEngine.latest_many가 종목별 latest와 같은 값")
+
+
+def test_batch_alerts_match_per_symbol_analysis():
+    candles_by_key = {}
+    symbols = [f"SYM{i}USDT" for i in range(40)]
+    for i, symbol in enumerate(symbols):
+        for timeframe in ("5m", "15m"):
+            candles_by_key[(symbol, timeframe)] = _candles(_closes(71, i * 2 + len(timeframe)))
+    # 데이터가 부족한 종목은 건너뜀
+    candles_by_key[("SYM0USDT", "15m")] = candles_by_key[("SYM0USDT", "15m")].tail(20)
+
+    def analyzer():
+        instance = TechnicalAnalyzer(market_data=None, market_type='futures')
+
+        async def get_candles(symbol, interval, limit=200):
+            return candles_by_key[(symbol, interval)]
+        instance.get_candles = get_candles
+        return instance
+
+    async def run():
+        batch = await analyzer().analyze_rsi_conditions_batch(symbols, ["5m", "15m"], PERIODS, 40, 60)
+        single = analyzer()
+        per_symbol = {}
+        for symbol in symbols:
+            per_symbol[symbol] = await single.analyze_rsi_conditions(symbol, ["5m", "15m"], PERIODS, 40, 60)
+        return batch, per_symbol
+
+    batch, per_symbol = asyncio.run(run())
+    assert batch == per_symbol
+    assert any(batch.values())
+    print(f"✅ 일괄 RSI 분석 알림이 종목별 분석과 동일 ({sum(map(len, batch.values()))}개)")
+
+
+def test_universe_scan_is_fast():
+    # 선물 300종목 × 71캔들 × 3기간
+    candles_list = [_candles(_closes(71, seed)) for seed in range(300)]
+    symbols = [f"SYM{i}USDT" for i in range(300)]
+    engine = RSIEngine()
+
+    started = time.perf_counter()
+    engine.latest_many(symbols, "5m", candles_list, PERIODS)
+    seed_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    engine.latest_many(symbols, "5m", candles_list, PERIODS)
+    steady_elapsed = time.perf_counter() - started
+
+    assert seed_elapsed < 0.5 and steady_elapsed < 0.5
+    print(f"✅ 300종목 RSI: 첫 계산 {seed_elapsed * 1000:.1f}ms, 이후 {steady_elapsed * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    print("🧪 벡터화 RSI 커널 테스트")
+    print("=" * 50)
+    test_matrix_matches_series_and_ta()
+    test_latest_many_matches_single_symbol_engine()
+    test_batch_alerts_match_per_symbol_analysis()
+    test_universe_scan_is_fast()
+    print("\n🎉 모든 테스트 통과!")
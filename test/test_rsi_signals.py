@@ -41,7 +41,7 @@ async def test_with_sensitive_rsi():
         
         try:
             # RSI 조건 확인 (테스트용 민감한 조건)
-            rsi_alerts = monitor.technical_analyzer.analyze_rsi_conditions(
+            rsi_alerts = await monitor.technical_analyzer.analyze_rsi_conditions(
                 symbol, 
                 timeframes=["5m", "15m"], 
                 periods=[7, 14, 21], 
@@ -90,7 +90,7 @@ async def find_extreme_rsi():
         
         try:
             # RSI 조건 확인 (실제 조건)
-            rsi_alerts = monitor.technical_analyzer.analyze_rsi_conditions(
+            rsi_alerts = await monitor.technical_analyzer.analyze_rsi_conditions(
                 symbol, 
                 timeframes=["5m", "15m"], 
                 periods=[7, 14, 21], 
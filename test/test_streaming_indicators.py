@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+증분 지표(MACD/EMA 교차/볼린저/ATR/VWAP) 테스트 (ta 라이브러리 결과와 비교)
+"""
+import sys
+import os
+# 상위 디렉터리(프로젝트 루트)를 Python path에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import asyncio
+import time
+
+import numpy as np
+import pandas as pd
+from ta.trend import MACD, EMAIndicator
+from ta.volatility import AverageTrueRange, BollingerBands
+from ta.volume import VolumeWeightedAveragePrice
+
+from candles import CandleArrays
+from streaming_indicators import (
+    EMACross, IndicatorEngine, StreamingATR, StreamingBollinger, StreamingMACD, StreamingVWAP
+)
+from technical_analysis import TechnicalAnalyzer
+
+STEP = 300
+SPECS = [('macd', (12, 26, 9)), ('ema_cross', (9, 21)), ('bollinger', (20, 2.0)), ('atr', (14,)), ('vwap', (14,))]
+
+
+def _candles(n: int, seed: int = 3, first_open: int = 1_700_000_100 // STEP * STEP) -> CandleArrays:
+    rng = np.random.default_rng(seed)
+    close = np.round(60000 + np.cumsum(rng.normal(0, 50, n)), 1)
+    high = close + rng.uniform(0, 40, n)
+    low = close - rng.uniform(0, 40, n)
+    volume = rng.uniform(0, 10, n)
+    return CandleArrays(first_open + np.arange(n, dtype=np.int64) * STEP,
+                        np.vstack([close, high, low, close, volume]))
+
+
+def _replay(indicator, candles: CandleArrays):
+    """캔들마다 peek 후 update하며 두 값이 같은지 확인하고 update 결과 목록을 반환합니다."""
+    results = []
+    for candle in candles.values.T.tolist():
+        peeked = indicator.peek(candle)
+        updated = indicator.update(candle)
+        assert str(peeked) == str(updated), (peeked, updated)
+        results.append(updated)
+    return results
+
+
+def _column(results, key):
+    return np.array([r[key] for r in results])
+
+
+def test_matches_ta():
+    candles = _candles(600)
+    close, high, low, volume = (pd.Series(candles.close), pd.Series(candles.high),
+                                pd.Series(candles.low), pd.Series(candles.volume))
+
+    macd = _replay(StreamingMACD(12, 26, 9), candles)
+    reference = MACD(close, 26, 12, 9)
+    assert np.array_equal(_column(macd, 'macd'), reference.macd(), equal_nan=True)
+    assert np.array_equal(_column(macd, 'signal'), reference.macd_signal(), equal_nan=True)
+    assert np.array_equal(_column(macd, 'histogram'), reference.macd_diff(), equal_nan=True)
+
+    cross = _replay(EMACross(9, 21), candles)
+    assert np.array_equal(_column(cross, 'fast'), EMAIndicator(close, 9).ema_indicator(), equal_nan=True)
+    assert np.array_equal(_column(cross, 'slow'), EMAIndicator(close, 21).ema_indicator(), equal_nan=True)
+
+    bands = _replay(StreamingBollinger(20, 2.0), candles)
+    reference = BollingerBands(close, 20, 2)
+    for key, expected in (('middle', reference.bollinger_mavg()), ('upper', reference.bollinger_hband()),
+                          ('lower', reference.bollinger_lband())):
+        assert np.allclose(_column(bands, key), expected, rtol=1e-12, equal_nan=True), key
+
+    atr = _column(_replay(StreamingATR(14), candles), 'atr')
+    reference = AverageTrueRange(high, low, close, 14).average_true_range().to_numpy()
+    assert np.isnan(atr[:13]).all()
+    assert np.allclose(atr[13:], reference[13:], rtol=1e-12)
+
+    vwap = np.array(_replay(StreamingVWAP(14), candles))
+    reference = VolumeWeightedAveragePrice(high, low, close, volume, 14).volume_weighted_average_price()
+    assert np.allclose(vwap, reference, rtol=1e-12, equal_nan=True)
+    print("✅ MACD/EMA 교차는 ta와 비트 단위 일치, 볼린저/ATR/VWAP는 상대오차 1e-12 이내")
+
+
+def test_cross_direction():
+    # 하락 후 상승하면 빠른 EMA가 느린 EMA를 위로 교차
+    close = np.concatenate([np.linspace(110, 100, 40), np.linspace(100, 120, 40)])
+    values = np.vstack([close, close, close, close, np.ones(len(close))])
+    candles = CandleArrays(np.arange(len(close), dtype=np.int64) * STEP, values)
+    crosses = [r['cross'] for r in _replay(EMACross(5, 15), candles)]
+    assert crosses.count(1) == 1 and crosses.count(-1) == 0
+    macd_crosses = [r['cross'] for r in _replay(StreamingMACD(5, 15, 4), candles)]
+    assert macd_crosses.count(1) == 1
+    print("✅ 상승 전환 시 EMA/MACD 골든크로스 한 번")
+
+
+def test_engine_commits_only_new_closed_candles():
+    candles = _candles(400)
+    window = 120
+    engine = IndicatorEngine()
+    seed_end = 150
+    for end in range(seed_end, 400, 7):
+        # 마지막 캔들이 진행 중인 시점에 최근 window개만 받은 상황
+        view = candles[end - window:end]
+        now = int(view.timestamp[-1]) + STEP // 2
+        latest = engine.latest("BTCUSDT", "5m", view, SPECS, now=now)
+
+        # seed 시점부터 이어진 전체 이력을 처음부터 반영한 값과 같음
+        history = candles[seed_end - window:end]
+        for name, params in SPECS:
+            indicator = {'macd': StreamingMACD, 'ema_cross': EMACross, 'bollinger': StreamingBollinger,
+                         'atr': StreamingATR, 'vwap': StreamingVWAP}[name](*params)
+            for candle in history.values.T.tolist():
+                expected = indicator.update(candle)
+            assert str(latest[(name, params)]) == str(expected), (end, name)
+
+        series = engine._series[("BTCUSDT", "5m")]
+        assert series.last_timestamp == int(view.timestamp[-2])
+        assert series.states[('atr', (14,))].count == end - 1 - (seed_end - window)
+    print("✅ IndicatorEngine은 새로 마감된 캔들만 반영하고 전체 이력 계산과 일치")
+
+
+def test_analyzer_batch_alerts_and_throughput():
+    analyzer = TechnicalAnalyzer(market_data=None, market_type='futures')
+    conditions = {
+        'macd': {'fast': 12, 'slow': 26, 'signal': 9},
+        'ema_cross': {'fast': 9, 'slow': 21},
+        'bollinger': {'period': 20, 'deviations': 2.0},
+        'atr': {'period': 14, 'expansion': 1.5},
+        'vwap': {'period': 14, 'deviation_percent': 0.05},
+    }
+    window = analyzer.indicator_window(analyzer.indicator_specs(conditions))
+    symbols = [f"SYM{i}USDT" for i in range(300)]
+    last_open = int(time.time()) // STEP * STEP
+    history = {symbol: _candles(window + 50, i, last_open - (window + 49) * STEP)
+               for i, symbol in enumerate(symbols)}
+    offset = {'end': window}
+
+    async def get_candles(symbol, interval, limit=200):
+        end = offset['end']
+        candles = history[symbol][end - limit:end]
+        # 매 주기 마지막 캔들이 진행 중이 되도록 시간을 옮김
+        shift = last_open - int(history[symbol].timestamp[end - 1])
+        return CandleArrays(candles.timestamp + shift, candles.values)
+    analyzer.get_candles = get_candles
+
+    alerts = asyncio.run(analyzer.analyze_indicator_conditions_batch(symbols, ["5m"], conditions))
+    first = sum(map(len, alerts.values()))
+    assert first > 0
+    elapsed = []
+    for step in range(1, 6):
+        offset['end'] = window + step
+        started = time.perf_counter()
+        alerts = asyncio.run(analyzer.analyze_indicator_conditions_batch(symbols, ["5m"], conditions))
+        elapsed.append(time.perf_counter() - started)
+    kinds = {message.split(' ', 2)[2].split(':')[0] for messages in alerts.values() for message in messages}
+    print(f"✅ 300종목 × 지표 5종: 첫 주기 신호 {first}개, 이후 캔들당 {min(elapsed) * 1000:.1f}ms ({sorted(kinds)})")
+
+
+if __name__ == "__main__":
+    print("🧪 증분 지표 테스트")
+    print("=" * 50)
+    test_matches_ta()
+    test_cross_direction()
+    test_engine_commits_only_new_closed_candles()
+    test_analyzer_batch_alerts_and_throughput()
+    print("\n🎉 모든 테스트 통과!")
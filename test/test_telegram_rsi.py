@@ -47,7 +47,7 @@ async def test_telegram_rsi_alert():
             ticker = tickers[0]
             
             # 모든 조건 확인 (RSI 포함)
-            alerts = monitor.check_conditions(ticker, symbol)
+            alerts = await monitor.check_conditions(ticker, symbol)
             
             if alerts:
                 print(f"  🚨 알림 조건 충족! ({len(alerts)}개)")
@@ -108,7 +108,7 @@ async def send_test_rsi_summary():
             
             # RSI 정보 가져오기
             try:
-                rsi_summary = monitor.technical_analyzer.get_rsi_summary(
+                rsi_summary = await monitor.technical_analyzer.get_rsi_summary(
                     symbol, ['5m', '15m'], [7, 14, 21]
                 )
                 
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+티커 스냅샷 테스트 - 주기당 티커 요청이 1회인지 확인합니다. (로컬 가짜 Binance 서버 사용)
+"""
+import sys
+import os
+# 상위 디렉터리(프로젝트 루트)를 Python path에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+# 테스트 헬퍼(fake_binance) 경로
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import asyncio
+
+from crypto_monitor import CryptoMonitor
+from fake_binance import FakeBinanceServer, use_fake_market_data
+from watchlist import WATCHLIST
+
+
+async def _one_cycle():
+    # 관심종목 + 거래 대금 상위에 들지 않을 종목 다수
+    symbols = [f"LOW{i}USDT" for i in range(30)] + list(WATCHLIST.keys())
+    server = FakeBinanceServer(symbols=symbols)
+    base_url = await server.start()
+    monitor = CryptoMonitor()
+    use_fake_market_data(monitor, base_url)
+    sent = []
+
+    async def fake_send(message):
+        sent.append(message)
+        return True
+
+    monitor.send_telegram_message = fake_send
+    try:
+        await monitor.monitor_markets()
+    finally:
+        await monitor.close()
+        await server.stop()
+    return server, monitor
+
+
+def test_single_ticker_request_per_cycle():
+    server, monitor = asyncio.run(_one_cycle())
+    ticker_requests = [r for r in server.requests if r['path'].endswith('/ticker/24hr')]
+    assert len(ticker_requests) == 1
+    assert 'symbol' not in ticker_requests[0]
+    assert set(WATCHLIST) <= monitor.monitored_symbols
+    assert all(symbol in monitor.ticker_snapshot for symbol in monitor.monitored_symbols)
+    print(f"✅ {len(monitor.monitored_symbols)}개 종목을 티커 요청 1회로 처리")
+
+
+if __name__ == "__main__":
+    test_single_ticker_request_per_cycle()
+    print("\n✨ 티커 스냅샷 테스트 완료!")